@@ -0,0 +1,63 @@
+"""Benchmark parsing many pages of launches sequentially and with a growing number of processes
+
+Speedups are bounded by the number of CPUs, so run this on a machine with several of them.
+
+Run with: python benchmarks/bench_bulk.py [--launches N] [--workers 1 2 4 ...]
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime, timezone
+
+from fake_ll2 import DATA_DIR, make_launch
+
+import nextinspace
+from nextinspace import bulk
+
+PAGE_SIZE = 100
+
+
+def make_pages(num_launches):
+    """Raw pages of launches, as the API sends them"""
+    template = json.loads((DATA_DIR / "launch.json").read_text())["results"][0]
+    start = datetime(2000, 1, 1, tzinfo=timezone.utc)
+    rng = random.Random(0)
+    launches = [make_launch(template, i, start, nextinspace.BASE_URL, 20, rng) for i in range(num_launches)]
+    return [
+        json.dumps({"count": num_launches, "results": launches[i : i + PAGE_SIZE]}).encode()
+        for i in range(0, num_launches, PAGE_SIZE)
+    ]
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    default_workers = sorted({1, 2, *(2**i for i in range(cpus.bit_length()) if 2**i <= cpus)})
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--launches", type=int, default=20_000, help="Number of launches to parse")
+    parser.add_argument("--workers", type=int, nargs="+", default=default_workers, help="Numbers of processes to try")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs for each number of processes")
+    args = parser.parse_args()
+
+    pages = make_pages(args.launches)
+    expected = bulk.parse_launch_pages(pages, workers=1)
+
+    print(f"{args.launches} launches in {len(pages)} pages, {cpus} CPUs")
+    print(f"{'workers':>8} {'time':>10} {'speedup':>8}")
+    sequential = None
+    for workers in args.workers:
+        durations = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            launches = bulk.parse_launch_pages(pages, workers=workers)
+            durations.append(time.perf_counter() - start)
+        assert launches == expected
+        duration = min(durations)
+        sequential = sequential or duration
+        print(f"{workers:>8} {duration * 1e3:>8.1f}ms {sequential / duration:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark date_str_to_datetime against strptime over 100k LL2 date strings
+
+Run with: python benchmarks/bench_dates.py
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import nextinspace
+
+NUM_ROWS = 100_000
+
+
+def strptime_date_str_to_datetime(datetime_str, fmat_str):
+    """date_str_to_datetime as of v3.0.1"""
+    if datetime_str is None:
+        return datetime(datetime.min.year, 1, 1)
+    datetime_utc = datetime.strptime(datetime_str, fmat_str).replace(tzinfo=timezone.utc)
+    return datetime_utc.astimezone()
+
+
+def make_rows():
+    """Launch NETs spread over the next two years, and launcher maiden flights over the last seventy"""
+    now = datetime(2021, 1, 1)
+    rows = []
+    for _ in range(NUM_ROWS):
+        if random.random() < 0.8:
+            net = now + timedelta(seconds=random.randrange(2 * 365 * 24 * 60 * 60))
+            rows.append((net.strftime(nextinspace.LL2_DATETIME_FORMAT), nextinspace.LL2_DATETIME_FORMAT))
+        else:
+            maiden_flight = now - timedelta(days=random.randrange(70 * 365))
+            rows.append((maiden_flight.strftime(nextinspace.LL2_DATE_FORMAT), nextinspace.LL2_DATE_FORMAT))
+    return rows
+
+
+def run(parse, rows):
+    start = time.perf_counter()
+    for datetime_str, fmat_str in rows:
+        parse(datetime_str, fmat_str)
+    return time.perf_counter() - start
+
+
+def main():
+    random.seed(0)
+    rows = make_rows()
+    for datetime_str, fmat_str in rows[:1000]:
+        expected = strptime_date_str_to_datetime(datetime_str, fmat_str)
+        assert nextinspace.date_str_to_datetime(datetime_str, fmat_str) == expected
+
+    before = run(strptime_date_str_to_datetime, rows)
+    nextinspace.local_timezone.cache_clear()
+    after_cold = run(nextinspace.date_str_to_datetime, rows)
+    after_warm = run(nextinspace.date_str_to_datetime, rows)
+
+    print(f"{NUM_ROWS} rows")
+    print(f"strptime + astimezone(): {before * 1000:8.1f} ms")
+    print(f"fast path (cold cache):  {after_cold * 1000:8.1f} ms")
+    print(f"fast path (warm cache):  {after_warm * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
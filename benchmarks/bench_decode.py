@@ -0,0 +1,63 @@
+"""Benchmark decoding and parsing a page of 100 launches with each JSON decoding backend
+
+Run with: python benchmarks/bench_decode.py
+"""
+
+import json
+import random
+import time
+from datetime import datetime, timezone
+
+from fake_ll2 import DATA_DIR, make_launch
+
+import nextinspace
+from nextinspace import decoding
+
+ENDPOINT = "https://ll.thespacedevs.com/2.0.0/launch?limit=100"
+NUM_PAGES = 200
+
+
+def make_page():
+    template = json.loads((DATA_DIR / "launch.json").read_text())["results"][0]
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    rng = random.Random(0)
+    results = [make_launch(template, i, start, "https://ll.thespacedevs.com/2.0.0", 20, rng) for i in range(100)]
+    return json.dumps({"count": 100, "next": None, "previous": None, "results": results}).encode()
+
+
+def run(decode, body, parse):
+    start = time.perf_counter()
+    for _ in range(NUM_PAGES):
+        data = decode(body, ENDPOINT)
+        if parse:
+            [nextinspace.parse_launch(result) for result in data["results"]]
+    return (time.perf_counter() - start) / NUM_PAGES
+
+
+def main():
+    body = make_page()
+    backends = {}
+    for name in decoding.BACKENDS:
+        try:
+            backend = decoding.get_backend(name)
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+        backends[name] = backend.decode
+        if name == "msgspec":
+            backends["msgspec (no schema)"] = lambda body, endpoint, backend=backend: backend.decoder.decode(body)
+
+    expected = [nextinspace.parse_launch(result) for result in json.loads(body)["results"]]
+    for decode in backends.values():
+        assert [nextinspace.parse_launch(result) for result in decode(body, ENDPOINT)["results"]] == expected
+
+    print(f"Page of 100 launches, {len(body) / 1024:.0f} KiB")
+    print(f"{'backend':<20} {'decode':>10} {'decode + parse':>16}")
+    for name, decode in backends.items():
+        decode_only = run(decode, body, parse=False)
+        with_parse = run(decode, body, parse=True)
+        print(f"{name:<20} {decode_only * 1e3:>8.2f}ms {with_parse * 1e3:>14.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Measure how long it takes to import nextinspace and to run `nextinspace --version`
+
+Exits with a nonzero status if the cumulative import time of nextinspace exceeds the budget.
+
+Run with: python benchmarks/bench_import.py [budget in ms]
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+RUNS = 20
+DEFAULT_BUDGET_MS = 40.0
+
+
+def import_time_us(module):
+    """Cumulative import time of the module as reported by `python -X importtime`"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"], capture_output=True, text=True, check=True
+    ).stderr
+    for line in stderr.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace(":", "|", 1).split("|"))
+        if name == module:
+            return int(cumulative)
+    raise RuntimeError(f"{module} was not imported")
+
+
+def wall_time_ms(args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1e3
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    import_ms = statistics.median(import_time_us("nextinspace.cli.console") for _ in range(RUNS)) / 1e3
+    baseline_ms = statistics.median(wall_time_ms(["-c", "pass"]) for _ in range(RUNS))
+    version_ms = statistics.median(wall_time_ms(["-m", "nextinspace", "--version"]) for _ in range(RUNS))
+
+    print(f"import nextinspace.cli.console: {import_ms:6.1f}ms (budget {budget_ms:.1f}ms)")
+    print(f"python -c pass:                 {baseline_ms:6.1f}ms")
+    print(f"nextinspace --version:          {version_ms:6.1f}ms")
+
+    if import_ms > budget_ms:
+        sys.exit(f"Import time is over budget by {import_ms - budget_ms:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Measure the memory used per Event, Launch and Launcher object
+
+Run with: python benchmarks/bench_memory.py
+"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timezone
+
+import nextinspace
+
+NUM_OBJECTS = 10_000
+
+
+class DictEvent:
+    """Event as of v3.0.1, which kept its attributes in a per-instance __dict__"""
+
+    def __init__(self, name, location, date, description, type_):
+        self.name = name
+        self.location = location
+        self.date = date
+        self.description = description
+        self.type_ = type_
+
+
+class DictLaunch(DictEvent):
+    def __init__(self, name, location, date, description, type_, launcher):
+        super().__init__(name, location, date, description, type_)
+        self.launcher = launcher
+
+
+class DictLauncher:
+    def __init__(self, *args):
+        (
+            self.name,
+            self.payload_leo,
+            self.payload_gto,
+            self.liftoff_thrust,
+            self.liftoff_mass,
+            self.max_stages,
+            self.height,
+            self.successful_launches,
+            self.consecutive_successful_launches,
+            self.failed_launches,
+            self.maiden_flight_date,
+        ) = args
+
+
+def bytes_per_object(factory):
+    """Measure the memory allocated per object, excluding the attribute values that are shared between objects"""
+    gc.collect()
+    tracemalloc.start()
+    objects = [factory() for _ in range(NUM_OBJECTS)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The list holding the objects is not part of their size
+    size -= objects.__sizeof__()
+    return size / NUM_OBJECTS
+
+
+def main():
+    date = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    event_args = ("Name", "Location", date, "Description", "Type")
+    launcher_args = ("Name", 1.0, 1.0, 1.0, 1.0, 2, 1.0, 1, 1, 0, date)
+
+    rows = [
+        ("Event", lambda: DictEvent(*event_args), lambda: nextinspace.Event(*event_args)),
+        ("Launch", lambda: DictLaunch(*event_args, None), lambda: nextinspace.Launch(*event_args, None)),
+        ("Launcher", lambda: DictLauncher(*launcher_args), lambda: nextinspace.Launcher(*launcher_args)),
+    ]
+
+    print(f"{'class':>10} {'__dict__':>10} {'__slots__':>10}")
+    for name, before, after in rows:
+        print(f"{name:>10} {bytes_per_object(before):>8.0f} B {bytes_per_object(after):>8.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark merge_sorted_iterables against the original two-way merge
+
+Run with: python benchmarks/bench_merge.py
+"""
+
+import random
+import timeit
+from datetime import datetime, timedelta
+
+import nextinspace
+
+
+class DateHolder:
+    __slots__ = ("date",)
+
+    def __init__(self, date):
+        self.date = date
+
+
+def two_way_merge(seq_1, seq_2, target_length_merged_list):
+    """merge_sorted_sequences as of v3.0.1"""
+    l_seq_1 = len(seq_1)
+    l_seq_2 = len(seq_2)
+    merged_list_length = min(target_length_merged_list, l_seq_1 + l_seq_2)
+
+    merged_list = [None] * merged_list_length
+    i = 0
+    j = 0
+    k = 0
+    while i < l_seq_1 and j < l_seq_2:
+        if seq_1[i].date < seq_2[j].date:
+            merged_list[k] = seq_1[i]
+            k += 1
+            if k == merged_list_length:
+                return merged_list
+            i += 1
+        else:
+            merged_list[k] = seq_2[j]
+            k += 1
+            if k == merged_list_length:
+                return merged_list
+            j += 1
+    while i < l_seq_1:
+        merged_list[k] = seq_1[i]
+        k += 1
+        if k == merged_list_length:
+            return merged_list
+        i += 1
+    while j < l_seq_2:
+        merged_list[k] = seq_2[j]
+        k += 1
+        if k == merged_list_length:
+            return merged_list
+        j += 1
+    return merged_list
+
+
+def sorted_holders(size):
+    start = datetime(2021, 1, 1)
+    offsets = sorted(random.randrange(365 * 24 * 60) for _ in range(size))
+    return [DateHolder(start + timedelta(minutes=offset)) for offset in offsets]
+
+
+def main():
+    random.seed(0)
+    print(f"{'items':>8} {'two-way':>12} {'k-way':>12} {'k-way (first 10)':>18}")
+    for size in (10, 1_000, 100_000):
+        seq_1 = sorted_holders(size)
+        seq_2 = sorted_holders(size)
+        number = max(1, 100_000 // size)
+
+        assert two_way_merge(seq_1, seq_2, size) == nextinspace.merge_sorted_sequences(seq_1, seq_2, size)
+
+        two_way = timeit.timeit(lambda: two_way_merge(seq_1, seq_2, size), number=number) / number
+        k_way = timeit.timeit(lambda: nextinspace.merge_sorted_sequences(seq_1, seq_2, size), number=number) / number
+        k_way_head = (
+            timeit.timeit(
+                lambda: list(nextinspace.merge_sorted_iterables(iter(seq_1), iter(seq_2), num_items=10)),
+                number=number,
+            )
+            / number
+        )
+        print(f"{size:>8} {two_way * 1e6:>10.1f}us {k_way * 1e6:>10.1f}us {k_way_head * 1e6:>16.1f}us")
+
+
+if __name__ == "__main__":
+    main()
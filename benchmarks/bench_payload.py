@@ -0,0 +1,39 @@
+"""Measure the bytes transferred per launch, in full and list mode, with and without compression
+
+The generated launches are much alike, so they compress far better than real ones do.
+
+Run with: python benchmarks/bench_payload.py
+"""
+
+import time
+
+from fake_ll2 import FakeLL2
+
+import nextinspace
+
+NUM_LAUNCHES = 500
+
+
+def measure(server, brief, encoding):
+    session = nextinspace.new_session()
+    session.headers["Accept-Encoding"] = encoding
+    bytes_before = server.bytes_sent
+    start = time.perf_counter()
+    launches = list(nextinspace.iter_launches(NUM_LAUNCHES, session=session, brief=brief))
+    duration = time.perf_counter() - start
+    return (server.bytes_sent - bytes_before) / len(launches), duration
+
+
+def main():
+    with FakeLL2(num_launches=NUM_LAUNCHES) as server:
+        print(f"{NUM_LAUNCHES} launches")
+        print(f"{'mode':<8} {'encoding':<10} {'bytes per launch':>18} {'time':>10}")
+        for brief in (False, True):
+            for encoding in ("identity", "gzip"):
+                bytes_per_launch, duration = measure(server, brief, encoding)
+                mode = "list" if brief else "normal"
+                print(f"{mode:<8} {encoding:<10} {bytes_per_launch:>18.0f} {duration * 1e3:>8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark terminal rendering of 10k items
+
+Run with: python benchmarks/bench_render.py
+"""
+
+import io
+import itertools
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import nextinspace
+from nextinspace.cli import viewer
+
+NUM_ITEMS = 10_000
+
+
+class CountingWriter(io.StringIO):
+    """Text stream that counts how many times it is written to.
+    colorama strips colors from streams that are not terminals, which splits every write at each color code."""
+
+    def __init__(self, tty):
+        super().__init__()
+        self.tty = tty
+        self.num_writes = 0
+
+    def isatty(self):
+        return self.tty
+
+    def write(self, s):
+        self.num_writes += 1
+        return super().write(s)
+
+
+def make_items():
+    launcher = nextinspace.Launcher(
+        "Falcon 9 Block 5", 22800, 8300, 7607, 549, 2, 70.0, 47, 47, 0, datetime(2018, 5, 11, tzinfo=timezone.utc)
+    )
+    start = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    items = []
+    for i in range(NUM_ITEMS):
+        date = start + timedelta(hours=i)
+        if i % 4:
+            items.append(
+                nextinspace.Launch(
+                    f"Falcon 9 Block 5 | Starlink Group {i}",
+                    "Space Launch Complex 40, Cape Canaveral, FL, USA",
+                    date,
+                    "A batch of 60 satellites for the Starlink mega-constellation - SpaceX's project for space-based "
+                    "Internet communication system.",
+                    "Communications",
+                    launcher,
+                )
+            )
+        else:
+            items.append(nextinspace.Event(f"Static Fire {i}", "Boca Chica, Texas", date, "Static fire test.", "Test"))
+    return items
+
+
+def main():
+    items = make_items()
+    for tty, verbosity in itertools.product((True, False), viewer.Verbosity):
+        out = CountingWriter(tty)
+        real_stdout = sys.stdout
+        sys.stdout = out
+        try:
+            start = time.perf_counter()
+            viewer.display(items, verbosity)
+            elapsed = time.perf_counter() - start
+        finally:
+            sys.stdout = real_stdout
+        output = "terminal" if tty else "piped"
+        print(
+            f"{output:>8} {verbosity.name:>8}: {elapsed * 1000:7.1f} ms, {out.num_writes} writes, {len(out.getvalue())} chars"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark the main code paths against a local stand-in for the LL2 API
+
+Results can be saved and compared to catch regressions:
+
+    python benchmarks/bench_suite.py --save baseline.json
+    python benchmarks/bench_suite.py --compare baseline.json --tolerance 0.2
+
+Comparing exits with a nonzero status if any benchmark got slower than the tolerance allows.
+
+Run with: python benchmarks/bench_suite.py [--help]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import time
+
+from fake_ll2 import FakeLL2
+
+import nextinspace
+from nextinspace.cli import viewer
+
+
+def benchmarks(items):
+    """Benchmarks by name. Each is a function that runs the code path once."""
+    launches = [item for item in items if isinstance(item, nextinspace.Launch)]
+    events = [item for item in items if not isinstance(item, nextinspace.Launch)]
+
+    def quiet(function, *args):
+        with contextlib.redirect_stdout(io.StringIO()):
+            function(*args)
+
+    return {
+        "nextinspace(10)": lambda: nextinspace.nextinspace(10),
+        "nextinspace(100, include_launcher=True)": lambda: nextinspace.nextinspace(100, include_launcher=True),
+        "next_launch(10, include_launcher=True)": lambda: nextinspace.next_launch(10, include_launcher=True),
+        "next_event(10)": lambda: nextinspace.next_event(10),
+        "list(iter_upcoming(500))": lambda: list(nextinspace.iter_upcoming(500)),
+        "merge_sorted_sequences": lambda: nextinspace.merge_sorted_sequences(events, launches, len(items)),
+        "show_json": lambda: quiet(viewer.show_json, items),
+        "show_json(compact=True)": lambda: quiet(viewer.show_json, items, True),
+        "show_ndjson": lambda: quiet(viewer.show_ndjson, items),
+        "display(verbose)": lambda: quiet(viewer.display, items, viewer.Verbosity.verbose),
+    }
+
+
+def run(args):
+    results = {}
+    with FakeLL2(args.launches, args.events, args.launchers, args.latency, args.error_rate) as server:
+        # Items to output and merge, fetched once from the server
+        items = list(nextinspace.iter_upcoming(args.launches + args.events, include_launcher=True))
+        for name, benchmark in benchmarks(items).items():
+            if args.filter and args.filter not in name:
+                continue
+            benchmark()  # Warm up connections and caches
+            requests_before = server.num_requests
+            durations = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                benchmark()
+                durations.append(time.perf_counter() - start)
+            results[name] = {
+                "median_ms": statistics.median(durations) * 1e3,
+                "min_ms": min(durations) * 1e3,
+                "requests": (server.num_requests - requests_before) / args.repeat,
+            }
+            print(
+                f"{name:<42} {results[name]['median_ms']:>10.2f}ms median {results[name]['min_ms']:>10.2f}ms min "
+                f"{results[name]['requests']:>6.1f} requests"
+            )
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print how the results compare to the baseline and return whether there was any regression"""
+    regressed = False
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        ratio = result["median_ms"] / baseline[name]["median_ms"]
+        status = "REGRESSION" if ratio > 1 + tolerance else "ok"
+        regressed = regressed or status != "ok"
+        print(f"{name:<42} {ratio:>6.2f}x baseline  {status}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--launches", type=int, default=1000, help="Number of upcoming launches on the server")
+    parser.add_argument("--events", type=int, default=200, help="Number of upcoming events on the server")
+    parser.add_argument("--launchers", type=int, default=20, help="Number of distinct launchers on the server")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the server waits before each response")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Probability of the server answering 503")
+    parser.add_argument("--repeat", type=int, default=10, help="Number of timed runs of each benchmark")
+    parser.add_argument("--filter", help="Only run the benchmarks whose name contains this")
+    parser.add_argument("--save", metavar="FILE", help="Save the results as JSON")
+    parser.add_argument("--compare", metavar="FILE", help="Compare the results with ones saved with --save")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed slowdown when comparing (0.2 is 20%%)")
+    args = parser.parse_args()
+
+    results = run(args)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=4)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        if compare(results, baseline, args.tolerance):
+            sys.exit("Some benchmarks regressed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""Local stand-in for the LL2 API, for benchmarking without network access
+
+The server generates upcoming launches, events and launcher configurations modeled on the responses in `tests/data`,
+and serves them with the same pagination, filters, list mode (`mode=list`) and gzip compression as the API. Latency
+and errors can be injected.
+
+Use it as a context manager, which points `nextinspace.BASE_URL` at the server:
+
+    with FakeLL2(num_launches=500, latency=0.05) as server:
+        nextinspace.nextinspace(10)
+        print(server.num_requests)
+"""
+
+import copy
+import gzip
+import json
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import nextinspace
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "tests" / "data"
+DEFAULT_LIMIT = 10  # Same as the API
+MAX_LIMIT = 100  # Same as the API
+
+
+class FakeLL2:
+    """Fake LL2 API server
+
+    :param num_launches: Number of upcoming launches
+    :param num_events: Number of upcoming events
+    :param num_launchers: Number of distinct launchers used by the launches
+    :param latency: Seconds to wait before answering each request
+    :param error_rate: Probability of answering a request with a 503 error
+    :param seed: Seed for generating the data and the errors
+    """
+
+    def __init__(self, num_launches=1000, num_events=200, num_launchers=20, latency=0.0, error_rate=0.0, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.num_requests = 0
+        self.bytes_sent = 0  # Bytes of response bodies, after compression
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+        templates = {
+            name: json.loads((DATA_DIR / f"{name}.json").read_text()) for name in ("launch", "event", "launcher")
+        }
+        start = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+        self.launchers = {
+            str(i): make_launcher(templates["launcher"], i, self.url, self._random) for i in range(num_launchers)
+        }
+        self.launches = [
+            make_launch(templates["launch"]["results"][0], i, start, self.url, num_launchers, self._random)
+            for i in range(num_launches)
+        ]
+        self.events = [make_event(templates["event"]["results"][0], i, start, self._random) for i in range(num_events)]
+        self._thread = None
+        self._previous_base_url = None
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        self._previous_base_url = nextinspace.BASE_URL
+        nextinspace.BASE_URL = self.url
+        return self
+
+    def __exit__(self, *exc_info):
+        nextinspace.BASE_URL = self._previous_base_url
+        self._server.shutdown()
+        self._server.server_close()
+
+    def respond(self, path, query):
+        """Get the status and JSON body of the response to a request"""
+        with self._lock:
+            self.num_requests += 1
+            failed = self._random.random() < self.error_rate
+        if self.latency:
+            time.sleep(self.latency)
+        if failed:
+            return 503, {"detail": "Service unavailable"}
+
+        if path == "/launch":
+            launches = [launch for launch in self.launches if matches_filters(launch, query)]
+            if query.get("mode") == "list":
+                launches = [list_launch(launch) for launch in launches]
+            return 200, self.page(path, query, launches)
+        if path == "/event/upcoming":
+            return 200, self.page(path, query, self.events)
+        if path == "/event":
+            events = [event for event in self.events if in_window(event["date"], query, "date")]
+            return 200, self.page(path, query, events)
+        if path.rstrip("/") == "/config/launcher":
+            # Detailed mode, with the same fields as the launcher endpoint
+            launchers = list(self.launchers.values())
+            if "id__in" in query:
+                ids = query["id__in"].split(",")
+                launchers = [launcher for launcher in launchers if str(launcher["id"]) in ids]
+            return 200, self.page(path, query, launchers)
+        if path.startswith("/config/launcher/"):
+            launcher = self.launchers.get(path.strip("/").rsplit("/", 1)[-1])
+            if launcher is not None:
+                return 200, launcher
+        return 404, {"detail": "Not found."}
+
+    def page(self, path, query, results):
+        limit = min(int(query.get("limit", DEFAULT_LIMIT)), MAX_LIMIT)
+        offset = int(query.get("offset", 0))
+        next_url = None
+        if offset + limit < len(results):
+            next_url = f"{self.url}{path}?" + urlencode({**query, "limit": limit, "offset": offset + limit})
+        return {"count": len(results), "next": next_url, "previous": None, "results": results[offset : offset + limit]}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep connections alive, like the API
+            # Send the headers and body at once, so delayed ACKs do not add latency to every response
+            wbufsize = -1
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+                status, data = server.respond(url.path, query)
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body, compresslevel=6)
+                    self.send_header("Content-Encoding", "gzip")
+                with server._lock:
+                    server.bytes_sent += len(body)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+
+def make_launch(template, i, start, url, num_launchers, rng):
+    launch = copy.deepcopy(template)
+    launcher_id = rng.randrange(num_launchers)
+    launch["id"] = f"00000000-0000-0000-0000-{i:012d}"
+    launch["url"] = f"{url}/launch/{launch['id']}/"
+    launch["name"] = f"Rocket {launcher_id} | Mission {i}"
+    launch["net"] = launch["window_start"] = launch["window_end"] = ll2_date(start + timedelta(hours=i))
+    launch["rocket"]["configuration"].update(
+        id=launcher_id, url=f"{url}/config/launcher/{launcher_id}/", name=f"Rocket {launcher_id}"
+    )
+    launch["mission"]["name"] = f"Mission {i}"
+    launch["mission"]["description"] = " ".join(["This mission will deliver a payload to orbit."] * rng.randint(1, 8))
+    launch["pad"]["name"] = f"Launch Complex {i % 7}"
+    return launch
+
+
+def matches_filters(launch, query):
+    """Whether the launch matches the filters of the API in the query"""
+    if not in_window(launch["net"], query, "net"):
+        return False
+    if "lsp__name" in query and launch["launch_service_provider"]["name"] != query["lsp__name"]:
+        return False
+    if "location__ids" in query and str(launch["pad"]["location"]["id"]) not in query["location__ids"].split(","):
+        return False
+    rocket = query.get("rocket__configuration__name")
+    return rocket is None or launch["rocket"]["configuration"]["name"] == rocket
+
+
+def in_window(date, query, field):
+    """Whether the date is within the bounds of the field in the query. Dates in the API format sort like strings."""
+    return query.get(f"{field}__gte", date) <= date <= query.get(f"{field}__lte", date)
+
+
+def list_launch(launch):
+    """Launch as in list mode, with the nested objects flattened to names"""
+    return {
+        **{key: launch[key] for key in ("id", "url", "slug", "name", "net", "window_end", "window_start", "image")},
+        "status": launch["status"]["name"],
+        "mission": launch["mission"]["name"],
+        "mission_type": launch["mission"]["type"],
+        "pad": launch["pad"]["name"],
+        "location": launch["pad"]["location"]["name"],
+        "landing": None,
+        "landing_success": None,
+        "launcher": None,
+        "orbit": None,
+        "infographic": launch["infographic"],
+    }
+
+
+def make_event(template, i, start, rng):
+    event = copy.deepcopy(template)
+    event["id"] = i
+    event["name"] = f"Event {i}"
+    event["date"] = ll2_date(start + timedelta(hours=i * 5, minutes=30))
+    event["description"] = " ".join(["Something will happen in space."] * rng.randint(1, 8))
+    return event
+
+
+def make_launcher(template, i, url, rng):
+    launcher = copy.deepcopy(template)
+    launcher["id"] = i
+    launcher["url"] = f"{url}/config/launcher/{i}/"
+    launcher["name"] = launcher["full_name"] = f"Rocket {i}"
+    launcher["successful_launches"] = rng.randint(0, 100)
+    return launcher
+
+
+def ll2_date(date):
+    return date.strftime(nextinspace.LL2_DATETIME_FORMAT)
@@ -1,15 +1,100 @@
-__version__ = "3.0.1"
-__all__ = ["nextinspace", "next_launch", "next_event"]
-
-import typing
-from datetime import MINYEAR, datetime, timezone
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from __future__ import annotations
 
-import requests
+__version__ = "3.0.1"
+__all__ = [
+    "nextinspace",
+    "next_launch",
+    "next_event",
+    "iter_upcoming",
+    "iter_launches",
+    "iter_events",
+    "items_between",
+    "launches_between",
+    "events_between",
+    "async_nextinspace",
+    "async_next_launch",
+    "async_next_event",
+    "async_get_launcher",
+    "enable_cache",
+    "disable_cache",
+    "wait_for_refreshes",
+    "enable_rate_limit",
+    "disable_rate_limit",
+    "get_throttle",
+    "enable_instrumentation",
+    "disable_instrumentation",
+    "enable_launcher_registry",
+    "disable_launcher_registry",
+    "get_launcher_registry",
+    "warm_launcher_registry",
+    "new_session",
+    "Filters",
+]
+
+import contextlib
+import functools
+import heapq
+import re
+import threading
+import time
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import MINYEAR, datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from nextinspace.registry import DEFAULT_MAX_SIZE, DEFAULT_TTL, LauncherRegistry
+
+# Modules that are slow to import are imported where they are used, so that the CLI starts quickly
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    import aiohttp
+    import requests
+
+    from nextinspace.cache import CacheEntry, ResponseCache
+    from nextinspace.instrument import Recorder
+    from nextinspace.throttle import Throttle
 
 BASE_URL = "https://ll.thespacedevs.com/2.1.0"
-
-
+MAX_LAUNCHER_WORKERS = 4
+DEFAULT_POOL_SIZE = 10
+PAGE_SIZE = 100  # Maximum number of results the API returns per request
+LL2_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+LL2_DATE_FORMAT = "%Y-%m-%d"
+TZ_BUCKET_SECONDS = 24 * 60 * 60  # Span of time the local timezone is looked up and cached for
+REQUEST_TIMEOUT = 30  # Seconds to wait for the API to respond before giving up on a request
+LAUNCHER_URL_PATTERN = re.compile(r"^(?P<endpoint>.*/config/launcher/)(?P<id>\d+)/?$")
+STALE_KEY = "_stale"  # Added to the results of expired cached responses that are used because the API failed
+
+DatedT = TypeVar("DatedT", bound="Event")
+
+_cache: Optional[ResponseCache] = None
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_throttle: Optional[Throttle] = None
+_recorder: Optional[Recorder] = None
+_launcher_registry: Optional[LauncherRegistry] = LauncherRegistry()
+_refreshes: Set[threading.Thread] = set()  # Requests that keep going in the background after missing their deadline
+_refreshes_lock = threading.Lock()
+
+
+@dataclass(repr=False, slots=True)
 class Event:
     """Generic space event.
 
@@ -19,31 +104,31 @@ class Event:
 
        When the LL2 API does not provide a date for the :class:`Event`, the `date` attribute is set to `datetime(datetime.MINYEAR, 1, 1)`.
        This is so the :class:`Event` is sorted to the back of the returned tuple.
+
+    .. note::
+
+       `id` is the LL2 id of the item, which tells apart items with the same name. It is not taken into account when
+       comparing items.
+
+    .. note::
+
+       `stale` is True when the item comes from a cached response that had expired, because the API failed or did not
+       respond in time (see :func:`enable_cache`). It is not taken into account when comparing items.
     """
 
-    def __init__(
-        self,
-        name: Optional[str],
-        location: Optional[str],
-        date: datetime,
-        description: Optional[str],
-        type_: Optional[str],
-    ):
-        self.name = name
-        self.location = location
-        self.date = date
-        self.description = description
-        self.type_ = type_
-
-    def __eq__(self, other: object) -> bool:
-        if type(self) is type(other):
-            return self.__dict__ == other.__dict__
-        return False
+    name: Optional[str]
+    location: Optional[str]
+    date: datetime
+    description: Optional[str]
+    type_: Optional[str]
+    id: Union[int, str, None] = field(default=None, compare=False, kw_only=True)
+    stale: bool = field(default=False, compare=False, kw_only=True)
 
     def __repr__(self):
-        return f"{self.__class__.__module__}.{self.__class__.__qualname__}({', '.join(repr(attr) for attr in self.__dict__.values())})"
+        return attrs_repr(self)
 
 
+@dataclass(repr=False, slots=True)
 class Launcher:
     """Holds launcher information for instances of the :class:`Launch` class
 
@@ -55,42 +140,23 @@ class Launcher:
        the `maiden_flight_date` attribute is set to `datetime(datetime.MINYEAR, 1, 1)`.
     """
 
-    def __init__(
-        self,
-        name: Optional[str],
-        payload_leo: Optional[float],
-        payload_gto: Optional[float],
-        liftoff_thrust: Optional[float],
-        liftoff_mass: Optional[float],
-        max_stages: Optional[int],
-        height: Optional[float],
-        successful_launches: Optional[int],
-        consecutive_successful_launches: Optional[int],
-        failed_launches: Optional[int],
-        maiden_flight_date: datetime,
-    ):
-
-        self.name = name
-        self.payload_leo = payload_leo
-        self.payload_gto = payload_gto
-        self.liftoff_thrust = liftoff_thrust
-        self.liftoff_mass = liftoff_mass
-        self.max_stages = max_stages
-        self.height = height
-        self.successful_launches = successful_launches
-        self.consecutive_successful_launches = consecutive_successful_launches
-        self.failed_launches = failed_launches
-        self.maiden_flight_date = maiden_flight_date
-
-    def __eq__(self, other: object) -> bool:
-        if type(self) is type(other):
-            return self.__dict__ == other.__dict__
-        return False
+    name: Optional[str]
+    payload_leo: Optional[float]
+    payload_gto: Optional[float]
+    liftoff_thrust: Optional[float]
+    liftoff_mass: Optional[float]
+    max_stages: Optional[int]
+    height: Optional[float]
+    successful_launches: Optional[int]
+    consecutive_successful_launches: Optional[int]
+    failed_launches: Optional[int]
+    maiden_flight_date: datetime
 
     def __repr__(self):
-        return f"{self.__class__.__module__}.{self.__class__.__qualname__}({', '.join(repr(attr) for attr in self.__dict__.values())})"
+        return attrs_repr(self)
 
 
+@dataclass(repr=False, slots=True)
 class Launch(Event):
     """Launch event
 
@@ -102,140 +168,362 @@ class Launch(Event):
        This is so the :class:`Launch` is sorted to the back of the returned tuple.
     """
 
-    def __init__(
-        self,
-        name: Optional[str],
-        location: Optional[str],
-        date: datetime,
-        description: Optional[str],
-        type_: Optional[str],
-        launcher: Optional[Launcher],
-    ):
-        super().__init__(name, location, date, description, type_)
-        self.launcher = launcher
+    launcher: Optional[Launcher]
+
 
+@dataclass(frozen=True)
+class Filters:
+    """Which items to get. Fields left unset do not filter.
 
-def nextinspace(num_items: int, include_launcher: bool = False) -> Tuple[Union[Launch, Event], ...]:
+    The provider, locations and rocket are sent to the API, so that only matching launches are downloaded. Events have
+    none of these, so filtering by any of them leaves out every event. The API cannot filter by type, so items are
+    checked against it as they arrive, and more pages are requested until there are enough matching items.
+
+    :param provider: Name of the launch service provider, like `"Rocket Lab Ltd"`
+    :type provider: str, optional
+    :param location_ids: LL2 IDs of the launch locations, like `(11,)` for Vandenberg SFB
+    :type location_ids: Tuple[int, ...], optional
+    :param rocket: Name of the rocket configuration, like `"Electron"`
+    :type rocket: str, optional
+    :param type_: Mission type of launches and type of events, like `"Communications"`. Compared case-insensitively.
+    :type type_: str, optional
+    """
+
+    provider: Optional[str] = None
+    location_ids: Tuple[int, ...] = ()
+    rocket: Optional[str] = None
+    type_: Optional[str] = None
+
+    def launch_params(self) -> Dict[str, str]:
+        """Get the query string parameters of the filters that the API applies"""
+        params = {}
+        if self.provider is not None:
+            params["lsp__name"] = self.provider
+        if self.location_ids:
+            params["location__ids"] = ",".join(str(location_id) for location_id in self.location_ids)
+        if self.rocket is not None:
+            params["rocket__configuration__name"] = self.rocket
+        return params
+
+    def excludes_events(self) -> bool:
+        return self.provider is not None or bool(self.location_ids) or self.rocket is not None
+
+    def matches_type(self, type_: Optional[str]) -> bool:
+        return self.type_ is None or (type_ is not None and type_.casefold() == self.type_.casefold())
+
+    def matches_launch_result(self, result: Dict) -> bool:
+        return self.matches_type(launch_result_type(result))
+
+    def matches_event_result(self, result: Dict) -> bool:
+        return self.matches_type(get_nested_dict_val(result, "type", "name"))
+
+
+def attrs_repr(obj: Any) -> str:
+    """Represent a dataclass instance as a call to its constructor with positional arguments, followed by the keyword
+    arguments that are not set to their default"""
+    args = [repr(getattr(obj, f.name)) for f in fields(obj) if not f.kw_only]
+    args += [
+        f"{f.name}={getattr(obj, f.name)!r}"
+        for f in fields(obj)
+        if f.kw_only and (f.default is MISSING or getattr(obj, f.name) != f.default)
+    ]
+    args_str = ", ".join(args)
+    return f"{obj.__class__.__module__}.{obj.__class__.__qualname__}({args_str})"
+
+
+def nextinspace(
+    num_items: int,
+    include_launcher: bool = False,
+    session: Optional[requests.Session] = None,
+    brief: bool = False,
+    filters: Optional[Filters] = None,
+) -> Tuple[Union[Launch, Event], ...]:
     """This gets the next (specified number) of items from the LL2 API.
 
     :param num_items: Number of items to get from the API
     :type num_items: int
     :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
     :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
     :return: Upcoming :class:`Launches <Launch>` and :class:`Events <Event>`. Note that the length of this tuple will be <= `num_items`.
     :rtype: Tuple
     :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
         so HTTPErrors are possible as well.
 
-    .. warning::
+    .. note::
 
        Because the LL2 API does not offer any way of getting *n* upcoming spaceflight items, this function must query the API twice,
        once for the next *n* :class:`Events <Event>`, and once for the next *n* :class:`Launches <Launch>`, and merge the queries
-       into a sorted form. **As such, this function may be slower than anticipated.** 🙁
+       into a sorted form. Both queries are sent concurrently, so this takes roughly as long as the slower of the two.
 
     .. deprecated:: 3.0.1
 
        Because the filter by time function of the LL2 API is currently broken, **upcoming means beyond and including today**.
     """
-    events = next_event(num_items)
-    launches = next_launch(num_items, include_launcher)
-    return tuple(merge_sorted_sequences(events, launches, num_items))
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        events_future = executor.submit(next_event, num_items, session, filters)
+        launches_future = executor.submit(next_launch, num_items, include_launcher, session, brief, filters)
+        events = events_future.result()
+        launches = launches_future.result()
+    with timed("merge"):
+        return tuple(merge_sorted_sequences(events, launches, num_items))
 
 
-@typing.no_type_check
 def merge_sorted_sequences(
     seq_1: Sequence[Union[Launch, Event]], seq_2: Sequence[Union[Launch, Event]], target_length_merged_list: int
 ) -> List[Union[Launch, Event]]:
     """Perform a merge of two sorted sequences. Sequences must be of Events or of Event subclasses with date attributes"""
-    l_seq_1 = len(seq_1)
-    l_seq_2 = len(seq_2)
-
-    # The lengths of two lists added is the max possible length of any combination
-    max_possible_length = l_seq_1 + l_seq_2
-
-    # The actual length should IDEALLY be as close to the target length as possible, so:
-    #
-    # If target length <= max possible length --> we can just set merged length to target length
-    #
-    # If target length > max possible length --> the actual length is set to the max possible length
-    # (which is as close to the target as is possible)
-    merged_list_length = min(target_length_merged_list, max_possible_length)
-
-    merged_list: Any = [None] * merged_list_length
-    i = 0
-    j = 0
-    k = 0
-
-    # Traverse both lists simultaneously
-    while i < l_seq_1 and j < l_seq_2:
-
-        # Check if current element of first array is smaller than current element of second array.
-        # If yes, store first array element and increment first array index. Otherwise do same with second array
-        if seq_1[i].date < seq_2[j].date:
-            merged_list[k] = seq_1[i]
-            k += 1
-            if k == merged_list_length:
-                return merged_list
-            i += 1
+    return list(merge_sorted_iterables(seq_1, seq_2, num_items=target_length_merged_list))
+
+
+def merge_sorted_iterables(*iterables: Iterable[DatedT], num_items: Optional[int] = None) -> Iterator[DatedT]:
+    """Lazily merge iterables that are each sorted by their items' `date` attribute.
+
+    Items are only taken from the iterables as they are needed, so the iterables may be streams (see :func:`iter_upcoming`).
+    When items from different iterables have the same date, the one from the later iterable comes first.
+
+    :param iterables: Iterables sorted by date
+    :type iterables: Iterable
+    :param num_items: Maximum number of items to yield, defaults to all items
+    :type num_items: int, optional
+    :return: Items of all iterables, sorted by date
+    :rtype: Iterator
+    """
+    if num_items is not None and num_items <= 0:
+        return
+
+    # Heap entries are (date, -index of iterable, item, iterator). There is never more than one entry per iterable, so
+    # ties are always broken by the index and items themselves are never compared.
+    heap = []
+    for index, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            heap.append((item.date, -index, item, iterator))
+            break
+    heapq.heapify(heap)
+
+    num_yielded = 0
+    while heap:
+        _, neg_index, item, iterator = heap[0]
+        yield item
+
+        num_yielded += 1
+        if num_yielded == num_items:
+            return
+
+        next_item = next(iterator, None)
+        if next_item is None:
+            heapq.heappop(heap)
         else:
-            merged_list[k] = seq_2[j]
-            k += 1
-            if k == merged_list_length:
-                return merged_list
-            j += 1
-
-    # Store remaining elements of first list
-    while i < l_seq_1:
-        merged_list[k] = seq_1[i]
-        k += 1
-        if k == merged_list_length:
-            return merged_list
-        i += 1
-
-    # Store remaining elements of second list
-    while j < l_seq_2:
-        merged_list[k] = seq_2[j]
-        k += 1
-        if k == merged_list_length:
-            return merged_list
-        j += 1
-
-    return merged_list
-
-
-def next_launch(num_launches: int, include_launcher: bool = False) -> Tuple[Launch, ...]:
+            heapq.heapreplace(heap, (next_item.date, neg_index, next_item, iterator))
+
+
+def next_launch(
+    num_launches: int,
+    include_launcher: bool = False,
+    session: Optional[requests.Session] = None,
+    brief: bool = False,
+    filters: Optional[Filters] = None,
+) -> Tuple[Launch, ...]:
     """Same as :func:`nextinspace` but only :class:`Launches <Launch>` requested.
 
     :param num_launches: Number of :class:`Launches <Launch>` to get from the API
     :type num_launches: int
     :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
     :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
     :return: Upcoming :class:`Launches <Launch>`. Note that the length of this tuple will be <= `num_launches`.
     :rtype: Tuple
     :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
         so HTTPErrors are possible as well.
     """
-    now_str = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ")
-    data = api_get_request(f"{BASE_URL}/launch", {"limit": num_launches, "net__gte": now_str})
+    # More launches than fit in a page, or only some types of launches, take following pages
+    if num_launches > PAGE_SIZE or (filters is not None and filters.type_ is not None):
+        return tuple(iter_launches(num_launches, include_launcher, session, brief, filters))
+    data = api_get_request(*launch_query(num_launches, brief and not include_launcher, filters), session)
+
+    results = data["results"]
+    launchers = get_launchers(get_launcher_urls(results), session) if include_launcher else {}
+    with timed("parse.launches"):
+        return tuple(parse_launch(result, launchers) for result in results)
+
+
+def launch_query(num_launches: int, brief: bool = False, filters: Optional[Filters] = None) -> Tuple[str, Dict]:
+    """Get the endpoint and query string for the next (specified number) of launches, in list mode if `brief`"""
+    # Left out of the cache key (see nextinspace.cache.MOVING_BOUNDS) so that cached responses outlive the minute
+    now_str = datetime.utcnow().strftime("%Y-%m-%dT%H:%M:00Z")
+    payload: Dict[str, Any] = {"limit": num_launches, "net__gte": now_str}
+    if filters is not None:
+        payload.update(filters.launch_params())
+    if brief:
+        # About a tenth of the size of a full launch, with everything that quiet output shows
+        payload["mode"] = "list"
+    return f"{BASE_URL}/launch", payload
+
+
+def parse_launch(result: Dict, launchers: Mapping[str, Launcher] = {}) -> Launch:
+    """Build a :class:`Launch` from a launch result of the API
+
+    :param result: Launch result of the API
+    :type result: Dict
+    :param launchers: Already fetched :class:`Launchers <Launcher>` keyed by URL, defaults to {}
+    :type launchers: Mapping[str, Launcher], optional
+    :return: Parsed :class:`Launch`, with its launcher if it is in `launchers`
+    :rtype: Launch
+    """
+    if "mission_type" in result:
+        return parse_brief_launch(result)
+
+    name = result["name"]
+
+    pad_name = get_nested_dict_val(result, "pad", "name")
+    pad_location = get_nested_dict_val(result, "pad", "location", "name")
+    location = build_location_string(pad_name, pad_location)
+
+    date = date_str_to_datetime(result["net"], LL2_DATETIME_FORMAT)
+    description = get_nested_dict_val(result, "mission", "description")
+    type_ = get_nested_dict_val(result, "mission", "type")
+
+    launcher_url = get_nested_dict_val(result, "rocket", "configuration", "url")
+    launcher = launchers.get(launcher_url)
+
+    return Launch(name, location, date, description, type_, launcher, id=result.get("id"), stale=STALE_KEY in result)
+
+
+def parse_brief_launch(result: Dict) -> Launch:
+    """Build a :class:`Launch` from a launch result of the API in list mode, which has the pad, its location and the
+    mission type as strings, and neither the mission description nor the launcher"""
+    location = build_location_string(result.get("pad"), result.get("location"))
+    date = date_str_to_datetime(result["net"], LL2_DATETIME_FORMAT)
+    return Launch(
+        result["name"],
+        location,
+        date,
+        None,
+        result["mission_type"],
+        None,
+        id=result.get("id"),
+        stale=STALE_KEY in result,
+    )
 
-    launches = []
-    for result in data["results"]:
-        name = result["name"]
 
-        pad_name = get_nested_dict_val(result, "pad", "name")
-        pad_location = get_nested_dict_val(result, "pad", "location", "name")
-        location = build_location_string(pad_name, pad_location)
+def launch_result_type(result: Dict) -> Optional[str]:
+    """Get the mission type of a launch result of the API, in list mode or not"""
+    if "mission_type" in result:
+        return result["mission_type"]
+    return get_nested_dict_val(result, "mission", "type")
 
-        date = date_str_to_datetime(result["net"], "%Y-%m-%dT%H:%M:%SZ")
-        description = get_nested_dict_val(result, "mission", "description")
-        type_ = get_nested_dict_val(result, "mission", "type")
 
-        launcher_url = get_nested_dict_val(result, "rocket", "configuration", "url")
-        launcher = get_launcher(launcher_url) if include_launcher else None
+def get_launcher_urls(results: Sequence[Dict]) -> List[str]:
+    """Get the distinct launcher URLs referenced by launch results, in order of first appearance"""
+    urls = (get_nested_dict_val(result, "rocket", "configuration", "url") for result in results)
+    return list(dict.fromkeys(url for url in urls if url is not None))
 
-        launches.append(Launch(name, location, date, description, type_, launcher))
 
-    return tuple(launches)
+def get_launchers(urls: Sequence[str], session: Optional[requests.Session] = None) -> Dict[str, Launcher]:
+    """Get the launchers at the specified URLs from the API.
+
+    Launchers that are not in the launcher registry are requested together from the launcher list endpoint, filtered
+    by their ids. The ones it did not return are then requested one by one, with at most `MAX_LAUNCHER_WORKERS`
+    requests in flight.
+
+    :param urls: Distinct LL2 API URLs for the requested :class:`Launchers <Launcher>`
+    :type urls: Sequence[str]
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :return: Requested :class:`Launchers <Launcher>` keyed by URL
+    :rtype: Dict[str, Launcher]
+    """
+    launchers = registered_launchers(urls)
+    missing_urls = [url for url in urls if url not in launchers]
+    if not missing_urls:
+        return launchers
+    with timed("launchers"):
+        if len(missing_urls) > 1:
+            launchers.update(get_bulk_launchers(missing_urls, session))
+            missing_urls = [url for url in missing_urls if url not in launchers]
+        if missing_urls:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(min(MAX_LAUNCHER_WORKERS, len(missing_urls))) as executor:
+                launchers.update(
+                    zip(missing_urls, executor.map(get_launcher, missing_urls, [session] * len(missing_urls)))
+                )
+    return {url: launchers[url] for url in urls}
+
+
+def get_bulk_launchers(urls: Sequence[str], session: Optional[requests.Session] = None) -> Dict[str, Launcher]:
+    """Get the launchers at the URLs from the launcher list endpoint, a hundred per request. Launchers that the API did
+    not return, or whose URLs are not launcher configuration URLs, are left out."""
+    import requests
+
+    launchers = {}
+    for endpoint, payload, urls_by_id in bulk_launcher_queries(urls):
+        try:
+            data = api_get_request(endpoint, payload, session)
+        except requests.exceptions.HTTPError:
+            # The API did not accept the query, so the launchers are left to be requested one by one
+            continue
+        launchers.update(parse_bulk_launchers(data, urls_by_id))
+    register_launchers(launchers)
+    return launchers
+
+
+def bulk_launcher_queries(urls: Sequence[str]) -> Iterator[Tuple[str, Dict, Dict[int, str]]]:
+    """Group launcher URLs into queries of the launcher list endpoint for up to a hundred launchers each
+
+    :return: Endpoints, query strings, and the URLs of the requested launchers keyed by id
+    :rtype: Iterator[Tuple[str, Dict, Dict[int, str]]]
+    """
+    urls_by_endpoint: Dict[str, Dict[int, str]] = {}
+    for url in urls:
+        match = LAUNCHER_URL_PATTERN.match(url)
+        if match is not None:
+            urls_by_endpoint.setdefault(match["endpoint"], {})[int(match["id"])] = url
+
+    for endpoint, urls_by_id in urls_by_endpoint.items():
+        ids = list(urls_by_id)
+        for start in range(0, len(ids), PAGE_SIZE):
+            chunk = ids[start : start + PAGE_SIZE]
+            # Detailed mode has the same fields as the launcher endpoint, which the list endpoint lacks otherwise
+            payload = {"id__in": ",".join(str(id_) for id_ in chunk), "mode": "detailed", "limit": len(chunk)}
+            yield endpoint, payload, {id_: urls_by_id[id_] for id_ in chunk}
+
+
+def parse_bulk_launchers(data: Dict, urls_by_id: Mapping[int, str]) -> Dict[str, Launcher]:
+    """Build the launchers of a bulk query keyed by their requested URL, ignoring any that were not requested"""
+    launchers = {}
+    with timed("parse.launcher"):
+        for result in data["results"]:
+            url = urls_by_id.get(result.get("id"))
+            if url is not None:
+                launchers[url] = parse_launcher(result)
+    return launchers
+
+
+def registered_launchers(urls: Sequence[str]) -> Dict[str, Launcher]:
+    """Get the launchers at the URLs that are in the launcher registry, keyed by URL"""
+    registry = _launcher_registry
+    if registry is None:
+        return {}
+    launchers = registry.get_many(urls)
+    for _ in launchers:
+        record_count("registry.hits")
+    return launchers
 
 
 def build_location_string(pad_name: Optional[str], pad_location: Optional[str]) -> Optional[str]:
@@ -249,29 +537,43 @@ def build_location_string(pad_name: Optional[str], pad_location: Optional[str])
         return None
 
 
-def next_event(num_events: int) -> Tuple[Event, ...]:
+def next_event(
+    num_events: int, session: Optional[requests.Session] = None, filters: Optional[Filters] = None
+) -> Tuple[Event, ...]:
     """Same as :func:`nextinspace` but only :class:`Events <Event>` requested.
 
     :param num_events: Number of :class:`Events <Event>` to get from the API
     :type num_events: int
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
     :return: Upcoming :class:`Events <Event>`. Note that the length of this tuple will be <= `num_events`.
     :rtype: Tuple
     :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
         so HTTP errors are possible as well.
     """
-    data = api_get_request(f"{BASE_URL}/event/upcoming", {"limit": num_events})
+    if num_events > PAGE_SIZE or (filters is not None and (filters.excludes_events() or filters.type_ is not None)):
+        return tuple(iter_events(num_events, session, filters))
+    data = api_get_request(*event_query(num_events), session)
+    with timed("parse.events"):
+        return tuple(parse_event(result) for result in data["results"])
+
+
+def event_query(num_events: int) -> Tuple[str, Dict]:
+    """Get the endpoint and query string for the next (specified number) of events"""
+    return f"{BASE_URL}/event/upcoming", {"limit": num_events}
 
-    events = []
-    for result in data["results"]:
-        name = result["name"]
-        location = result["location"]
-        date = date_str_to_datetime(result["date"], "%Y-%m-%dT%H:%M:%SZ")
-        description = result["description"]
-        type_ = get_nested_dict_val(result, "type", "name")
 
-        events.append(Event(name, location, date, description, type_))
+def parse_event(result: Dict) -> Event:
+    """Build an :class:`Event` from an event result of the API"""
+    name = result["name"]
+    location = result["location"]
+    date = date_str_to_datetime(result["date"], LL2_DATETIME_FORMAT)
+    description = result["description"]
+    type_ = get_nested_dict_val(result, "type", "name")
 
-    return tuple(events)
+    return Event(name, location, date, description, type_, id=result.get("id"), stale=STALE_KEY in result)
 
 
 def get_nested_dict_val(dict_: Dict, *keys: str) -> Any:
@@ -293,16 +595,33 @@ def get_nested_dict_val(dict_: Dict, *keys: str) -> Any:
         return None
 
 
-def get_launcher(url: str) -> Launcher:
+def get_launcher(url: str, session: Optional[requests.Session] = None) -> Launcher:
     """Get launcher from API
 
     :param url: LL2 API URL for requested :class:`Launcher`
     :type url: str
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
     :return: Requested :class:`Launcher`
     :rtype: Launcher
     """
-    data = api_get_request(url)
+    launcher = registered_launchers([url]).get(url)
+    if launcher is None:
+        data = api_get_request(url, session=session)
+        with timed("parse.launcher"):
+            launcher = parse_launcher(data)
+        register_launchers({url: launcher})
+    return launcher
+
+
+def register_launchers(launchers: Mapping[str, Launcher]) -> None:
+    registry = _launcher_registry
+    if registry is not None:
+        registry.update(launchers)
+
 
+def parse_launcher(data: Dict) -> Launcher:
+    """Build a :class:`Launcher` from a launcher configuration of the API"""
     name = data["full_name"]
     payload_leo = data["leo_capacity"]
     payload_gto = data["gto_capacity"]
@@ -313,7 +632,7 @@ def get_launcher(url: str) -> Launcher:
     successful_launches = data["successful_launches"]
     consecutive_successful_launches = data["consecutive_successful_launches"]
     failed_launches = data["failed_launches"]
-    maiden_flight_date = date_str_to_datetime(data["maiden_flight"], "%Y-%m-%d")
+    maiden_flight_date = date_str_to_datetime(data["maiden_flight"], LL2_DATE_FORMAT)
 
     return Launcher(
         name,
@@ -330,6 +649,460 @@ def get_launcher(url: str) -> Launcher:
     )
 
 
+def iter_upcoming(
+    num_items: Optional[int] = None,
+    include_launcher: bool = False,
+    session: Optional[requests.Session] = None,
+    brief: bool = False,
+    filters: Optional[Filters] = None,
+) -> Iterator[Union[Launch, Event]]:
+    """Same as :func:`nextinspace` but the items are yielded as they arrive from the API instead of all at once.
+
+    Unlike :func:`nextinspace`, this follows the pages of the API's results, so any number of items can be requested.
+    The first pages are requested as soon as this function is called, and each following page is requested in the
+    background while the current one is being consumed.
+
+    :param num_items: Maximum number of items to yield, defaults to all upcoming items
+    :type num_items: int, optional
+    :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
+    :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
+    :return: Upcoming :class:`Launches <Launch>` and :class:`Events <Event>` in order of date
+    :rtype: Iterator
+    :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTPErrors are possible as well.
+    """
+    events = iter_events(num_items, session, filters)
+    launches = iter_launches(num_items, include_launcher, session, brief, filters)
+    return merge_sorted_iterables(events, launches, num_items=num_items)
+
+
+def iter_launches(
+    num_launches: Optional[int] = None,
+    include_launcher: bool = False,
+    session: Optional[requests.Session] = None,
+    brief: bool = False,
+    filters: Optional[Filters] = None,
+) -> Iterator[Launch]:
+    """Same as :func:`iter_upcoming` but only :class:`Launches <Launch>` requested.
+
+    :param num_launches: Maximum number of :class:`Launches <Launch>` to yield, defaults to all upcoming launches
+    :type num_launches: int, optional
+    :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
+    :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
+    :return: Upcoming :class:`Launches <Launch>` in order of date
+    :rtype: Iterator
+    :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTPErrors are possible as well.
+    """
+    if filters is not None and filters.type_ is not None:
+        endpoint, payload = launch_query(PAGE_SIZE, brief and not include_launcher, filters)
+        pages = iter_pages(endpoint, payload, None, session)
+        pages = filter_pages(pages, filters.matches_launch_result, num_launches)
+    else:
+        endpoint, payload = launch_query(page_limit(num_launches), brief and not include_launcher, filters)
+        pages = iter_pages(endpoint, payload, num_launches, session)
+    return parse_launch_pages(pages, include_launcher, session)
+
+
+def parse_launch_pages(
+    pages: Iterable[List[Dict]], include_launcher: bool = False, session: Optional[requests.Session] = None
+) -> Iterator[Launch]:
+    """Parse pages of launch results, fetching each distinct launcher only once across all pages"""
+    launchers: Dict[str, Launcher] = {}
+    for results in pages:
+        if include_launcher:
+            missing_urls = [url for url in get_launcher_urls(results) if url not in launchers]
+            launchers.update(get_launchers(missing_urls, session))
+        with timed("parse.launches"):
+            launches = [parse_launch(result, launchers) for result in results]
+        yield from launches
+
+
+def parse_event_pages(pages: Iterable[List[Dict]]) -> Iterator[Event]:
+    for results in pages:
+        with timed("parse.events"):
+            events = [parse_event(result) for result in results]
+        yield from events
+
+
+def iter_events(
+    num_events: Optional[int] = None, session: Optional[requests.Session] = None, filters: Optional[Filters] = None
+) -> Iterator[Event]:
+    """Same as :func:`iter_upcoming` but only :class:`Events <Event>` requested.
+
+    :param num_events: Maximum number of :class:`Events <Event>` to yield, defaults to all upcoming events
+    :type num_events: int, optional
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
+    :return: Upcoming :class:`Events <Event>` in order of date
+    :rtype: Iterator
+    :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTPErrors are possible as well.
+    """
+    if filters is not None and filters.excludes_events():
+        return iter(())
+    if filters is not None and filters.type_ is not None:
+        endpoint, payload = event_query(PAGE_SIZE)
+        pages = iter_pages(endpoint, payload, None, session)
+        pages = filter_pages(pages, filters.matches_event_result, num_events)
+    else:
+        endpoint, payload = event_query(page_limit(num_events))
+        pages = iter_pages(endpoint, payload, num_events, session)
+    return parse_event_pages(pages)
+
+
+def items_between(
+    start: datetime,
+    end: datetime,
+    include_launcher: bool = False,
+    session: Optional[requests.Session] = None,
+    brief: bool = False,
+    filters: Optional[Filters] = None,
+) -> Tuple[Union[Launch, Event], ...]:
+    """Get all the :class:`Launches <Launch>` and :class:`Events <Event>` dated within a window of time, like this week.
+
+    As many pages of results are requested as it takes to fill the window. Unlike with :func:`nextinspace`, the queries
+    only depend on the window and not on the current time, so their responses can be cached (see :func:`enable_cache`)
+    and reused for the same window.
+
+    :param start: Start of the window, included. Naive datetimes are taken to be in local time.
+    :type start: datetime
+    :param end: End of the window, included. Naive datetimes are taken to be in local time.
+    :type end: datetime
+    :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
+    :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :param filters: Which items to get, defaults to all of them
+    :type filters: Filters, optional
+    :return: :class:`Launches <Launch>` and :class:`Events <Event>` within the window, in order of date
+    :rtype: Tuple
+    :raises ValueError: If the window ends before it starts
+    :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTPErrors are possible as well.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    check_window(start, end)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        events_future = executor.submit(events_between, start, end, session, filters)
+        launches_future = executor.submit(launches_between, start, end, include_launcher, session, brief, filters)
+        events = events_future.result()
+        launches = launches_future.result()
+    with timed("merge"):
+        return tuple(merge_sorted_iterables(events, launches))
+
+
+def launches_between(
+    start: datetime,
+    end: datetime,
+    include_launcher: bool = False,
+    session: Optional[requests.Session] = None,
+    brief: bool = False,
+    filters: Optional[Filters] = None,
+) -> Tuple[Launch, ...]:
+    """Same as :func:`items_between` but only :class:`Launches <Launch>` requested."""
+    check_window(start, end)
+    endpoint, payload = launch_window_query(start, end, brief and not include_launcher, filters)
+    pages = iter_pages(endpoint, payload, None, session)
+    if filters is not None and filters.type_ is not None:
+        pages = filter_pages(pages, filters.matches_launch_result)
+    return tuple(parse_launch_pages(pages, include_launcher, session))
+
+
+def launch_window_query(
+    start: datetime, end: datetime, brief: bool = False, filters: Optional[Filters] = None
+) -> Tuple[str, Dict]:
+    """Get the endpoint and query string for the launches within a window of time"""
+    endpoint, payload = launch_query(PAGE_SIZE, brief, filters)
+    payload.update(net__gte=ll2_datetime_str(start), net__lte=ll2_datetime_str(end))
+    return endpoint, payload
+
+
+def events_between(
+    start: datetime, end: datetime, session: Optional[requests.Session] = None, filters: Optional[Filters] = None
+) -> Tuple[Event, ...]:
+    """Same as :func:`items_between` but only :class:`Events <Event>` requested."""
+    check_window(start, end)
+    if filters is not None and filters.excludes_events():
+        return ()
+    pages = iter_pages(*event_window_query(start, end), None, session)
+    if filters is not None and filters.type_ is not None:
+        pages = filter_pages(pages, filters.matches_event_result)
+    return tuple(parse_event_pages(pages))
+
+
+def event_window_query(start: datetime, end: datetime) -> Tuple[str, Dict]:
+    """Get the endpoint and query string for the events within a window of time"""
+    # Unlike /event/upcoming, /event has past events too, so the start bounds the dates instead
+    return f"{BASE_URL}/event", {
+        "limit": PAGE_SIZE,
+        "date__gte": ll2_datetime_str(start),
+        "date__lte": ll2_datetime_str(end),
+        "ordering": "date",
+    }
+
+
+def check_window(start: datetime, end: datetime) -> None:
+    # Naive datetimes are made aware so that they can be compared with aware ones
+    if end.astimezone() < start.astimezone():
+        raise ValueError(f"The window ends ({end}) before it starts ({start})")
+
+
+def ll2_datetime_str(date: datetime) -> str:
+    """Format a datetime for the API, in UTC. Naive datetimes are taken to be in local time."""
+    return date.astimezone(timezone.utc).strftime(LL2_DATETIME_FORMAT)
+
+
+def page_limit(num_results: Optional[int]) -> int:
+    """Get the number of results to request per page for the specified total number of results"""
+    return PAGE_SIZE if num_results is None else min(num_results, PAGE_SIZE)
+
+
+def iter_pages(
+    endpoint: str, payload: Dict, num_results: Optional[int] = None, session: Optional[requests.Session] = None
+) -> Iterator[List[Dict]]:
+    """Get the pages of results of an API query by following its `next` links.
+
+    The first page is requested immediately, and each following page is requested in the background once the
+    previous one has been received.
+
+    :param endpoint: API endpoint address
+    :type endpoint: str
+    :param payload: Query string for the first page
+    :type payload: Dict
+    :param num_results: Maximum number of results to get, defaults to all of them
+    :type num_results: int, optional
+    :param session: Session to make API requests with, defaults to the shared session
+    :type session: requests.Session, optional
+    :return: Lists of results
+    :rtype: Iterator[List[Dict]]
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    first_page = executor.submit(api_get_request, endpoint, payload, session)
+    return follow_pages(executor, first_page, num_results, session)
+
+
+def filter_pages(
+    pages: Iterable[List[Dict]], predicate: Callable[[Dict], bool], num_results: Optional[int] = None
+) -> Iterator[List[Dict]]:
+    """Keep the results of the pages that match the predicate, and stop following the pages once `num_results` were
+    kept"""
+    remaining = num_results
+    for results in pages:
+        results = [result for result in results if predicate(result)]
+        if remaining is not None:
+            results = results[:remaining]
+            remaining -= len(results)
+        yield results
+        if remaining == 0:
+            return
+
+
+def follow_pages(
+    executor: ThreadPoolExecutor,
+    page: Optional[Future],
+    num_results: Optional[int],
+    session: Optional[requests.Session],
+) -> Iterator[List[Dict]]:
+    remaining = num_results
+    with executor:
+        while page is not None:
+            data = page.result()
+            results = data["results"]
+            if remaining is not None:
+                results = results[:remaining]
+                remaining -= len(results)
+
+            next_url = data.get("next")
+            # Pages of cached responses can be left without results, and the following pages still have some
+            if next_url is not None and (remaining is None or remaining > 0):
+                page = executor.submit(api_get_request, next_url, {}, session)
+            else:
+                page = None
+
+            yield results
+
+
+async def async_nextinspace(
+    num_items: int,
+    include_launcher: bool = False,
+    session: Optional["aiohttp.ClientSession"] = None,
+    brief: bool = False,
+) -> Tuple[Union[Launch, Event], ...]:
+    """Same as :func:`nextinspace` but asynchronous. Requires the `async` extra (`pip install nextinspace[async]`).
+
+    :param num_items: Number of items to get from the API
+    :type num_items: int
+    :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
+    :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a session that lives for the duration of the call
+    :type session: aiohttp.ClientSession, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :return: Upcoming :class:`Launches <Launch>` and :class:`Events <Event>`. Note that the length of this tuple will be <= `num_items`.
+    :rtype: Tuple
+    :raises aiohttp.ClientError: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTP errors are possible as well.
+    """
+    import asyncio
+
+    async with async_session(session) as session:
+        events, launches = await asyncio.gather(
+            async_next_event(num_items, session), async_next_launch(num_items, include_launcher, session, brief)
+        )
+    with timed("merge"):
+        return tuple(merge_sorted_sequences(events, launches, num_items))
+
+
+async def async_next_launch(
+    num_launches: int,
+    include_launcher: bool = False,
+    session: Optional["aiohttp.ClientSession"] = None,
+    brief: bool = False,
+) -> Tuple[Launch, ...]:
+    """Same as :func:`next_launch` but asynchronous. Requires the `async` extra (`pip install nextinspace[async]`).
+
+    :param num_launches: Number of :class:`Launches <Launch>` to get from the API
+    :type num_launches: int
+    :param include_launcher: Whether to include the launcher of the requested :class:`Launches <Launch>`, defaults to False
+    :type include_launcher: bool, optional
+    :param session: Session to make API requests with, defaults to a session that lives for the duration of the call
+    :type session: aiohttp.ClientSession, optional
+    :param brief: Whether to request lighter :class:`Launches <Launch>`, without description or launcher (ignored with \
+        `include_launcher`), defaults to False
+    :type brief: bool, optional
+    :return: Upcoming :class:`Launches <Launch>`. Note that the length of this tuple will be <= `num_launches`.
+    :rtype: Tuple
+    :raises aiohttp.ClientError: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTP errors are possible as well.
+    """
+    async with async_session(session) as session:
+        endpoint, payload = launch_query(page_limit(num_launches), brief and not include_launcher)
+        results = await async_get_results(endpoint, payload, num_launches, session)
+        launchers = await async_get_launchers(get_launcher_urls(results), session) if include_launcher else {}
+    with timed("parse.launches"):
+        return tuple(parse_launch(result, launchers) for result in results)
+
+
+async def async_get_launchers(
+    urls: Sequence[str], session: Optional["aiohttp.ClientSession"] = None
+) -> Dict[str, Launcher]:
+    """Same as :func:`get_launchers` but asynchronous"""
+    import asyncio
+
+    semaphore = asyncio.Semaphore(MAX_LAUNCHER_WORKERS)
+
+    async def bounded_get_launcher(url: str) -> Launcher:
+        async with semaphore:
+            return await async_get_launcher(url, session)
+
+    launchers = registered_launchers(urls)
+    missing_urls = [url for url in urls if url not in launchers]
+    if not missing_urls:
+        return launchers
+    with timed("launchers"):
+        async with async_session(session) as session:
+            if len(missing_urls) > 1:
+                launchers.update(await async_get_bulk_launchers(missing_urls, session))
+                missing_urls = [url for url in missing_urls if url not in launchers]
+            fetched = await asyncio.gather(*(bounded_get_launcher(url) for url in missing_urls))
+    launchers.update(zip(missing_urls, fetched))
+    return {url: launchers[url] for url in urls}
+
+
+async def async_get_bulk_launchers(
+    urls: Sequence[str], session: Optional["aiohttp.ClientSession"] = None
+) -> Dict[str, Launcher]:
+    """Same as :func:`get_bulk_launchers` but asynchronous"""
+    import aiohttp
+
+    launchers = {}
+    async with async_session(session) as session:
+        for endpoint, payload, urls_by_id in bulk_launcher_queries(urls):
+            try:
+                data = await async_api_get_request(endpoint, payload, session)
+            except aiohttp.ClientResponseError:
+                # The API did not accept the query, so the launchers are left to be requested one by one
+                continue
+            launchers.update(parse_bulk_launchers(data, urls_by_id))
+    register_launchers(launchers)
+    return launchers
+
+
+async def async_next_event(num_events: int, session: Optional["aiohttp.ClientSession"] = None) -> Tuple[Event, ...]:
+    """Same as :func:`next_event` but asynchronous. Requires the `async` extra (`pip install nextinspace[async]`).
+
+    :param num_events: Number of :class:`Events <Event>` to get from the API
+    :type num_events: int
+    :param session: Session to make API requests with, defaults to a session that lives for the duration of the call
+    :type session: aiohttp.ClientSession, optional
+    :return: Upcoming :class:`Events <Event>`. Note that the length of this tuple will be <= `num_events`.
+    :rtype: Tuple
+    :raises aiohttp.ClientError: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTP errors are possible as well.
+    """
+    async with async_session(session) as session:
+        results = await async_get_results(*event_query(page_limit(num_events)), num_events, session)
+    with timed("parse.events"):
+        return tuple(parse_event(result) for result in results)
+
+
+async def async_get_results(
+    endpoint: str, payload: Dict, num_results: int, session: "aiohttp.ClientSession"
+) -> List[Dict]:
+    """Get up to `num_results` results of an API query, following its `next` links for more than a page of results"""
+    data = await async_api_get_request(endpoint, payload, session)
+    results = data["results"][:num_results]
+    # A single page has all the results asked for, unless that is more than a page can hold
+    while num_results > PAGE_SIZE and len(results) < num_results and data.get("next") is not None:
+        data = await async_api_get_request(data["next"], {}, session)
+        results += data["results"][: num_results - len(results)]
+    return results
+
+
+async def async_get_launcher(url: str, session: Optional["aiohttp.ClientSession"] = None) -> Launcher:
+    """Same as :func:`get_launcher` but asynchronous. Requires the `async` extra (`pip install nextinspace[async]`).
+
+    :param url: LL2 API URL for requested :class:`Launcher`
+    :type url: str
+    :param session: Session to make API requests with, defaults to a session that lives for the duration of the call
+    :type session: aiohttp.ClientSession, optional
+    :return: Requested :class:`Launcher`
+    :rtype: Launcher
+    """
+    launcher = registered_launchers([url]).get(url)
+    if launcher is None:
+        async with async_session(session) as session:
+            data = await async_api_get_request(url, session=session)
+        with timed("parse.launcher"):
+            launcher = parse_launcher(data)
+        register_launchers({url: launcher})
+    return launcher
+
+
 def date_str_to_datetime(datetime_str: Optional[str], fmat_str: str) -> datetime:
     """Convert datetime string in UTC to datetime object in local timezone
 
@@ -342,21 +1115,533 @@ def date_str_to_datetime(datetime_str: Optional[str], fmat_str: str) -> datetime
     """
     if datetime_str is None:
         return datetime(MINYEAR, 1, 1)
-    datetime_utc = datetime.strptime(datetime_str, fmat_str).replace(tzinfo=timezone.utc)
-    return datetime_utc.astimezone()
 
+    datetime_utc = parse_ll2_date_str(datetime_str, fmat_str)
+    if datetime_utc is None:
+        datetime_utc = datetime.strptime(datetime_str, fmat_str)
+    datetime_utc = datetime_utc.replace(tzinfo=timezone.utc)
+
+    try:
+        local_tz = local_timezone(int(datetime_utc.timestamp()) // TZ_BUCKET_SECONDS)
+    except (OSError, OverflowError):
+        local_tz = None
+    return datetime_utc.astimezone(local_tz)
+
+
+def parse_ll2_date_str(datetime_str: str, fmat_str: str) -> Optional[datetime]:
+    """Parse the date formats used by the API much faster than `datetime.strptime()` can.
+    Returns None if the format is not one of them, or if the string does not match it."""
+    if fmat_str == LL2_DATETIME_FORMAT:
+        if len(datetime_str) != 20 or datetime_str[19] != "Z" or datetime_str[10] != "T":
+            return None
+        datetime_str = datetime_str[:19]
+        if datetime_str[13] != ":" or datetime_str[16] != ":":
+            return None
+    elif fmat_str == LL2_DATE_FORMAT:
+        if len(datetime_str) != 10:
+            return None
+    else:
+        return None
+
+    if datetime_str[4] != "-" or datetime_str[7] != "-":
+        return None
+    try:
+        return datetime.fromisoformat(datetime_str)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=65536)
+def local_timezone(bucket: int) -> Optional[timezone]:
+    """Get the local timezone throughout the `bucket`-th span of `TZ_BUCKET_SECONDS` since the epoch.
+    Returns None if the UTC offset changes during that span."""
+    start = time.localtime(bucket * TZ_BUCKET_SECONDS)
+    end = time.localtime((bucket + 1) * TZ_BUCKET_SECONDS - 1)
+    if (start.tm_gmtoff, start.tm_zone) != (end.tm_gmtoff, end.tm_zone):
+        return None
+    return timezone(timedelta(seconds=start.tm_gmtoff), start.tm_zone)
+
+
+def enable_cache(
+    directory: Optional[str] = None,
+    ttls: Optional[Dict[str, float]] = None,
+    refresh: bool = False,
+    max_stale: float = 0,
+    deadline: Optional[float] = None,
+) -> ResponseCache:
+    """Cache API responses on disk. Cached responses are reused until their time to live runs out, after which they are
+    revalidated with the API using their ETag/Last-Modified headers when the API provided them. Queries for upcoming
+    launches keep using the same cached response as time goes by, without the launches that have since gone by.
+
+    With `max_stale`, expired responses are kept as a fallback: if the API fails, or does not respond within `deadline`
+    seconds, the expired response is used instead and the returned items are marked as :attr:`~Event.stale`. When the
+    deadline is missed, the request keeps going in the background and refreshes the cache for next time (see
+    :func:`wait_for_refreshes`). Requests that time out are not retried, so that a hung API holds up requests without
+    an expired response to fall back to for one request timeout at most.
+
+    :param directory: Directory to store cached responses in, defaults to `$XDG_CACHE_HOME/nextinspace`
+    :type directory: str, optional
+    :param ttls: Time to live in seconds per endpoint path (ex: `{"/launch": 300}`), defaults to \
+        :data:`nextinspace.cache.DEFAULT_TTLS`
+    :type ttls: Dict[str, float], optional
+    :param refresh: Whether to bypass cached responses (fresh responses are still stored), defaults to False
+    :type refresh: bool, optional
+    :param max_stale: How long in seconds responses can be used as a fallback after they expired, defaults to 0
+    :type max_stale: float, optional
+    :param deadline: How long in seconds to wait for the API before falling back to an expired response, defaults to \
+        :data:`nextinspace.cache.DEFAULT_DEADLINE`
+    :type deadline: float, optional
+    :return: The cache now in use
+    :rtype: nextinspace.cache.ResponseCache
+    """
+    from nextinspace.cache import DEFAULT_DEADLINE, ResponseCache
+
+    global _cache
+    _cache = ResponseCache(directory, ttls, refresh, max_stale, DEFAULT_DEADLINE if deadline is None else deadline)
+    return _cache
+
+
+def disable_cache() -> None:
+    """Stop caching API responses. Responses that were already cached are left on disk."""
+    global _cache
+    _cache = None
+
+
+def enable_rate_limit(
+    requests_per_hour: float, burst: Optional[int] = None, max_retries: Optional[int] = None
+) -> Throttle:
+    """Limit the rate of API requests, across all threads and asynchronous tasks. Requests over the limit wait until
+    they can be made instead of being rejected by the API.
+
+    :param requests_per_hour: Maximum average number of requests per hour (LL2 allows 15 without an API key)
+    :type requests_per_hour: float
+    :param burst: Number of requests that can be made at once before the limit applies, defaults to `requests_per_hour`
+    :type burst: int, optional
+    :param max_retries: Number of times failed requests are retried, defaults to \
+        :data:`nextinspace.throttle.MAX_RETRIES`
+    :type max_retries: int, optional
+    :return: The throttle now in use, whose :attr:`~nextinspace.throttle.Throttle.stats` tell how long requests waited
+    :rtype: nextinspace.throttle.Throttle
+    """
+    from nextinspace.throttle import MAX_RETRIES, Throttle
+
+    global _throttle
+    _throttle = Throttle(requests_per_hour, burst, MAX_RETRIES if max_retries is None else max_retries)
+    return _throttle
+
+
+def disable_rate_limit() -> None:
+    """Stop limiting the rate of API requests. Failed requests are still retried."""
+    global _throttle
+    _throttle = None
+
+
+def get_throttle() -> Throttle:
+    """Get the throttle that API requests go through, creating one without a rate limit on first use.
+
+    Requests that fail with a connection error or with a status that is worth retrying (429 and 5xx) are retried with
+    exponential backoff, honoring the API's `Retry-After` header.
+    """
+    global _throttle
+    with _session_lock:
+        if _throttle is None:
+            from nextinspace.throttle import Throttle
+
+            _throttle = Throttle()
+        return _throttle
+
+
+def enable_launcher_registry(max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> LauncherRegistry:
+    """Replace the launcher registry with an empty one with the specified bounds.
+
+    The registry keeps launchers in memory, so that getting the launcher of a launch only requests it from the API the
+    first time, and again once it is `ttl` seconds old. It is shared by all threads and asynchronous tasks, and is
+    enabled by default.
+
+    :param max_size: Maximum number of launchers kept, defaults to :data:`nextinspace.registry.DEFAULT_MAX_SIZE`
+    :type max_size: int, optional
+    :param ttl: Time to live of launchers in seconds, defaults to :data:`nextinspace.registry.DEFAULT_TTL`
+    :type ttl: float, optional
+    :return: The registry now in use
+    :rtype: nextinspace.registry.LauncherRegistry
+    """
+    global _launcher_registry
+    _launcher_registry = LauncherRegistry(max_size, ttl)
+    return _launcher_registry
+
+
+def disable_launcher_registry() -> None:
+    """Stop keeping launchers in memory, so that they are requested every time they are needed"""
+    global _launcher_registry
+    _launcher_registry = None
+
+
+def get_launcher_registry() -> Optional[LauncherRegistry]:
+    """Get the launcher registry, or None if it is disabled"""
+    return _launcher_registry
+
+
+def warm_launcher_registry(session: Optional[requests.Session] = None) -> int:
+    """Fill the launcher registry with every active launcher, in a few requests of a hundred launchers each instead of
+    one request per launcher. This is worth it before getting the launchers of many launches.
+
+    :param session: Session to make API requests with, defaults to a shared session (see :func:`new_session`)
+    :type session: requests.Session, optional
+    :return: Number of launchers added to the registry, which is 0 if it is disabled
+    :rtype: int
+    :raises requests.exceptions.RequestException: If there is a problem connecting to the API. Also does a `raise_for_status()` call \
+        so HTTPErrors are possible as well.
+    """
+    if _launcher_registry is None:
+        return 0
+    # Detailed mode has the same fields as the launcher endpoint, which the list endpoint lacks otherwise
+    payload = {"limit": PAGE_SIZE, "mode": "detailed", "active": "true"}
+    launchers = {}
+    for results in iter_pages(f"{BASE_URL}/config/launcher/", payload, None, session):
+        with timed("parse.launcher"):
+            launchers.update((result["url"], parse_launcher(result)) for result in results)
+    register_launchers(launchers)
+    return len(launchers)
+
+
+def enable_instrumentation(recorder: Optional[Recorder] = None) -> Recorder:
+    """Measure how long the phases of getting items take (HTTP requests, JSON decoding, building objects...) and count
+    HTTP requests and cache hits. Measuring has a small cost, which is why it is disabled by default.
+
+    :param recorder: Recorder to send the measurements to, defaults to a new :class:`nextinspace.instrument.Recorder`
+    :type recorder: nextinspace.instrument.Recorder, optional
+    :return: The recorder now in use, whose :meth:`~nextinspace.instrument.Recorder.summary` gives the measurements
+    :rtype: nextinspace.instrument.Recorder
+    """
+    global _recorder
+    if recorder is None:
+        from nextinspace.instrument import Recorder
+
+        recorder = Recorder()
+    _recorder = recorder
+    return recorder
+
+
+def disable_instrumentation() -> None:
+    """Stop measuring"""
+    global _recorder
+    _recorder = None
+
+
+def timed(phase: str) -> ContextManager[Any]:
+    """Time the enclosed code as the specified phase, if instrumentation is enabled"""
+    recorder = _recorder
+    if recorder is None:
+        # Cheaper than a generator based context manager, as this is used in loops
+        return NO_TIMER
+    return Timer(recorder, phase)
+
+
+class Timer:
+    __slots__ = ("recorder", "phase", "start")
+
+    def __init__(self, recorder: Recorder, phase: str):
+        self.recorder = recorder
+        self.phase = phase
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.recorder.timing(self.phase, time.perf_counter() - self.start)
+
+
+NO_TIMER = contextlib.nullcontext()
+
+
+def record_count(name: str) -> None:
+    recorder = _recorder
+    if recorder is not None:
+        recorder.count(name)
+
+
+def record_request_timings(total: float, ttfb: float) -> None:
+    recorder = _recorder
+    if recorder is not None:
+        recorder.timing("http.request", total)
+        recorder.timing("http.ttfb", ttfb)
+        recorder.timing("http.body", max(0.0, total - ttfb))
+
+
+def new_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """Create a session for making API requests. Connections to the API are kept alive and pooled between requests.
+
+    Sessions made this way (or any other :class:`requests.Session`, with whatever adapters, proxies and retries you like)
+    can be passed to the public API functions. Otherwise, a shared session made by this function is used.
+
+    :param pool_size: Maximum number of connections kept alive per host, defaults to `DEFAULT_POOL_SIZE`
+    :type pool_size: int, optional
+    :return: New session
+    :rtype: requests.Session
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
 
-def api_get_request(endpoint: str, payload: Dict = {}) -> Any:
-    """Make get request to LL2 API
+
+def get_session() -> requests.Session:
+    """Get the shared session, creating it on first use"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = new_session()
+        return _session
+
+
+def api_get_request(endpoint: str, payload: Dict = {}, session: Optional[requests.Session] = None) -> Any:
+    """Make get request to LL2 API, going through the response cache if it is enabled and retrying failed requests as
+    described in :func:`get_throttle`
 
     :param endpoint: API endpoint address
     :type endpoint: str
     :param payload: Query string for API as defined by Requests, defaults to {}
     :type payload: Dict, optional
+    :param session: Session to make the request with, defaults to the shared session
+    :type session: requests.Session, optional
     :return: Either JSON data from the API or raise an exception if the API is unreachable
     :rtype: Any
     :raises requests.exceptions.RequestException:
     """
-    response = requests.get(endpoint, params=payload)
+    # Cached responses are looked up first so that using them does not require a session
+    cache = _cache
+    entry = cache.get(endpoint, payload) if cache is not None else None
+    if cache is not None and entry is not None:
+        if cache.is_fresh(endpoint, entry):
+            record_count("cache.hits")
+            return entry.data
+        if cache.max_stale and cache.is_usable_stale(endpoint, entry):
+            return fetch_before_deadline(endpoint, payload, session, cache, entry)
+    # Falling back to expired responses is about answering quickly, so a hung API is not waited for again
+    retry_timeouts = cache is None or not cache.max_stale
+    return fetch(endpoint, payload, session, cache, entry, retry_timeouts)
+
+
+def fetch(
+    endpoint: str,
+    payload: Dict,
+    session: Optional[requests.Session],
+    cache: Optional[ResponseCache],
+    entry: Optional[CacheEntry],
+    retry_timeouts: bool = True,
+) -> Any:
+    """Request data from the API, revalidating and updating the cached response if there is a cache"""
+    import requests
+
+    from nextinspace.decoding import decode
+    from nextinspace.throttle import RETRY_STATUSES
+
+    if session is None:
+        session = get_session()
+    headers = cache.revalidation_headers(entry) if cache is not None else {}
+    throttle = get_throttle()
+    attempt = 0
+    while True:
+        throttle.wait()
+        record_count("http.requests")
+        start = time.perf_counter()
+        try:
+            response = session.get(endpoint, params=payload, headers=headers, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.Timeout:
+            if not retry_timeouts or not throttle.backoff(attempt):
+                raise
+        except requests.exceptions.ConnectionError:
+            if not throttle.backoff(attempt):
+                raise
+        else:
+            record_request_timings(time.perf_counter() - start, response.elapsed.total_seconds())
+            if response.status_code not in RETRY_STATUSES or not throttle.backoff(
+                attempt, response.headers.get("Retry-After")
+            ):
+                break
+        attempt += 1
+
+    if cache is not None and response.status_code == 304 and entry is not None:
+        record_count("cache.revalidated")
+        cache.touch(endpoint, payload, entry)
+        return entry.data
     response.raise_for_status()
-    return response.json()
+
+    with timed("json.decode"):
+        try:
+            data = decode(response.content, endpoint)
+        except ValueError as err:
+            raise requests.exceptions.RequestException(
+                f"Invalid JSON from {endpoint}: {err}", response=response
+            ) from err
+    if cache is not None:
+        cache.put(endpoint, payload, data, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+    return data
+
+
+def fetch_before_deadline(
+    endpoint: str, payload: Dict, session: Optional[requests.Session], cache: ResponseCache, entry: CacheEntry
+) -> Any:
+    """Request data from the API, falling back to an expired cached response if the API fails or misses the deadline.
+
+    The request runs in a daemon thread, so when the deadline is missed it keeps going in the background and updates
+    the cache when it completes, without keeping the program from exiting (see :func:`wait_for_refreshes`).
+    """
+    from concurrent.futures import Future
+    from concurrent.futures import TimeoutError as FutureTimeoutError
+
+    import requests
+
+    future: Future = Future()
+
+    def refresh() -> None:
+        try:
+            future.set_result(fetch(endpoint, payload, session, cache, entry, retry_timeouts=False))
+        except BaseException as err:
+            future.set_exception(err)
+        finally:
+            with _refreshes_lock:
+                _refreshes.discard(thread)
+
+    thread = threading.Thread(target=refresh, daemon=True)
+    with _refreshes_lock:
+        _refreshes.add(thread)
+    thread.start()
+    try:
+        return future.result(timeout=cache.deadline)
+    except (FutureTimeoutError, requests.exceptions.RequestException, ValueError):
+        record_count("cache.stale")
+        return mark_stale(entry.data)
+
+
+def wait_for_refreshes(timeout: Optional[float] = None) -> bool:
+    """Wait for the requests that missed their deadline (see :func:`enable_cache`) to refresh the cache.
+
+    These requests keep going in daemon threads, which are stopped when the program exits. Short-lived programs, like
+    the CLI, can call this before exiting so that the cache gets refreshed even if the API is always slower than the
+    deadline.
+
+    :param timeout: Maximum number of seconds to wait, defaults to waiting as long as it takes
+    :type timeout: float, optional
+    :return: Whether all the requests completed
+    :rtype: bool
+    """
+    end = None if timeout is None else time.monotonic() + timeout
+    with _refreshes_lock:
+        threads = list(_refreshes)
+    for thread in threads:
+        thread.join(None if end is None else max(0.0, end - time.monotonic()))
+    return not any(thread.is_alive() for thread in threads)
+
+
+def mark_stale(data: Any) -> Any:
+    """Copy a response, marking its results as stale"""
+    if isinstance(data, dict) and isinstance(data.get("results"), list):
+        return {**data, "results": [{**result, STALE_KEY: True} for result in data["results"]]}
+    return data
+
+
+@contextlib.asynccontextmanager
+async def async_session(session: Optional["aiohttp.ClientSession"] = None) -> AsyncIterator["aiohttp.ClientSession"]:
+    """Use the specified session, or a new one that is closed on exit if None is specified"""
+    if session is not None:
+        yield session
+        return
+
+    try:
+        import aiohttp
+    except ImportError as err:
+        raise ImportError("The async API requires aiohttp. Install it with `pip install nextinspace[async]`.") from err
+
+    async with aiohttp.ClientSession() as new_session:
+        yield new_session
+
+
+async def async_api_get_request(
+    endpoint: str, payload: Dict = {}, session: Optional["aiohttp.ClientSession"] = None
+) -> Any:
+    """Same as :func:`api_get_request` but asynchronous. When an expired cached response is used because the deadline
+    was missed, the request is cancelled rather than kept going in the background.
+
+    :raises aiohttp.ClientError:
+    """
+    cache = _cache
+    entry = cache.get(endpoint, payload) if cache is not None else None
+    if cache is not None and entry is not None:
+        if cache.is_fresh(endpoint, entry):
+            record_count("cache.hits")
+            return entry.data
+        if cache.max_stale and cache.is_usable_stale(endpoint, entry):
+            import asyncio
+
+            import aiohttp
+
+            try:
+                return await asyncio.wait_for(async_fetch(endpoint, payload, session, cache, entry), cache.deadline)
+            except (asyncio.TimeoutError, aiohttp.ClientError, ValueError):
+                record_count("cache.stale")
+                return mark_stale(entry.data)
+    retry_timeouts = cache is None or not cache.max_stale
+    return await async_fetch(endpoint, payload, session, cache, entry, retry_timeouts)
+
+
+async def async_fetch(
+    endpoint: str,
+    payload: Dict,
+    session: Optional["aiohttp.ClientSession"],
+    cache: Optional[ResponseCache],
+    entry: Optional[CacheEntry],
+    retry_timeouts: bool = True,
+) -> Any:
+    """Same as :func:`fetch` but asynchronous"""
+    headers = cache.revalidation_headers(entry) if cache is not None else {}
+    throttle = get_throttle()
+    async with async_session(session) as session:
+        import asyncio
+
+        import aiohttp
+
+        from nextinspace.decoding import decode
+        from nextinspace.throttle import RETRY_STATUSES
+
+        attempt = 0
+        while True:
+            await throttle.async_wait()
+            record_count("http.requests")
+            start = time.perf_counter()
+            try:
+                timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
+                async with session.get(endpoint, params=payload, headers=headers, timeout=timeout) as response:
+                    ttfb = time.perf_counter() - start
+                    if response.status in RETRY_STATUSES and await throttle.async_backoff(
+                        attempt, response.headers.get("Retry-After")
+                    ):
+                        attempt += 1
+                        continue
+                    if cache is not None and response.status == 304 and entry is not None:
+                        record_count("cache.revalidated")
+                        cache.touch(endpoint, payload, entry)
+                        return entry.data
+                    response.raise_for_status()
+
+                    body = await response.read()
+                    record_request_timings(time.perf_counter() - start, ttfb)
+                    with timed("json.decode"):
+                        data = decode(body, endpoint)
+                    if cache is not None:
+                        cache.put(
+                            endpoint, payload, data, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                        )
+                    return data
+            except asyncio.TimeoutError:
+                if not retry_timeouts or not await throttle.async_backoff(attempt):
+                    raise
+                attempt += 1
+            except aiohttp.ClientConnectionError:
+                if not await throttle.async_backoff(attempt):
+                    raise
+                attempt += 1
@@ -0,0 +1,137 @@
+"""Parsing of many pages of API results at once, spread across processes
+
+Building items from API results is CPU-bound, which shows for large pulls like years of launch history. The functions
+here decode and parse pages in a pool of processes, a few pages at a time, and return the items in order. Pages are
+best given as raw response bodies, which are cheap to send to other processes: decoded pages cost more to send than
+to parse.
+
+    from nextinspace import bulk
+
+    launches = bulk.parse_launch_pages(bodies, launchers)
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+import nextinspace
+from nextinspace import Event, Launch, Launcher
+from nextinspace.decoding import decode
+
+# Raw JSON of an API page, a decoded API page, or its list of results
+Page = Union[bytes, str, Dict[str, Any], List[Dict[str, Any]]]
+
+# Number of pages sent to a process at a time. Four pages of a hundred launches take about 40ms to decode and parse,
+# which is long enough for the cost of sending them and their items between processes to stay small.
+PAGES_PER_TASK = 4
+
+# Processes send back the fields of the items rather than the items, which takes half as long to unpickle. Unpickling
+# happens in this process, so it bounds how much faster parsing gets with more processes.
+ItemId = Union[int, str, None]
+LaunchFields = Tuple[Optional[str], Optional[str], datetime, Optional[str], Optional[str], Optional[str], ItemId, bool]
+EventFields = Tuple[Optional[str], Optional[str], datetime, Optional[str], Optional[str], ItemId, bool]
+
+ParsedT = TypeVar("ParsedT")
+
+
+def parse_launch_pages(
+    pages: Iterable[Page], launchers: Mapping[str, Launcher] = {}, workers: Optional[int] = None
+) -> List[Launch]:
+    """Build the :class:`Launches <nextinspace.Launch>` of pages of launch results
+
+    :param pages: Pages of launch results, preferably as raw response bodies
+    :type pages: Iterable[Page]
+    :param launchers: Already fetched :class:`Launchers <nextinspace.Launcher>` keyed by URL, to attach to the
+        launches, defaults to {}
+    :type launchers: Mapping[str, Launcher], optional
+    :param workers: Number of processes, defaults to the number of CPUs. With 1, the pages are parsed sequentially in
+        this process, which is also what happens when there are too few pages to be worth it or when processes cannot
+        be started.
+    :type workers: int, optional
+    :return: Launches of all the pages, in order
+    :rtype: List[Launch]
+    :raises ValueError: If a raw page is not valid JSON
+    """
+    with nextinspace.timed("parse.launches"):
+        return [
+            Launch(name, location, date, description, type_, launchers.get(launcher_url), id=id_, stale=stale)
+            for page in map_pages(parse_launch_page, pages, workers)
+            for name, location, date, description, type_, launcher_url, id_, stale in page
+        ]
+
+
+def parse_event_pages(pages: Iterable[Page], workers: Optional[int] = None) -> List[Event]:
+    """Same as :func:`parse_launch_pages` but for pages of event results"""
+    with nextinspace.timed("parse.events"):
+        return [
+            Event(name, location, date, description, type_, id=id_, stale=stale)
+            for page in map_pages(parse_event_page, pages, workers)
+            for name, location, date, description, type_, id_, stale in page
+        ]
+
+
+def map_pages(function: Callable[[Page], ParsedT], pages: Iterable[Page], workers: Optional[int]) -> List[ParsedT]:
+    """Apply the function to each page in a pool of processes, or in this process if that is not worth it or possible"""
+    pages = list(pages)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    num_tasks = -(-len(pages) // PAGES_PER_TASK)
+    if min(workers, num_tasks) > 1:
+        try:
+            with ProcessPoolExecutor(min(workers, num_tasks)) as executor:
+                return list(executor.map(function, pages, chunksize=PAGES_PER_TASK))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            # Processes cannot be started on this platform, or one of them died, so parse here instead
+            pass
+    return [function(page) for page in pages]
+
+
+def parse_launch_page(page: Page) -> List[LaunchFields]:
+    """Parse the launches of a page into their fields, with the URL of their launcher in place of the launcher"""
+    fields = []
+    for result in page_results(page, "/launch"):
+        launch = nextinspace.parse_launch(result)
+        launcher_url = nextinspace.get_nested_dict_val(result, "rocket", "configuration", "url")
+        fields.append(
+            (
+                launch.name,
+                launch.location,
+                launch.date,
+                launch.description,
+                launch.type_,
+                launcher_url,
+                launch.id,
+                launch.stale,
+            )
+        )
+    return fields
+
+
+def parse_event_page(page: Page) -> List[EventFields]:
+    events = (nextinspace.parse_event(result) for result in page_results(page, "/event"))
+    return [
+        (event.name, event.location, event.date, event.description, event.type_, event.id, event.stale)
+        for event in events
+    ]
+
+
+def page_results(page: Page, path: str) -> List[Dict[str, Any]]:
+    """Get the results of a page, decoding it if it is raw, with the schema of the endpoint at `path`"""
+    if isinstance(page, str):
+        page = page.encode()
+    if isinstance(page, bytes):
+        page = decode(page, path)
+    return page["results"] if isinstance(page, dict) else page
@@ -0,0 +1,239 @@
+"""On-disk cache for LL2 API responses"""
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Time to live (in seconds) of cached responses, matched against the path of the requested endpoint.
+# The first matching entry wins, so more specific paths must come first.
+DEFAULT_TTLS: Dict[str, float] = {
+    "/config/launcher": 3 * 24 * 60 * 60,
+    "/launch": 5 * 60,
+    "/event": 5 * 60,
+}
+DEFAULT_TTL: float = 5 * 60
+DEFAULT_DEADLINE: float = 2.0
+DEFAULT_MAX_ENTRIES = 1024  # Several times the launchers and queries in use at once
+DEFAULT_MAX_AGE: float = 30 * 24 * 60 * 60  # Well past the time to live of any response
+
+# Lower bounds on the dates of results that queries for upcoming items set to the current time, with the date field of
+# the results they bound. They are left out of cache keys so that these queries keep using the same cached response as
+# time goes by, and the results that fell below the bound since are dropped when the response is read instead. Queries
+# for a window of time also have an upper bound, and keep their lower bound in their key.
+MOVING_BOUNDS: Dict[str, str] = {"net__gte": "net"}
+
+# Names of the files the cache writes: responses named after the hash of their key, and the temporary files they are
+# written to first. Other files in the directory are left alone.
+ENTRY_NAME_PATTERN = re.compile(r"^[0-9a-f]{64}\.json$")
+TEMPORARY_NAME_PATTERN = re.compile(r"^tmp\w+\.tmp$")
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory, respecting `XDG_CACHE_HOME`"""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "nextinspace"
+
+
+class CacheEntry(NamedTuple):
+    """Cached API response along with the validators needed to revalidate it"""
+
+    data: Any
+    stored_at: float
+    etag: Optional[str]
+    last_modified: Optional[str]
+    # Whether results that went by were dropped from a response that had more, which the API is needed for
+    incomplete: bool = False
+
+
+class ResponseCache:
+    """Persistent cache of decoded API responses keyed by endpoint and query parameters.
+
+    :param directory: Directory to store cached responses in, defaults to :func:`default_cache_dir`
+    :type directory: Union[str, os.PathLike], optional
+    :param ttls: Time to live in seconds per endpoint path, defaults to `DEFAULT_TTLS`
+    :type ttls: Mapping[str, float], optional
+    :param refresh: Whether to ignore cached responses when reading (responses are still stored), defaults to False
+    :type refresh: bool, optional
+    :param max_stale: How long in seconds responses can still be used after their time to live ran out, when the API
+        fails or is too slow, defaults to 0
+    :type max_stale: float, optional
+    :param deadline: How long in seconds to wait for the API before using a stale response, defaults to `DEFAULT_DEADLINE`
+    :type deadline: float, optional
+    :param max_entries: Maximum number of responses kept, defaults to `DEFAULT_MAX_ENTRIES`
+    :type max_entries: int, optional
+    :param max_age: How long in seconds responses are kept, defaults to `DEFAULT_MAX_AGE`
+    :type max_age: float, optional
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+        ttls: Optional[Mapping[str, float]] = None,
+        refresh: bool = False,
+        max_stale: float = 0,
+        deadline: float = DEFAULT_DEADLINE,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age: float = DEFAULT_MAX_AGE,
+    ):
+        self.directory = Path(directory) if directory is not None else default_cache_dir()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.refresh = refresh
+        self.max_stale = max_stale
+        self.deadline = deadline
+        self.max_entries = max_entries
+        self.max_age = max_age
+
+    def ttl(self, endpoint: str) -> float:
+        """Get the time to live of responses from the specified endpoint"""
+        path = urlsplit(endpoint).path
+        for fragment, ttl in self.ttls.items():
+            if fragment in path:
+                return ttl
+        return DEFAULT_TTL
+
+    def is_fresh(self, endpoint: str, entry: CacheEntry) -> bool:
+        return not entry.incomplete and time.time() - entry.stored_at < self.ttl(endpoint)
+
+    def is_usable_stale(self, endpoint: str, entry: CacheEntry) -> bool:
+        """Whether an expired response can still be used if the API fails or is too slow"""
+        return time.time() - entry.stored_at < self.ttl(endpoint) + self.max_stale
+
+    def get(self, endpoint: str, payload: Mapping[str, Any]) -> Optional[CacheEntry]:
+        """Get the cached response for the request, or None if there is none (or it is unreadable). Responses that had
+        results dropped (see `MOVING_BOUNDS`) and more to give are never fresh, so they are only used as a fallback."""
+        if self.refresh:
+            return None
+        try:
+            with open(self._path(endpoint, payload), "r") as f:
+                entry = CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        bounds = moving_bounds(query_params(endpoint, payload))
+        if not bounds:
+            return entry
+        data = drop_results_before(entry.data, bounds)
+        return entry._replace(data=data, incomplete=has_dropped_results(entry.data, data))
+
+    def put(
+        self,
+        endpoint: str,
+        payload: Mapping[str, Any],
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store a response, making room for it if it is a new one. Failing to write to the cache is not an error."""
+        entry = CacheEntry(data, time.time(), etag, last_modified)
+        path = self._path(endpoint, payload)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not path.exists()
+            # Write to a temporary file first so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix="tmp", suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry._asdict(), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        if is_new:
+            self.prune()
+
+    def touch(self, endpoint: str, payload: Mapping[str, Any], entry: CacheEntry) -> None:
+        """Mark a cached response as fresh again after the server confirmed it is unchanged"""
+        self.put(endpoint, payload, entry.data, entry.etag, entry.last_modified)
+
+    def prune(self) -> None:
+        """Remove the responses stored more than `max_age` seconds ago, then the oldest ones beyond `max_entries`"""
+        stored = []
+        try:
+            with os.scandir(self.directory) as files:
+                for file in files:
+                    if ENTRY_NAME_PATTERN.match(file.name):
+                        with contextlib.suppress(OSError):
+                            stored.append((file.stat().st_mtime, file.path))
+        except OSError:
+            return
+        stored.sort(reverse=True)
+        oldest_kept = time.time() - self.max_age
+        for index, (stored_at, path) in enumerate(stored):
+            if index >= self.max_entries or stored_at < oldest_kept:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+    def clear(self) -> None:
+        """Remove all cached responses, along with temporary files left by interrupted writes"""
+        try:
+            with os.scandir(self.directory) as files:
+                paths = [
+                    file.path
+                    for file in files
+                    if ENTRY_NAME_PATTERN.match(file.name) or TEMPORARY_NAME_PATTERN.match(file.name)
+                ]
+        except OSError:
+            return
+        for path in paths:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+
+    @staticmethod
+    def revalidation_headers(entry: Optional[CacheEntry]) -> Dict[str, str]:
+        """Get the conditional request headers for revalidating a cached response"""
+        headers = {}
+        # Incomplete responses are not what the API would send again, so they cannot be revalidated
+        if entry is not None and not entry.incomplete:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _path(self, endpoint: str, payload: Mapping[str, Any]) -> Path:
+        params = query_params(endpoint, payload)
+        bounds = moving_bounds(params)
+        params = [(name, value) for name, value in params if name not in bounds]
+        key = urlunsplit(urlsplit(endpoint)._replace(query="")) + "?" + urlencode(sorted(params))
+        return self.directory / (hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+
+def query_params(endpoint: str, payload: Mapping[str, Any]) -> List[Tuple[str, str]]:
+    """Get the parameters of a request, from both its endpoint (as in `next` links) and its payload"""
+    return parse_qsl(urlsplit(endpoint).query) + [(name, str(value)) for name, value in payload.items()]
+
+
+def moving_bounds(params: List[Tuple[str, str]]) -> Dict[str, str]:
+    """Get the bounds of a request that are set to the current time (see `MOVING_BOUNDS`), keyed by parameter"""
+    names = {name for name, _ in params}
+    return {
+        name: value for name, value in params if name in MOVING_BOUNDS and name.replace("__gte", "__lte") not in names
+    }
+
+
+def drop_results_before(data: Any, bounds: Mapping[str, str]) -> Any:
+    """Copy a response without the results that fell below the moving bounds of its request"""
+    if not isinstance(data, dict) or not isinstance(data.get("results"), list):
+        return data
+    # LL2 dates are all formatted the same way, so they compare as strings
+    limits = [(MOVING_BOUNDS[name], value) for name, value in bounds.items()]
+    results = [
+        result
+        for result in data["results"]
+        if all(not isinstance(result.get(field), str) or result[field] >= value for field, value in limits)
+    ]
+    return {**data, "results": results}
+
+
+def has_dropped_results(data: Any, kept: Any) -> bool:
+    """Whether results were dropped from a response that had more than it returned, which would have taken their place"""
+    if data is kept or not isinstance(data, dict):
+        return False
+    num_results = len(data["results"])
+    if len(kept["results"]) == num_results:
+        return False
+    return data.get("next") is not None or data.get("count", 0) > num_results
@@ -1,16 +1,24 @@
 """Central logic and driver code for CLI"""
 
+import dataclasses
+import functools
 import sys
-
-import requests
+import time
 
 import nextinspace
-from nextinspace.cli import parser, viewer
+from nextinspace.cli import parser
+
+# Errors that are reported without a traceback, as (module, exception class). The modules are imported lazily, so an
+# error can only be one of these if its module was loaded.
+HANDLED_ERRORS = (("requests.exceptions", "RequestException"), ("sqlite3", "Error"))
 
 
 def run():
     args = parser.get_args()
 
+    # Imported after parsing, so that --help and --version do not pay for the terminal rendering dependencies
+    from nextinspace.cli import viewer
+
     if args.verbose:
         verbosity = viewer.Verbosity.verbose
     elif args.quiet:
@@ -19,18 +27,111 @@ def run():
         verbosity = viewer.Verbosity.normal
 
     include_launcher = verbosity == viewer.Verbosity.verbose
+    # Quiet output does not show descriptions, so lighter launches are enough. JSON output always has every field.
+    brief = verbosity == viewer.Verbosity.quiet and not (args.json or args.ndjson)
+    filters = get_filters(args)
+
+    if args.clear_cache:
+        from nextinspace.cache import ResponseCache
+
+        ResponseCache().clear()
+    if args.cache or args.refresh or args.max_stale:
+        nextinspace.enable_cache(refresh=args.refresh, max_stale=args.max_stale, deadline=args.deadline)
+    nextinspace.enable_rate_limit(args.rate_limit)
+    recorder = nextinspace.enable_instrumentation() if args.timings else None
+    start = time.perf_counter()
 
     try:
-        if args.events_only:
-            items = nextinspace.next_event(args.num_items)
-        elif args.launches_only:
-            items = nextinspace.next_launch(args.num_items, include_launcher)
+        if args.watch:
+            from nextinspace.cli import watch
+
+            watch.watch(
+                functools.partial(fetch_items, args, include_launcher, brief, filters), args, verbosity, args.rate_limit
+            )
+            return
+
+        if args.sync or args.offline:
+            items = get_stored_items(args, include_launcher)
+        else:
+            items = fetch_items(args, include_launcher, brief, filters)
+
+        stale_items = []
+        items = note_stale(items, stale_items)
+
+        # Items are displayed as they arrive, so errors can happen while displaying
+        if args.ndjson:
+            viewer.show_ndjson(items)
+        elif args.json:
+            viewer.show_json(items, args.compact)
         else:
-            items = nextinspace.nextinspace(args.num_items, include_launcher)
-    except requests.exceptions.RequestException as err:
+            viewer.display(items, verbosity)
+
+        if stale_items:
+            print("nextinspace: the API failed or was too slow, so some items may be out of date", file=sys.stderr)
+            # Requests that missed the deadline are still refreshing the cache, and would be stopped on exit
+            if args.refresh_wait:
+                nextinspace.wait_for_refreshes(args.refresh_wait)
+    except Exception as err:
+        if not is_handled_error(err):
+            raise
         sys.exit(f"nextinspace: {err}")
+    finally:
+        if recorder is not None:
+            show_timings(recorder, time.perf_counter() - start)
+
+
+def is_handled_error(err):
+    for module_name, class_name in HANDLED_ERRORS:
+        module = sys.modules.get(module_name)
+        if module is not None and isinstance(err, getattr(module, class_name)):
+            return True
+    return False
 
-    if args.json:
-        viewer.show_json(items)
+
+def show_timings(recorder, total):
+    from nextinspace.cli import viewer
+
+    summary = {
+        "total_ms": round(total * 1e3, 3),
+        **recorder.summary(),
+        "throttle": dataclasses.asdict(nextinspace.get_throttle().stats),
+    }
+    viewer.show_timings(summary)
+
+
+def note_stale(items, stale_items):
+    """Pass the items through, keeping track of the stale ones"""
+    for item in items:
+        if item.stale:
+            stale_items.append(item)
+        yield item
+
+
+def get_filters(args):
+    if not (args.provider or args.location_ids or args.rocket or args.type_):
+        return None
+    return nextinspace.Filters(args.provider, tuple(args.location_ids or ()), args.rocket, args.type_)
+
+
+def fetch_items(args, include_launcher, brief=False, filters=None, session=None):
+    if args.events_only:
+        return nextinspace.iter_events(args.num_items, session, filters)
+    elif args.launches_only:
+        return nextinspace.iter_launches(args.num_items, include_launcher, session, brief, filters)
     else:
-        viewer.display(items, verbosity)
+        return nextinspace.iter_upcoming(args.num_items, include_launcher, session, brief, filters)
+
+
+def get_stored_items(args, include_launcher):
+    from nextinspace.store import ScheduleStore
+
+    with ScheduleStore() as store:
+        if args.sync:
+            store.sync(include_launcher)
+
+        if args.events_only:
+            return store.next_event(args.num_items)
+        elif args.launches_only:
+            return store.next_launch(args.num_items, include_launcher)
+        else:
+            return store.nextinspace(args.num_items, include_launcher)
@@ -2,6 +2,13 @@
 
 import argparse
 
+from nextinspace import __version__
+
+# LL2 allows this many requests per hour without an API key
+DEFAULT_RATE_LIMIT = 15
+# Same as nextinspace.cache.DEFAULT_DEADLINE, which is not imported so that parsing arguments stays fast
+DEFAULT_DEADLINE = 2.0
+
 
 def get_args():
     parser = argparse.ArgumentParser(prog="nextinspace", description="Never miss a launch.")
@@ -32,6 +39,33 @@ def get_args():
         help="Only display orbital and suborbital launches. Generally these will be all orbital launches and suborbital launches which aim to reach “space” or the Karman line.",
     )
 
+    # Filters of the items. The API applies all but the type, which is checked as items arrive.
+    filter_options = parser.add_argument_group("filtering")
+    filter_options.add_argument(
+        "--provider",
+        metavar="NAME",
+        help="Only show launches by this launch service provider, like 'Rocket Lab Ltd'. Leaves out events.",
+    )
+    filter_options.add_argument(
+        "--location-id",
+        action="append",
+        type=positive_int,
+        dest="location_ids",
+        metavar="ID",
+        help="Only show launches from the location with this LL2 ID, like 11 for Vandenberg SFB. Can be repeated to allow several locations. Leaves out events.",
+    )
+    filter_options.add_argument(
+        "--rocket",
+        metavar="NAME",
+        help="Only show launches of this rocket configuration, like 'Electron'. Leaves out events.",
+    )
+    filter_options.add_argument(
+        "--type",
+        dest="type_",
+        metavar="TYPE",
+        help="Only show launches with this mission type and events of this type, like 'Communications' or 'Spacewalk'. Not case sensitive.",
+    )
+
     # Verbosity arguments group
     verbosity_options = parser.add_mutually_exclusive_group()
     verbosity_options.add_argument(
@@ -41,17 +75,113 @@ def get_args():
         "-q", "--quiet", action="store_true", help="Only display name, location, date, and type."
     )
 
-    # JSON output
-    parser.add_argument(
+    # JSON output. Obviously, only one format can be chosen.
+    json_options = parser.add_mutually_exclusive_group()
+    json_options.add_argument(
         "--json",
         action="store_true",
         help="Output data in JSON format. Note that '--quiet' has no effect when this flag is set.",
     )
+    json_options.add_argument(
+        "--ndjson",
+        "--json-lines",
+        action="store_true",
+        help="Output each item as a line of JSON as soon as it arrives. Note that '--quiet' has no effect when this flag is set.",
+    )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Output JSON without indentation when '--json' is set.",
+    )
+
+    # Response cache
+    cache_options = parser.add_argument_group("caching")
+    cache_options.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache API responses on disk and reuse them while they are fresh.",
+    )
+    cache_options.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Bypass cached responses and store fresh ones. Implies '--cache'.",
+    )
+    cache_options.add_argument(
+        "--max-stale",
+        type=non_negative_float,
+        default=0,
+        metavar="SECONDS",
+        help="When the API fails or is too slow, fall back to cached responses that expired up to this long ago. Items from those responses are marked as out of date. Implies '--cache'.",
+    )
+    cache_options.add_argument(
+        "--deadline",
+        type=non_negative_float,
+        default=DEFAULT_DEADLINE,
+        metavar="SECONDS",
+        help=f"How long to wait for the API before falling back to expired cached responses. Defaults to {DEFAULT_DEADLINE:g}.",
+    )
+    cache_options.add_argument(
+        "--refresh-wait",
+        type=non_negative_float,
+        default=0,
+        metavar="SECONDS",
+        help="After falling back to expired cached responses, wait up to this long before exiting for the API to refresh them. Defaults to 0, which leaves refreshing them to long-running processes like --watch.",
+    )
+    cache_options.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="Remove all cached responses before fetching.",
+    )
+
+    # Local schedule store. Obviously, syncing and staying offline are exclusive.
+    store_options = parser.add_argument_group("local store")
+    store_exclusive_options = store_options.add_mutually_exclusive_group()
+    store_exclusive_options.add_argument(
+        "--sync",
+        action="store_true",
+        help="Download what changed since the last sync into the local store, then display items from it.",
+    )
+    store_exclusive_options.add_argument(
+        "--offline",
+        action="store_true",
+        help="Display items from the local store without connecting to the API.",
+    )
+
+    # Client-side rate limit
+    parser.add_argument(
+        "--rate-limit",
+        type=positive_int,
+        default=DEFAULT_RATE_LIMIT,
+        metavar="REQUESTS",
+        help=f"Maximum number of API requests per hour. Requests over the limit wait instead of failing. Defaults to {DEFAULT_RATE_LIMIT}, the limit of the LL2 API without a key.",
+    )
+
+    # Watch mode
+    watch_options = parser.add_argument_group("watching")
+    watch_options.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and show items again when they are added, changed or removed. Polls more often as the next item gets closer. With '--json' or '--ndjson', each change is output as a line of JSON.",
+    )
+
+    # Instrumentation
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="When done, output to stderr as JSON how long each phase took (HTTP requests, JSON decoding, building items, rendering...) along with counts of HTTP requests and cache hits.",
+    )
 
     # Version argument
-    parser.add_argument("--version", action="version", version="%(prog)s v" + __import__("nextinspace").__version__)
+    parser.add_argument("--version", action="version", version="%(prog)s v" + __version__)
 
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.watch and (args.sync or args.offline):
+        parser.error("argument --watch: not allowed with argument --sync or --offline")
+    if (args.provider or args.location_ids or args.rocket or args.type_) and (args.sync or args.offline):
+        parser.error("filtering arguments are not allowed with argument --sync or --offline")
+    if (args.provider or args.location_ids or args.rocket) and args.events_only:
+        parser.error("argument -e/--events-only: not allowed with argument --provider, --location-id or --rocket")
+    return args
 
 
 def positive_int(x):
@@ -59,3 +189,10 @@ def positive_int(x):
     if i <= 0:
         raise ValueError()
     return i
+
+
+def non_negative_float(x):
+    f = float(x)
+    if f < 0:
+        raise ValueError()
+    return f
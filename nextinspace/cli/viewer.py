@@ -6,6 +6,7 @@ so to refactor properly would be to use a library like Rich. Eventually...
 """
 
 import json
+import sys
 import textwrap as t
 from datetime import MINYEAR, datetime, timezone
 from enum import Enum
@@ -25,178 +26,180 @@ class Verbosity(Enum):
     verbose = 3
 
 
+# Lines that do not depend on the displayed items
+TOP = "┌" + "─" * MAX_LINE_LENGTH + "┐\n"
+DIVIDER = "├" + "─" * MAX_LINE_LENGTH + "┤\n"
+BOTTOM = "└" + "─" * MAX_LINE_LENGTH + "┘\n"
+FILLER = "│" + " " * MAX_LINE_LENGTH + "│\n"
+CHART_TOP = "│" + ("┌" + "─" * CHART_WIDTH + "┐").center(MAX_LINE_LENGTH, " ") + "│\n"
+CHART_DIVIDER = "│" + ("├" + "─" * CHART_WIDTH + "┤").center(MAX_LINE_LENGTH, " ") + "│\n"
+CHART_BOTTOM = "│" + ("└" + "─" * CHART_WIDTH + "┘").center(MAX_LINE_LENGTH, " ") + "│\n"
+NULL_DATE = datetime(MINYEAR, 1, 1)
+COMPACT_SEPARATORS = (",", ":")
+
+
 # ---- Top-level display functions ----
 
 
 def display(items, verbosity):
-    if len(items) == 0:
+    """Display the items in a panel. Each item is rendered in full and written at once, as soon as it is available."""
+    items = iter(items)
+    first_item = next(items, None)
+    if first_item is None:
         return
 
-    show_top()
-
     init()  # For compatibility with Windows terminals
-    display_item(items[0], verbosity)
-    for item in items[1:]:
-        show_divider()
-        display_item(item, verbosity)
+    out = sys.stdout
+    with nextinspace.timed("render"):
+        chunk = TOP + render_item(first_item, verbosity)
+    out.write(chunk)
+    for item in items:
+        with nextinspace.timed("render"):
+            chunk = DIVIDER + render_item(item, verbosity)
+        out.write(chunk)
+    out.write(BOTTOM)
     deinit()  # For compatibility with Windows terminals
 
-    show_bottom()
-
 
-def display_item(item, verbosity):
+def render_item(item, verbosity):
     if type(item) is nextinspace.Event:
-        display_event(item, verbosity)
-    else:
-        display_launch(item, verbosity)
-
-
-def show_top():
-    print("┌" + "─" * MAX_LINE_LENGTH + "┐")
+        return "".join(render_event(item, verbosity))
+    return "".join(render_launch(item, verbosity))
 
 
-def show_divider():
-    print("├" + "─" * MAX_LINE_LENGTH + "┤")
+# ---- Launch and Event render functions ----
 
 
-def show_bottom():
-    print("└" + "─" * MAX_LINE_LENGTH + "┘")
-
-
-# ---- Launch and Event display functions ----
-
-
-def display_event(event, verbosity):
-    show_name(event.name)
-    show_location(event.location)
-    show_filler()
-    show_date(event.date)
-    show_type(event, event.type_)
+def render_event(event, verbosity):
+    lines = [
+        *name_lines(event.name),
+        *location_lines(event.location),
+        FILLER,
+        date_line(event.date, event.stale),
+        type_line(event, event.type_),
+    ]
 
     # If verbosity is not set to quiet, show description
     if verbosity != Verbosity.quiet:
-        show_filler()
-        show_description(event.description)
+        lines.append(FILLER)
+        lines.extend(description_lines(event.description))
+    return lines
 
 
-def display_launch(launch, verbosity):
-    show_name(launch.name)
-    show_location(launch.location)
-    show_filler()
-    show_date(launch.date)
-    show_type(launch, launch.type_)
+def render_launch(launch, verbosity):
+    lines = [
+        *name_lines(launch.name),
+        *location_lines(launch.location),
+        FILLER,
+        date_line(launch.date, launch.stale),
+        type_line(launch, launch.type_),
+    ]
 
-    # If verbosity is not set to quiet, print mission description
+    # If verbosity is not set to quiet, show mission description
     if verbosity != Verbosity.quiet:
-        # If verbosity is set to verbose, print rocket information
+        # If verbosity is set to verbose, show rocket information
         if verbosity == Verbosity.verbose:
-            show_filler()
-            display_launcher(launch.launcher)
+            lines.append(FILLER)
+            lines.extend(launcher_lines(launch.launcher))
 
-        show_filler()
-        show_description(launch.description)
+        lines.append(FILLER)
+        lines.extend(description_lines(launch.description))
+    return lines
 
 
-# ---- Launch and Event display helper functions ----
+# ---- Launch and Event render helper functions ----
 
 
-def show_name(name):
-    if name is not None:
-        mission_name_lines = t.wrap(name, width=MAX_LINE_LENGTH)
-        for line in mission_name_lines:
-            print("│" + Style.BRIGHT + Fore.CYAN + line.ljust(MAX_LINE_LENGTH, " ") + Style.RESET_ALL + "│")
-    else:
-        print("│" + Style.BRIGHT + Fore.CYAN + "Name Unavailable".ljust(MAX_LINE_LENGTH, " ") + Style.RESET_ALL + "│")
+def name_lines(name):
+    wrapped = wrap(name) if name is not None else ["Name Unavailable"]
+    return [
+        "│" + Style.BRIGHT + Fore.CYAN + line.ljust(MAX_LINE_LENGTH, " ") + Style.RESET_ALL + "│\n" for line in wrapped
+    ]
 
 
-def show_location(location):
-    if location is not None:
-        location_lines = t.wrap(location, width=MAX_LINE_LENGTH)
-        for line in location_lines:
-            print("│" + Fore.CYAN + line.ljust(MAX_LINE_LENGTH, " ") + Fore.RESET + "│")
-    else:
-        print("│" + Fore.CYAN + "Location Unavailable".ljust(MAX_LINE_LENGTH, " ") + Fore.RESET + "│")
+def location_lines(location):
+    wrapped = wrap(location) if location is not None else ["Location Unavailable"]
+    return ["│" + Fore.CYAN + line.ljust(MAX_LINE_LENGTH, " ") + Fore.RESET + "│\n" for line in wrapped]
 
 
-def show_date(date):
-    if date != datetime(MINYEAR, 1, 1):
-        print("│" + Fore.GREEN + ("    " + date.strftime(DATE_FMAT_STR)).ljust(MAX_LINE_LENGTH, " ") + Fore.RESET + "│")
-    else:
-        print("│" + Fore.GREEN + "    Date Unavailable".ljust(MAX_LINE_LENGTH, " ") + Fore.RESET + "│")
+def date_line(date, stale=False):
+    date_str = "    " + date.strftime(DATE_FMAT_STR) if date != NULL_DATE else "    Date Unavailable"
+    if stale:
+        date_str += " (cached, may be out of date)"
+    return "│" + Fore.GREEN + date_str.ljust(MAX_LINE_LENGTH, " ") + Fore.RESET + "│\n"
 
 
-def show_type(obj, type_):
+def type_line(obj, type_):
     if type_ is not None:
-        print("│" + ("    " + obj.__class__.__qualname__ + " Type: " + type_).ljust(MAX_LINE_LENGTH, " ") + "│")
+        type_str = "    " + obj.__class__.__qualname__ + " Type: " + type_
     else:
-        print("│" + ("    " + obj.__class__.__qualname__ + " Type Unavailable").ljust(MAX_LINE_LENGTH, " ") + "│")
+        type_str = "    " + obj.__class__.__qualname__ + " Type Unavailable"
+    return "│" + type_str.ljust(MAX_LINE_LENGTH, " ") + "│\n"
 
 
-def show_description(description):
-    if description is not None:
-        mission_description_lines = t.wrap(
-            description, width=MAX_LINE_LENGTH, initial_indent="    ", subsequent_indent="    "
-        )
-        for line in mission_description_lines:
-            print("│" + line.ljust(MAX_LINE_LENGTH, " ") + "│")
-    else:
-        print("│" + ("    Mission Description Unavailable").ljust(MAX_LINE_LENGTH, " ") + "│")
+def description_lines(description):
+    if description is None:
+        return ["│" + "    Mission Description Unavailable".ljust(MAX_LINE_LENGTH, " ") + "│\n"]
+    wrapped = wrap(description, indent="    ")
+    return ["│" + line.ljust(MAX_LINE_LENGTH, " ") + "│\n" for line in wrapped]
 
 
-def show_filler():
-    print("│" + " " * MAX_LINE_LENGTH + "│")
+def wrap(text, indent=""):
+    """Same as `textwrap.wrap()` with the same indent for all lines, but much faster for text that fits on one line"""
+    # textwrap leaves text alone unless it is too long, has whitespace other than spaces, or starts or ends with spaces
+    if text and len(indent) + len(text) <= MAX_LINE_LENGTH and text.isprintable() and text == text.strip(" "):
+        return [indent + text]
+    return t.wrap(text, width=MAX_LINE_LENGTH, initial_indent=indent, subsequent_indent=indent)
 
 
-# ---- Launcher display functions ----
+# ---- Launcher render functions ----
 
 
-def display_launcher(launcher):
-    print("│" + ("┌" + "─" * CHART_WIDTH + "┐").center(MAX_LINE_LENGTH, " ") + "│")
-    if launcher.name is not None:
-        print("│" + ("│" + launcher.name.center(CHART_WIDTH) + "│").center(MAX_LINE_LENGTH, " ") + "│")
-    else:
-        print("│" + ("│" + "Name Unavailable".center(CHART_WIDTH) + "│").center(MAX_LINE_LENGTH, " ") + "│")
-
-    show_chart_divider()
-    show_chart_line(
-        get_side("Height: ", launcher.height, " m"),
-        get_side("Mass to LEO: ", launcher.payload_leo, " kg"),
-    )
-    show_chart_divider()
-
-    show_chart_line(
-        get_side("Max Stages: ", launcher.max_stages),
-        get_side("Liftoff Thrust: ", launcher.liftoff_thrust, " kN"),
-    )
-    show_chart_divider()
-
-    show_chart_line(
-        get_side("Mass to GTO: ", launcher.payload_gto, " kg"),
-        get_side("Liftoff Mass: ", launcher.liftoff_mass, " Tonnes"),
-    )
-    show_chart_divider()
-
-    if launcher.maiden_flight_date != datetime(MINYEAR, 1, 1):
+def launcher_lines(launcher):
+    # Launchers are missing from stores that were synced without them
+    if launcher is None:
+        return ["│" + "    Launcher Unavailable".ljust(MAX_LINE_LENGTH, " ") + "│\n"]
+    name = launcher.name if launcher.name is not None else "Name Unavailable"
+    if launcher.maiden_flight_date != NULL_DATE:
         date_str = launcher.maiden_flight_date.strftime("%Y-%m-%d")
     else:
         date_str = "Unavailable"
-    show_chart_line(
-        get_side("Launch Successes: ", launcher.successful_launches),
-        "Maiden Flight: " + date_str,
-    )
-    show_chart_divider()
-
-    show_chart_line(
-        get_side("Consecutive Successes: ", launcher.consecutive_successful_launches),
-        get_side("Failed Launches: ", launcher.failed_launches),
-    )
-
-    print("│" + ("└" + "─" * CHART_WIDTH + "┘").center(MAX_LINE_LENGTH, " ") + "│")
 
-
-def show_chart_line(left, right):
+    return [
+        CHART_TOP,
+        "│" + ("│" + name.center(CHART_WIDTH) + "│").center(MAX_LINE_LENGTH, " ") + "│\n",
+        CHART_DIVIDER,
+        chart_line(
+            get_side("Height: ", launcher.height, " m"),
+            get_side("Mass to LEO: ", launcher.payload_leo, " kg"),
+        ),
+        CHART_DIVIDER,
+        chart_line(
+            get_side("Max Stages: ", launcher.max_stages),
+            get_side("Liftoff Thrust: ", launcher.liftoff_thrust, " kN"),
+        ),
+        CHART_DIVIDER,
+        chart_line(
+            get_side("Mass to GTO: ", launcher.payload_gto, " kg"),
+            get_side("Liftoff Mass: ", launcher.liftoff_mass, " Tonnes"),
+        ),
+        CHART_DIVIDER,
+        chart_line(
+            get_side("Launch Successes: ", launcher.successful_launches),
+            "Maiden Flight: " + date_str,
+        ),
+        CHART_DIVIDER,
+        chart_line(
+            get_side("Consecutive Successes: ", launcher.consecutive_successful_launches),
+            get_side("Failed Launches: ", launcher.failed_launches),
+        ),
+        CHART_BOTTOM,
+    ]
+
+
+def chart_line(left, right):
     row = left.center(CHART_WIDTH // 2, " ") + "│" + right.center(CHART_WIDTH // 2, " ")
-    print("│" + ("│" + row.center(CHART_WIDTH, " ") + "│").center(MAX_LINE_LENGTH, " ") + "│")
+    return "│" + ("│" + row.center(CHART_WIDTH, " ") + "│").center(MAX_LINE_LENGTH, " ") + "│\n"
 
 
 def get_side(pre, value, post=""):
@@ -207,22 +210,45 @@ def get_side(pre, value, post=""):
     return pre + "Unavailable"
 
 
-def show_chart_divider():
-    print("│" + ("├" + "─" * CHART_WIDTH + "┤").center(MAX_LINE_LENGTH, " ") + "│")
+# ---- JSON output ----
 
 
-# ---- JSON output ----
+def show_json(items_list, compact=False):
+    if not compact:
+        output_list = [dict_item(item) for item in items_list]
+        print(json.dumps(output_list, indent=4))
+        return
+
+    # Compact arrays are written an item at a time, so output starts as soon as the first item arrives
+    out = sys.stdout
+    separator = "["
+    for item in items_list:
+        out.write(separator + json.dumps(dict_item(item), separators=COMPACT_SEPARATORS))
+        separator = ","
+    out.write("[]\n" if separator == "[" else "]\n")
+
+
+def show_ndjson(items_list):
+    out = sys.stdout
+    for item in items_list:
+        out.write(json_line(dict_item(item)))
+        out.flush()
 
 
-def show_json(items_list):
-    output_list = [dict_item(item) for item in items_list]
-    print(json.dumps(output_list, indent=4))
+def json_line(dict_):
+    return json.dumps(dict_, separators=COMPACT_SEPARATORS) + "\n"
+
+
+def show_timings(summary):
+    print(json.dumps(summary, indent=4), file=sys.stderr)
 
 
 def dict_item(item):
-    if type(item) is nextinspace.Event:
-        return dict_event(item)
-    return dict_launch(item)
+    dict_ = dict_event(item) if type(item) is nextinspace.Event else dict_launch(item)
+    # Only present when true, so that the output is unchanged unless the cache was used as a fallback
+    if item.stale:
+        dict_["stale"] = True
+    return dict_
 
 
 def dict_launch(launch):
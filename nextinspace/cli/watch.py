@@ -0,0 +1,138 @@
+"""Watch mode: keep polling the API and show what changed between polls"""
+
+import sys
+import time
+from datetime import datetime
+
+import nextinspace
+from nextinspace.cli import viewer
+
+# (time until the next item, poll interval), both in seconds. Polls happen more often as the next item gets closer.
+POLL_SCHEDULE = (
+    (60 * 60, 60),
+    (6 * 60 * 60, 5 * 60),
+    (24 * 60 * 60, 15 * 60),
+    (7 * 24 * 60 * 60, 60 * 60),
+)
+MAX_POLL_INTERVAL = 6 * 60 * 60
+
+
+def watch(fetch, args, verbosity, rate_limit):
+    """Poll until interrupted, showing every item once and then only the items that were added, changed or removed.
+
+    `fetch` is called with the session to use and returns the items to watch. A single session is used for all polls,
+    so the connection to the API stays open between them. Polls are spaced so that no more than `rate_limit` requests
+    are made per hour.
+    """
+    session = nextinspace.new_session()
+    responses = count_responses(session)
+    previous = {}
+    errors = 0
+    try:
+        while True:
+            responses_before = len(responses)
+            try:
+                items = tuple(fetch(session))
+            except Exception as err:
+                if not is_request_error(err):
+                    raise
+                print(f"nextinspace: {err}", file=sys.stderr)
+                errors += 1
+                time.sleep(error_interval(err, errors))
+                continue
+
+            errors = 0
+            current = {item_key(item): item for item in items}
+            show_changes(diff_items(previous, current), args, verbosity)
+            previous = current
+
+            requests_made = len(responses) - responses_before
+            time.sleep(max(poll_interval(items, datetime.now().astimezone()), min_interval(requests_made, rate_limit)))
+    except KeyboardInterrupt:
+        pass
+
+
+def count_responses(session):
+    """Record every response the session receives, to know how many requests a poll used. Cached responses are not
+    requested, so they do not count against the rate limit."""
+    responses = []
+    session.hooks["response"].append(lambda response, *args, **kwargs: responses.append(response.status_code))
+    return responses
+
+
+def poll_interval(items, now):
+    """Get the time to wait before the next poll, which depends on how soon the next item is"""
+    # Items without a known date have a naive placeholder date, which cannot tell how soon they are
+    upcoming = [item.date for item in items if item.date.tzinfo is not None]
+    if not upcoming:
+        return MAX_POLL_INTERVAL
+
+    time_left = (min(upcoming) - now).total_seconds()
+    for threshold, interval in POLL_SCHEDULE:
+        if time_left <= threshold:
+            return interval
+    return MAX_POLL_INTERVAL
+
+
+def min_interval(requests_made, rate_limit):
+    """Get the shortest time to wait so that polls like the last one stay under the rate limit"""
+    return requests_made * 60 * 60 / rate_limit
+
+
+def error_interval(err, errors):
+    """Get the time to wait after a failed poll, honoring the server's Retry-After header and backing off otherwise"""
+    response = getattr(err, "response", None)
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return int(retry_after)
+    return min(POLL_SCHEDULE[0][1] * 2 ** (errors - 1), MAX_POLL_INTERVAL)
+
+
+def is_request_error(err):
+    requests_exceptions = sys.modules.get("requests.exceptions")
+    return requests_exceptions is not None and isinstance(err, requests_exceptions.RequestException)
+
+
+def item_key(item):
+    # Names are not unique (as with "Unknown Payload" launches), but ids are among items of the same kind. Only items
+    # built by hand lack an id.
+    return type(item).__name__, item.id if item.id is not None else item.name
+
+
+def diff_items(previous, current):
+    """Compare two polls, which map item keys to items.
+
+    :return: The added, changed and removed items, with the added and changed items in the order of `current`
+    :rtype: Tuple[List, List, List]
+    """
+    added = [item for key, item in current.items() if key not in previous]
+    changed = [item for key, item in current.items() if key in previous and previous[key] != item]
+    removed = [item for key, item in previous.items() if key not in current]
+    return added, changed, removed
+
+
+def show_changes(changes, args, verbosity):
+    added, changed, removed = changes
+    if args.json or args.ndjson:
+        # There is no single document to output while watching, so every change is a line of JSON
+        out = sys.stdout
+        for change, items in (("added", added), ("changed", changed), ("removed", removed)):
+            for item in items:
+                out.write(viewer.json_line({"change": change, **viewer.dict_item(item)}))
+        out.flush()
+        return
+
+    if not (added or changed or removed):
+        return
+
+    print(datetime.now().astimezone().strftime(viewer.DATE_FMAT_STR) + ": " + summarize(added, changed, removed))
+    viewer.display(added + changed, verbosity)
+    for item in removed:
+        print("Removed: " + item.name)
+    sys.stdout.flush()
+
+
+def summarize(added, changed, removed):
+    counts = ((len(added), "new"), (len(changed), "changed"), (len(removed), "removed"))
+    return ", ".join(f"{count} {description}" for count, description in counts if count)
@@ -0,0 +1,203 @@
+"""Decoding of API responses with the fastest JSON library available
+
+The backends are tried in the order of `BACKENDS`:
+
+- `msgspec` decodes the responses of the endpoints nextinspace uses with a schema of the fields it reads. The other
+  fields (images, agencies, programs...) are skipped instead of being built into Python objects.
+- `orjson` decodes everything, but faster than the standard library.
+- `json`, from the standard library, is always available.
+
+Install the `fast` extra (`pip install nextinspace[fast]`) to get the fast backends.
+"""
+
+import functools
+import re
+from typing import Any, List, Optional, Tuple, TypedDict, Union
+from urllib.parse import urlsplit
+
+BACKENDS = ("msgspec", "orjson", "json")
+
+# ---- Schemas of the fields that nextinspace reads ----
+# All fields are optional, so that a response missing some of them decodes the same as with the other backends.
+# Values that are not objects are Any, so that their types are not validated more strictly than by the other backends.
+
+
+class Named(TypedDict, total=False):
+    name: Any
+
+
+class Pad(TypedDict, total=False):
+    name: Any
+    location: Optional[Named]
+
+
+class Mission(TypedDict, total=False):
+    description: Any
+    type: Any
+
+
+class LauncherConfiguration(TypedDict, total=False):
+    url: Any
+
+
+class Rocket(TypedDict, total=False):
+    configuration: Optional[LauncherConfiguration]
+
+
+class LaunchResult(TypedDict, total=False):
+    id: Any
+    name: Any
+    net: Any
+    # In list mode, the pad and mission are strings, and the location and mission type are top level strings
+    pad: Union[Pad, str, None]
+    location: Any
+    mission: Union[Mission, str, None]
+    mission_type: Any
+    rocket: Optional[Rocket]
+
+
+class EventResult(TypedDict, total=False):
+    id: Any
+    name: Any
+    location: Any
+    date: Any
+    description: Any
+    type: Optional[Named]
+
+
+class LaunchPage(TypedDict, total=False):
+    count: Any
+    next: Any
+    previous: Any
+    results: List[LaunchResult]
+
+
+class EventPage(TypedDict, total=False):
+    count: Any
+    next: Any
+    previous: Any
+    results: List[EventResult]
+
+
+class LauncherResult(TypedDict, total=False):
+    id: Any
+    url: Any
+    full_name: Any
+    leo_capacity: Any
+    gto_capacity: Any
+    to_thrust: Any
+    launch_mass: Any
+    max_stage: Any
+    length: Any
+    successful_launches: Any
+    consecutive_successful_launches: Any
+    failed_launches: Any
+    maiden_flight: Any
+
+
+class LauncherPage(TypedDict, total=False):
+    count: Any
+    next: Any
+    previous: Any
+    results: List[LauncherResult]
+
+
+# Schema of the responses of each endpoint, as a pattern searched for in the path of the requested URL.
+# The first matching entry wins, so more specific patterns must come first.
+SCHEMAS: Tuple[Tuple[str, Any], ...] = (
+    (r"/config/launcher/\d+/?$", LauncherResult),
+    (r"/config/launcher/?$", LauncherPage),
+    (r"/launch", LaunchPage),
+    (r"/event", EventPage),
+)
+
+
+class JsonBackend:
+    name = "json"
+
+    def __init__(self) -> None:
+        import json
+
+        self.loads = json.loads
+
+    def decode(self, body: bytes, endpoint: str) -> Any:
+        return self.loads(body)
+
+
+class OrjsonBackend:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self.loads = orjson.loads
+
+    def decode(self, body: bytes, endpoint: str) -> Any:
+        return self.loads(body)
+
+
+class MsgspecBackend:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self.msgspec = msgspec
+        self.decoder = msgspec.json.Decoder()
+        self.schema_decoders = [(re.compile(pattern), msgspec.json.Decoder(schema)) for pattern, schema in SCHEMAS]
+
+    def decode(self, body: bytes, endpoint: str) -> Any:
+        path = urlsplit(endpoint).path
+        decoder = next((decoder for pattern, decoder in self.schema_decoders if pattern.search(path)), None)
+        try:
+            if decoder is not None:
+                try:
+                    return decoder.decode(body)
+                except self.msgspec.ValidationError:
+                    # Not shaped like usual, so keep all of it and let the parsing deal with it
+                    pass
+            return self.decoder.decode(body)
+        except self.msgspec.DecodeError as err:
+            # Same type of error as when decoding with the other backends
+            raise ValueError(str(err)) from err
+
+
+BACKEND_CLASSES = {"msgspec": MsgspecBackend, "orjson": OrjsonBackend, "json": JsonBackend}
+
+_backend_name: Optional[str] = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_backend(name: Optional[str] = None) -> Any:
+    """Get a decoding backend
+
+    :param name: Name of the backend, defaults to the first one of `BACKENDS` that is installed
+    :type name: str, optional
+    :raises ImportError: If the requested backend is not installed
+    """
+    if name is not None:
+        return BACKEND_CLASSES[name]()
+    for backend_name in BACKENDS[:-1]:
+        try:
+            return BACKEND_CLASSES[backend_name]()
+        except ImportError:
+            pass
+    return JsonBackend()
+
+
+def set_backend(name: Optional[str]) -> None:
+    """Choose the decoding backend, or None to go back to the first one of `BACKENDS` that is installed
+
+    :raises ImportError: If the requested backend is not installed
+    """
+    global _backend_name
+    get_backend(name)
+    _backend_name = name
+
+
+def decode(body: bytes, endpoint: str = "") -> Any:
+    """Decode the JSON body of a response from the specified endpoint with the chosen backend
+
+    :raises ValueError: If the body is not valid JSON
+    """
+    return get_backend(_backend_name).decode(body, endpoint)
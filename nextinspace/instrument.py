@@ -0,0 +1,70 @@
+"""Instrumentation of where the time goes when getting and displaying items"""
+
+import threading
+from collections import Counter
+from typing import Any, Dict, List
+
+# Phases that are timed, by name
+PHASES = {
+    "http.request": "Whole HTTP request, from sending it to having read the body",
+    "http.ttfb": "Time to first byte: from sending an HTTP request to having parsed the response headers. Includes "
+    "resolving the host and connecting when no pooled connection was available.",
+    "http.body": "Reading the body of an HTTP response",
+    "json.decode": "Decoding the JSON of an HTTP response",
+    "parse.launches": "Building Launches from API results",
+    "parse.events": "Building Events from API results",
+    "parse.launcher": "Building a Launcher from an API result",
+    "launchers": "Getting the launchers of a batch of launches, including their requests",
+    "merge": "Merging launches and events in order of date",
+    "render": "Rendering items for the terminal",
+}
+
+# Events that are counted, by name
+COUNTS = {
+    "http.requests": "HTTP requests sent, including retries",
+    "cache.hits": "Requests answered by a fresh cached response",
+    "cache.revalidated": "Requests answered by a cached response that the API confirmed was unchanged",
+    "cache.stale": "Requests answered by an expired cached response because the API failed or was too slow",
+    "registry.hits": "Launchers found in the launcher registry instead of being requested",
+}
+
+
+class Recorder:
+    """Collects timings and counts from every thread and asynchronous task.
+
+    Subclass and override :meth:`timing` and :meth:`count` to send the measurements elsewhere, like to a metrics
+    library. See `PHASES` and `COUNTS` for what is measured.
+    """
+
+    def __init__(self) -> None:
+        self.timings: Dict[str, List[float]] = {}
+        self.counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def timing(self, phase: str, seconds: float) -> None:
+        """Record how long a phase took"""
+        with self._lock:
+            self.timings.setdefault(phase, []).append(seconds)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Record that something happened `n` times"""
+        with self._lock:
+            self.counts[name] += n
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize the measurements, with durations in milliseconds
+
+        :return: JSON serializable summary, like `{"phases": {"http.request": {"calls": 2, "total_ms": 210.3,
+            "max_ms": 130.1}}, "counts": {"http.requests": 2}}`
+        :rtype: Dict[str, Any]
+        """
+        with self._lock:
+            phases = {
+                phase: {
+                    "calls": len(durations),
+                    "total_ms": round(sum(durations) * 1e3, 3),
+                    "max_ms": round(max(durations) * 1e3, 3),
+                }
+                for phase, durations in self.timings.items()
+            }
+            return {"phases": phases, "counts": dict(self.counts)}
@@ -0,0 +1,77 @@
+"""Process-wide registry of launchers, so that each one is requested from the API only once in a long while"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional, Tuple
+
+if TYPE_CHECKING:
+    from nextinspace import Launcher
+
+DEFAULT_MAX_SIZE = 512  # More launchers than upcoming launches ever use
+DEFAULT_TTL: float = 3 * 24 * 60 * 60  # Same as cached launcher responses (see nextinspace.cache.DEFAULT_TTLS)
+
+
+class LauncherRegistry:
+    """Launchers keyed by their API URL. When full, the least recently used launcher is dropped to make room.
+
+    Launcher configurations (names, capacities, maiden flights...) rarely change, but their launch counts do, so
+    launchers are dropped once they are `ttl` seconds old and requested again when next needed.
+
+    :param max_size: Maximum number of launchers kept, defaults to `DEFAULT_MAX_SIZE`
+    :type max_size: int, optional
+    :param ttl: Time to live of launchers in seconds, defaults to `DEFAULT_TTL`
+    :type ttl: float, optional
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl: float = DEFAULT_TTL) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._launchers: OrderedDict[str, Tuple[float, Launcher]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._launchers)
+
+    def get(self, url: str) -> Optional[Launcher]:
+        """Get the launcher at the URL, or None if it is not registered or too old"""
+        with self._lock:
+            return self._get(url, time.monotonic())
+
+    def get_many(self, urls: Iterable[str]) -> Dict[str, Launcher]:
+        """Get the registered launchers at the URLs, keyed by URL"""
+        now = time.monotonic()
+        with self._lock:
+            launchers = ((url, self._get(url, now)) for url in urls)
+            return {url: launcher for url, launcher in launchers if launcher is not None}
+
+    def put(self, url: str, launcher: Launcher) -> None:
+        self.update({url: launcher})
+
+    def update(self, launchers: Mapping[str, Launcher]) -> None:
+        """Register launchers keyed by URL, replacing those already registered at the same URLs"""
+        now = time.monotonic()
+        with self._lock:
+            for url, launcher in launchers.items():
+                self._launchers[url] = (now, launcher)
+                self._launchers.move_to_end(url)
+            while len(self._launchers) > self.max_size:
+                self._launchers.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._launchers.clear()
+
+    def _get(self, url: str, now: float) -> Optional[Launcher]:
+        entry = self._launchers.get(url)
+        if entry is None:
+            return None
+        registered_at, launcher = entry
+        if now - registered_at >= self.ttl:
+            del self._launchers[url]
+            return None
+        self._launchers.move_to_end(url)
+        return launcher
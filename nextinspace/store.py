@@ -0,0 +1,214 @@
+"""Local store of upcoming launches and events, indexed by date, for answering queries without the API"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple, Union
+
+import nextinspace
+from nextinspace import LL2_DATETIME_FORMAT, Event, Launch, Launcher
+
+if TYPE_CHECKING:
+    import requests
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    kind TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date TEXT,
+    launcher_url TEXT,
+    result TEXT NOT NULL,
+    PRIMARY KEY (kind, id)
+);
+CREATE INDEX IF NOT EXISTS items_by_date ON items (date, kind);
+CREATE TABLE IF NOT EXISTS launchers (
+    url TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS syncs (
+    kind TEXT PRIMARY KEY,
+    synced_at TEXT NOT NULL
+);
+"""
+
+# Dates are stored as LL2_DATETIME_FORMAT strings, which sort in chronological order.
+# Launches sort before events with the same date, like in nextinspace.merge_sorted_sequences.
+RANGE_QUERY = """
+SELECT items.kind, items.result, items.launcher_url, launchers.data
+FROM items LEFT JOIN launchers ON items.launcher_url = launchers.url
+WHERE items.date >= ? AND items.kind IN ({kinds})
+ORDER BY items.date, items.kind DESC
+LIMIT ?
+"""
+
+
+def default_store_path() -> Path:
+    """Get the default store location, respecting `XDG_DATA_HOME`"""
+    base = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(base) / "nextinspace" / "schedule.sqlite3"
+
+
+class ScheduleStore:
+    """SQLite file holding upcoming :class:`Launches <nextinspace.Launch>`, :class:`Events <nextinspace.Event>` and
+    their :class:`Launchers <nextinspace.Launcher>`.
+
+    The store is filled by :meth:`sync`, which only downloads what changed since the previous sync. Reading from it
+    does not use the API at all.
+
+    :param path: Location of the SQLite file, defaults to :func:`default_store_path`
+    :type path: Union[str, os.PathLike], optional
+    """
+
+    def __init__(self, path: Optional[Union[str, "os.PathLike[str]"]] = None):
+        self.path = Path(path) if path is not None else default_store_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(self.path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self) -> "ScheduleStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def sync(self, include_launcher: bool = False, session: Optional[requests.Session] = None) -> None:
+        """Download the upcoming items that changed since the last sync, and drop the items that are now in the past.
+
+        :param include_launcher: Whether to also download the launchers of the stored launches, defaults to False
+        :type include_launcher: bool, optional
+        :param session: Session to make API requests with, defaults to the shared session
+        :type session: requests.Session, optional
+        :raises requests.exceptions.RequestException: If there is a problem connecting to the API
+        """
+        now_str = utc_now_str()
+        launch_endpoint, launch_payload = nextinspace.launch_query(nextinspace.PAGE_SIZE)
+        event_endpoint, event_payload = nextinspace.event_query(nextinspace.PAGE_SIZE)
+
+        with self.connection:
+            self.connection.execute("DELETE FROM items WHERE date < ?", (now_str,))
+            self._sync_items("launch", launch_endpoint, launch_payload, now_str, session)
+            self._sync_items("event", event_endpoint, event_payload, now_str, session)
+            if include_launcher:
+                self._sync_launchers(session)
+
+    def nextinspace(self, num_items: int, include_launcher: bool = False) -> Tuple[Union[Launch, Event], ...]:
+        """Same as :func:`nextinspace.nextinspace` but answered from the store"""
+        return self._query(("launch", "event"), num_items, include_launcher)
+
+    def next_launch(self, num_launches: int, include_launcher: bool = False) -> Tuple[Launch, ...]:
+        """Same as :func:`nextinspace.next_launch` but answered from the store"""
+        return self._query(("launch",), num_launches, include_launcher)  # type: ignore[return-value]
+
+    def next_event(self, num_events: int) -> Tuple[Event, ...]:
+        """Same as :func:`nextinspace.next_event` but answered from the store"""
+        return self._query(("event",), num_events)
+
+    def _sync_items(
+        self, kind: str, endpoint: str, payload: Dict, now_str: str, session: Optional[requests.Session]
+    ) -> None:
+        row = self.connection.execute("SELECT synced_at FROM syncs WHERE kind = ?", (kind,)).fetchone()
+        if row is not None:
+            payload = {**payload, "last_updated__gte": row[0]}
+
+        stale = False
+        for results in nextinspace.iter_pages(endpoint, payload, session=session):
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO items (kind, id, date, launcher_url, result) VALUES (?, ?, ?, ?, ?)",
+                [item_row(kind, result) for result in results],
+            )
+            stale = stale or any(nextinspace.STALE_KEY in result for result in results)
+        # Stale results may be missing changes, so the next sync must download them again
+        if not stale:
+            self.connection.execute("INSERT OR REPLACE INTO syncs (kind, synced_at) VALUES (?, ?)", (kind, now_str))
+
+    def _sync_launchers(self, session: Optional[requests.Session]) -> None:
+        rows = self.connection.execute(
+            "SELECT DISTINCT launcher_url FROM items "
+            "WHERE launcher_url IS NOT NULL AND launcher_url NOT IN (SELECT url FROM launchers)"
+        )
+        urls = [url for (url,) in rows]
+        if not urls:
+            return
+
+        # Launchers are requested in bulk like in nextinspace.get_launchers, but their results are stored as they are
+        launchers = get_bulk_launcher_results(urls, session) if len(urls) > 1 else {}
+        missing_urls = [url for url in urls if url not in launchers]
+        if missing_urls:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(nextinspace.MAX_LAUNCHER_WORKERS, len(missing_urls))) as executor:
+                launchers.update(
+                    zip(
+                        missing_urls,
+                        executor.map(lambda url: nextinspace.api_get_request(url, session=session), missing_urls),
+                    )
+                )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO launchers (url, data) VALUES (?, ?)",
+            [(url, json.dumps(data)) for url, data in launchers.items()],
+        )
+
+    def _query(
+        self, kinds: Tuple[str, ...], num_items: int, include_launcher: bool = False
+    ) -> Tuple[Union[Launch, Event], ...]:
+        query = RANGE_QUERY.format(kinds=", ".join("?" * len(kinds)))
+        rows = self.connection.execute(query, (utc_now_str(), *kinds, num_items))
+        return tuple(parse_rows(rows, include_launcher))
+
+
+def item_row(kind: str, result: Dict) -> Tuple[str, str, Optional[str], Optional[str], str]:
+    if kind == "launch":
+        date = result["net"]
+        launcher_url = nextinspace.get_nested_dict_val(result, "rocket", "configuration", "url")
+    else:
+        date = result["date"]
+        launcher_url = None
+    return kind, str(result["id"]), date, launcher_url, json.dumps(result)
+
+
+def get_bulk_launcher_results(urls: List[str], session: Optional[requests.Session]) -> Dict[str, Dict]:
+    """Get the API results of the launchers at the URLs from the launcher list endpoint, keyed by URL. Launchers that
+    the API did not return are left out."""
+    import requests
+
+    results = {}
+    for endpoint, payload, urls_by_id in nextinspace.bulk_launcher_queries(urls):
+        try:
+            data = nextinspace.api_get_request(endpoint, payload, session)
+        except requests.exceptions.HTTPError:
+            # The API did not accept the query, so the launchers are left to be requested one by one
+            continue
+        results.update(
+            (urls_by_id[result["id"]], result) for result in data["results"] if result.get("id") in urls_by_id
+        )
+    return results
+
+
+def parse_rows(
+    rows: Iterable[Tuple[str, str, Optional[str], Optional[str]]], include_launcher: bool
+) -> List[Union[Launch, Event]]:
+    # Launches with the same launcher share the same Launcher instance
+    launchers: Dict[str, Launcher] = {}
+    items: List[Union[Launch, Event]] = []
+    for kind, result_json, launcher_url, launcher_json in rows:
+        result = json.loads(result_json)
+        if kind == "event":
+            items.append(nextinspace.parse_event(result))
+            continue
+
+        if include_launcher and launcher_url is not None and launcher_json is not None:
+            if launcher_url not in launchers:
+                launchers[launcher_url] = nextinspace.parse_launcher(json.loads(launcher_json))
+        items.append(nextinspace.parse_launch(result, launchers))
+    return items
+
+
+def utc_now_str() -> str:
+    return datetime.utcnow().strftime(LL2_DATETIME_FORMAT)
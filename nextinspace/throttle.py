@@ -0,0 +1,179 @@
+"""Client-side rate limiting and retrying of API requests"""
+
+import dataclasses
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})  # Responses that are worth retrying
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # Wait before the first retry, in seconds, doubled for every following retry
+MAX_RETRY_WAIT = 60.0  # Longest wait for a retry, in seconds. The API asking for a longer wait is reported as an error.
+
+
+class TokenBucket:
+    """Token bucket that can be shared between threads and asynchronous tasks.
+
+    Tokens are taken by reserving them, which never blocks: the bucket can go into debt, and callers wait for however
+    long :meth:`reserve` tells them to. Waiting is up to the caller, so the same bucket works with `time.sleep` and
+    `asyncio.sleep`, and callers are served in the order they made their reservations.
+
+    :param rate: Number of tokens added to the bucket per second
+    :type rate: float
+    :param capacity: Maximum number of tokens in the bucket, which is how many can be taken at once without waiting
+    :type capacity: float
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens from the bucket
+
+        :return: Number of seconds to wait before the tokens can be used
+        :rtype: float
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+
+@dataclass(slots=True)
+class ThrottleStats:
+    """Counters of how requests were slowed down"""
+
+    requests: int = 0  # Requests made, including retries
+    throttled: int = 0  # Requests that waited for the rate limit
+    throttled_seconds: float = 0.0  # Total time spent waiting for the rate limit
+    retries: int = 0  # Requests that were retried
+    retry_seconds: float = 0.0  # Total time spent waiting to retry
+
+
+class Throttle:
+    """Rate limit and retry policy for API requests, shared by every request made through
+    :func:`nextinspace.api_get_request` and :func:`nextinspace.async_api_get_request`.
+
+    :param requests_per_hour: Maximum average number of requests per hour, defaults to no limit
+    :type requests_per_hour: float, optional
+    :param burst: Number of requests that can be made at once before the limit applies, defaults to `requests_per_hour`
+    :type burst: int, optional
+    :param max_retries: Number of times a request that failed in a way worth retrying is retried, defaults to `MAX_RETRIES`
+    :type max_retries: int, optional
+    """
+
+    def __init__(
+        self, requests_per_hour: Optional[float] = None, burst: Optional[int] = None, max_retries: int = MAX_RETRIES
+    ):
+        self.bucket = None
+        if requests_per_hour is not None:
+            capacity = burst if burst is not None else max(1.0, requests_per_hour)
+            self.bucket = TokenBucket(requests_per_hour / (60 * 60), capacity)
+        self.max_retries = max_retries
+        self._stats = ThrottleStats()
+        self._paused_until = 0.0  # Monotonic time until which the API asked not to be sent requests
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> ThrottleStats:
+        """Snapshot of the counters"""
+        with self._lock:
+            return dataclasses.replace(self._stats)
+
+    def wait(self) -> None:
+        """Wait until a request can be made"""
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+
+    async def async_wait(self) -> None:
+        """Same as :meth:`wait` but asynchronous"""
+        import asyncio
+
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def backoff(self, attempt: int, retry_after: Optional[str] = None) -> bool:
+        """Wait before retrying a failed request, if it should be retried
+
+        :param attempt: Number of times the request was already retried
+        :type attempt: int
+        :param retry_after: Value of the response's `Retry-After` header, if any
+        :type retry_after: str, optional
+        :return: Whether the request should be retried
+        :rtype: bool
+        """
+        delay = self._retry_delay(attempt, retry_after)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    async def async_backoff(self, attempt: int, retry_after: Optional[str] = None) -> bool:
+        """Same as :meth:`backoff` but asynchronous"""
+        import asyncio
+
+        delay = self._retry_delay(attempt, retry_after)
+        if delay is None:
+            return False
+        await asyncio.sleep(delay)
+        return True
+
+    def _reserve(self) -> float:
+        delay = self.bucket.reserve() if self.bucket is not None else 0.0
+        with self._lock:
+            delay = max(delay, self._paused_until - time.monotonic())
+            self._stats.requests += 1
+            if delay > 0:
+                self._stats.throttled += 1
+                self._stats.throttled_seconds += delay
+        return max(delay, 0.0)
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[str]) -> Optional[float]:
+        if attempt >= self.max_retries:
+            return None
+
+        delay = parse_retry_after(retry_after) if retry_after else None
+        if delay is not None:
+            if delay > MAX_RETRY_WAIT:
+                return None
+            # The API wants to be left alone for a while, so the other requests made meanwhile have to wait too
+            with self._lock:
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        else:
+            # Exponential backoff with jitter, so that concurrent requests that failed together do not retry together
+            backoff = min(BACKOFF_BASE * 2**attempt, MAX_RETRY_WAIT)
+            delay = backoff / 2 + random.uniform(0, backoff / 2)
+
+        with self._lock:
+            self._stats.retries += 1
+            self._stats.retry_seconds += delay
+        return delay
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a `Retry-After` header, which is either a number of seconds or an HTTP date
+
+    :return: Number of seconds to wait, or None if the header is invalid
+    :rtype: Optional[float]
+    """
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
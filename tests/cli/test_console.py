@@ -0,0 +1,57 @@
+# type: ignore
+
+import sys
+import threading
+import time
+
+import pytest
+
+import nextinspace
+from nextinspace import BASE_URL
+from nextinspace.cli import console
+
+
+@pytest.fixture
+def run(monkeypatch, tmp_path):
+    """Run the CLI with the specified arguments, with a store and cache of its own"""
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    def run(*args):
+        monkeypatch.setattr(sys, "argv", ["nextinspace", *args])
+        console.run()
+
+    yield run
+    nextinspace.disable_rate_limit()
+    nextinspace.disable_cache()
+
+
+def test_offline_verbose_without_synced_launchers(run, capsys, upcoming_api):
+    run("--sync")
+    capsys.readouterr()
+
+    run("--offline", "--verbose", "--launches-only")
+
+    output = capsys.readouterr().out
+    assert "New Shepard | NS-13" in output
+    assert "Launcher Unavailable" in output
+
+
+def test_hung_api_does_not_hold_up_exit(run, monkeypatch, requests_mock, upcoming_api):
+    run("--cache", "--launches-only")
+    later = time.time() + 60 * 60
+    monkeypatch.setattr(time, "time", lambda: later)
+    respond = threading.Event()
+
+    def hung_response(request, context):
+        respond.wait(5)
+        return {"results": []}
+
+    requests_mock.get(f"{BASE_URL}/launch", json=hung_response)
+    start = time.perf_counter()
+    try:
+        run("--launches-only", "--max-stale", "86400", "--deadline", "0.05")
+        assert time.perf_counter() - start < 1
+    finally:
+        respond.set()
+        nextinspace.wait_for_refreshes(5)
@@ -1,8 +1,14 @@
 # type: ignore
 
+import dataclasses
+import json
+import textwrap
+from datetime import MINYEAR, datetime, timezone
+
 import pytest
 from pytest_lazy_fixtures import lf
 
+import nextinspace
 from nextinspace.cli import viewer
 
 
@@ -56,3 +62,100 @@ def test_dict_launch(launch, dict_):
 )
 def test_dict_item(item, dict_):
     assert viewer.dict_item(item) == dict_
+
+
+def test_dict_item_stale(example_event, example_event_dict):
+    stale_event = dataclasses.replace(example_event, stale=True)
+
+    assert viewer.dict_item(stale_event) == {**example_event_dict, "stale": True}
+
+
+def test_render_stale(example_event):
+    stale_event = dataclasses.replace(example_event, stale=True)
+
+    assert "(cached, may be out of date)" in viewer.render_item(stale_event, viewer.Verbosity.normal)
+    assert "(cached, may be out of date)" not in viewer.render_item(example_event, viewer.Verbosity.normal)
+
+
+@pytest.fixture
+def display_items():
+    launcher = nextinspace.Launcher(
+        "New Shepard", 0, 0, 490, 75, 1, 15.0, 12, 12, 0, datetime(2015, 4, 29, tzinfo=timezone.utc)
+    )
+    unknown_launcher = nextinspace.Launcher(
+        None, None, None, None, None, None, None, None, None, None, datetime(MINYEAR, 1, 1)
+    )
+    return [
+        nextinspace.Event(
+            "2017 NASA Astronaut class graduation ceremony",
+            "NASA's Johnson Space Center, Houston, TX, USA",
+            datetime(2020, 1, 10, 15, 30, tzinfo=timezone.utc),
+            "NASA will honor the first class of astronaut... " * 5,
+            "Press Event",
+        ),
+        nextinspace.Launch(
+            "New Shepard | NS-13 " * 6,
+            "West Texas Suborbital Launch Site/ Corn Ranch, Corn Ranch, USA",
+            datetime(2020, 9, 24, 15, 0, tzinfo=timezone.utc),
+            "This will be the 13th New Shepard mission...",
+            "Suborbital",
+            launcher,
+        ),
+        nextinspace.Launch(None, None, datetime(MINYEAR, 1, 1), None, None, unknown_launcher),
+        nextinspace.Event(None, "Somewhere " * 12, datetime(MINYEAR, 1, 1), None, None),
+    ]
+
+
+@pytest.mark.parametrize("verbosity", list(viewer.Verbosity))
+def test_display(capsys, display_items, verbosity):
+    with open(f"tests/data/display_{verbosity.name}.txt", "r", encoding="utf-8") as f:
+        expected = f.read()
+
+    viewer.display(iter(display_items), verbosity)
+
+    assert capsys.readouterr().out == expected
+
+
+def test_display_nothing(capsys):
+    viewer.display([], viewer.Verbosity.normal)
+
+    assert capsys.readouterr().out == ""
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "New Shepard | NS-13",
+        "Two  spaces",
+        " Leading space",
+        "Trailing space ",
+        "Tab\tand\nnewline",
+        "",
+        "   ",
+        "x" * 88,
+        "x" * 85,
+        "word " * 30,
+    ],
+)
+@pytest.mark.parametrize("indent", ["", "    "])
+def test_wrap(text, indent):
+    expected = textwrap.wrap(text, width=viewer.MAX_LINE_LENGTH, initial_indent=indent, subsequent_indent=indent)
+
+    assert viewer.wrap(text, indent) == expected
+
+
+@pytest.mark.parametrize("num_items", [0, 1, 2])
+def test_show_json_compact(capsys, example_event, example_launch_verbose, num_items):
+    items = [example_event, example_launch_verbose][:num_items]
+
+    viewer.show_json(iter(items), compact=True)
+
+    expected = json.dumps([viewer.dict_item(item) for item in items], separators=(",", ":"))
+    assert capsys.readouterr().out == expected + "\n"
+
+
+def test_show_ndjson(capsys, example_event, example_event_dict, example_launch_verbose, example_launch_verbose_dict):
+    viewer.show_ndjson(iter([example_event, example_launch_verbose]))
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [example_event_dict, example_launch_verbose_dict]
@@ -0,0 +1,131 @@
+# type: ignore
+
+import dataclasses
+import json
+from argparse import Namespace
+from datetime import MINYEAR, datetime, timedelta, timezone
+
+import pytest
+import requests
+
+from nextinspace.cli import viewer, watch
+
+NOW = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "time_left, interval",
+    [
+        (timedelta(minutes=-5), 60),
+        (timedelta(minutes=30), 60),
+        (timedelta(hours=3), 5 * 60),
+        (timedelta(hours=12), 15 * 60),
+        (timedelta(days=3), 60 * 60),
+        (timedelta(days=30), watch.MAX_POLL_INTERVAL),
+    ],
+)
+def test_poll_interval(example_event, time_left, interval):
+    later_event = dataclasses.replace(example_event, date=NOW + time_left + timedelta(days=1))
+    soonest_event = dataclasses.replace(example_event, date=NOW + time_left)
+
+    assert watch.poll_interval([later_event, soonest_event], NOW) == interval
+
+
+def test_poll_interval_without_items():
+    assert watch.poll_interval([], NOW) == watch.MAX_POLL_INTERVAL
+
+
+def test_min_interval():
+    # 2 requests per poll at 15 requests per hour allows a poll every 8 minutes
+    assert watch.min_interval(2, 15) == 8 * 60
+    assert watch.min_interval(0, 15) == 0
+
+
+def test_error_interval_uses_retry_after():
+    response = requests.Response()
+    response.headers["Retry-After"] = "120"
+    err = requests.exceptions.HTTPError(response=response)
+
+    assert watch.error_interval(err, 1) == 120
+
+
+def test_error_interval_backs_off():
+    err = requests.exceptions.ConnectionError()
+
+    assert [watch.error_interval(err, errors) for errors in (1, 2, 3)] == [60, 120, 240]
+    assert watch.error_interval(err, 100) == watch.MAX_POLL_INTERVAL
+
+
+def test_diff_items(example_event, example_launch_normal):
+    moved_launch = dataclasses.replace(example_launch_normal, date=example_launch_normal.date + timedelta(days=1))
+    new_event = dataclasses.replace(example_event, name="New event")
+    previous = {watch.item_key(item): item for item in (example_event, example_launch_normal)}
+    current = {watch.item_key(item): item for item in (moved_launch, new_event)}
+
+    assert watch.diff_items(previous, current) == ([new_event], [moved_launch], [example_event])
+    assert watch.diff_items(current, current) == ([], [], [])
+
+
+def test_items_with_the_same_name_are_told_apart(example_launch_normal):
+    first = dataclasses.replace(example_launch_normal, name="Long March 2D | Unknown Payload", id="first")
+    second = dataclasses.replace(first, id="second")
+    slipped = dataclasses.replace(second, date=second.date + timedelta(days=1))
+    previous = {watch.item_key(item): item for item in (first, second)}
+    current = {watch.item_key(item): item for item in (first, slipped)}
+
+    assert list(previous.values()) == [first, second]
+    assert watch.diff_items(previous, current) == ([], [slipped], [])
+
+
+def test_watch_outputs_changes(monkeypatch, capsys, example_event, example_launch_normal):
+    moved_launch = dataclasses.replace(example_launch_normal, date=example_launch_normal.date + timedelta(days=1))
+    polls = iter([(example_event, example_launch_normal), (moved_launch,)])
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+    args = Namespace(json=False, ndjson=True)
+
+    watch.watch(lambda session: next(polls), args, viewer.Verbosity.normal, rate_limit=15)
+
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(line["change"], line["name"]) for line in lines] == [
+        ("added", example_event.name),
+        ("added", example_launch_normal.name),
+        ("changed", moved_launch.name),
+        ("removed", example_event.name),
+    ]
+    # The example items are in the past, so polls are as frequent as possible
+    assert sleeps == [60, 60]
+
+
+def test_watch_keeps_going_after_request_errors(monkeypatch, capsys, example_event):
+    def fetch(session):
+        if not sleeps:
+            raise requests.exceptions.ConnectionError("API is down")
+        return (example_event,)
+
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch.time, "sleep", sleep)
+
+    watch.watch(fetch, Namespace(json=False, ndjson=True), viewer.Verbosity.normal, rate_limit=15)
+
+    captured = capsys.readouterr()
+    assert captured.err == "nextinspace: API is down\n"
+    assert json.loads(captured.out)["name"] == example_event.name
+
+
+def test_poll_interval_ignores_unknown_dates(example_event):
+    unknown_date_event = dataclasses.replace(example_event, date=datetime(MINYEAR, 1, 1))
+
+    assert watch.poll_interval([unknown_date_event], NOW) == watch.MAX_POLL_INTERVAL
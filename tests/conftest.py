@@ -1,10 +1,20 @@
 """Pytest fixtures"""
 
+import json
 from datetime import datetime
 
 import pytest
 
 import nextinspace
+from nextinspace import BASE_URL
+
+LAUNCHER_URL = "https://ll.thespacedevs.com/2.0.0/config/launcher/137/"
+
+
+@pytest.fixture(autouse=True)
+def launcher_registry():
+    """Start each test with an empty launcher registry, so that launchers are requested as the test expects"""
+    return nextinspace.enable_launcher_registry()
 
 
 @pytest.fixture
@@ -12,6 +22,11 @@ def example_launch_text():
     return open("tests/data/launch.json", "r").read()
 
 
+@pytest.fixture
+def example_launch_list_text():
+    return open("tests/data/launch_list.json", "r").read()
+
+
 @pytest.fixture
 def example_launcher_text():
     return open("tests/data/launcher.json", "r").read()
@@ -46,6 +61,18 @@ def example_launch_normal():
     )
 
 
+@pytest.fixture
+def example_launch_brief():
+    return nextinspace.Launch(
+        name="New Shepard | NS-13",
+        location="West Texas Suborbital Launch Site/ Corn Ranch, Corn Ranch, USA",
+        description=None,
+        date=nextinspace.date_str_to_datetime("2020-09-24T15:00:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+        type_="Suborbital",
+        launcher=None,
+    )
+
+
 @pytest.fixture
 def example_event():
     return nextinspace.Event(
@@ -91,6 +118,11 @@ def list_2():
     return [DateHolder(size * 2) for size in range(1, 8)]
 
 
+@pytest.fixture
+def list_3():
+    return [DateHolder(size * 3) for size in range(1, 4)]
+
+
 @pytest.fixture
 def example_event_dict():
     return {
@@ -156,3 +188,20 @@ def example_launch_verbose_dict():
             "maiden_flight_date": "2015-04-29",
         },
     }
+
+
+@pytest.fixture
+def upcoming_api(requests_mock, example_launch_text, example_event_text, example_launcher_text):
+    """Mock API with one upcoming launch and one upcoming event, the event being first"""
+    launch_page = json.loads(example_launch_text)
+    launch_page["next"] = None
+    launch_page["results"][0]["net"] = "2999-09-24T15:00:00Z"
+    event_page = json.loads(example_event_text)
+    event_page["next"] = None
+    event_page["results"][0]["date"] = "2999-01-10T15:30:00Z"
+
+    return {
+        "launch": requests_mock.get(f"{BASE_URL}/launch", json=launch_page),
+        "event": requests_mock.get(f"{BASE_URL}/event/upcoming", json=event_page),
+        "launcher": requests_mock.get(LAUNCHER_URL, text=example_launcher_text),
+    }
@@ -0,0 +1,49 @@
+# type: ignore
+
+import json
+
+import pytest
+
+from nextinspace import bulk
+
+LAUNCHER_URL = "https://ll.thespacedevs.com/2.0.0/config/launcher/137/"
+
+
+@pytest.fixture
+def launch_pages(example_launch_text):
+    """More raw pages than are parsed in a single task"""
+    return [example_launch_text.encode()] * (bulk.PAGES_PER_TASK * 2 + 1)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_launch_pages(launch_pages, workers, example_launch_normal, example_launch_verbose, example_launcher):
+    assert bulk.parse_launch_pages(launch_pages, workers=workers) == [example_launch_normal] * len(launch_pages)
+
+    launches = bulk.parse_launch_pages(launch_pages, {LAUNCHER_URL: example_launcher}, workers)
+    assert launches == [example_launch_verbose] * len(launch_pages)
+    assert launches[0].launcher is launches[-1].launcher
+    assert launches[-1].id == json.loads(launch_pages[-1])["results"][0]["id"]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_parse_event_pages(example_event_text, example_event, workers):
+    page = json.loads(example_event_text)
+    pages = [example_event_text, page, page["results"]] * bulk.PAGES_PER_TASK
+
+    events = bulk.parse_event_pages(pages, workers)
+    assert events == [example_event] * len(pages)
+    assert events[-1].id == page["results"][0]["id"]
+
+
+def test_sequential_fallback(monkeypatch, launch_pages, example_launch_normal):
+    def no_processes(*args, **kwargs):
+        raise NotImplementedError
+
+    monkeypatch.setattr(bulk, "ProcessPoolExecutor", no_processes)
+
+    assert bulk.parse_launch_pages(launch_pages, workers=4) == [example_launch_normal] * len(launch_pages)
+
+
+def test_invalid_page():
+    with pytest.raises(ValueError):
+        bulk.parse_event_pages([b"{"], workers=1)
@@ -0,0 +1,292 @@
+# type: ignore
+
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import requests
+
+import nextinspace
+from nextinspace import BASE_URL
+from nextinspace.cache import ResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield nextinspace.enable_cache(tmp_path)
+    nextinspace.disable_cache()
+
+
+def expire(cache, endpoint, payload, seconds_ago=None):
+    """Make a cached response expired, by default since forever"""
+    path = cache._path(endpoint, payload)
+    entry = json.loads(path.read_text())
+    entry["stored_at"] = 0 if seconds_ago is None else time.time() - cache.ttl(endpoint) - seconds_ago
+    path.write_text(json.dumps(entry))
+
+
+@pytest.mark.parametrize(
+    "endpoint, ttl",
+    [
+        ("https://ll.thespacedevs.com/2.0.0/config/launcher/137/", 3 * 24 * 60 * 60),
+        (f"{BASE_URL}/launch", 5 * 60),
+        (f"{BASE_URL}/event/upcoming", 5 * 60),
+    ],
+)
+def test_ttl(tmp_path, endpoint, ttl):
+    assert ResponseCache(tmp_path).ttl(endpoint) == ttl
+
+
+def test_fresh_response_is_reused(requests_mock, cache):
+    mock = requests_mock.get(f"{BASE_URL}/event/upcoming", json={"results": []})
+
+    first = nextinspace.api_get_request(f"{BASE_URL}/event/upcoming", {"limit": 1})
+    second = nextinspace.api_get_request(f"{BASE_URL}/event/upcoming", {"limit": 1})
+
+    assert first == second == {"results": []}
+    assert mock.call_count == 1
+
+
+def test_stale_response_is_revalidated(requests_mock, cache):
+    endpoint = f"{BASE_URL}/event/upcoming"
+    requests_mock.get(endpoint, json={"results": []}, headers={"ETag": '"v1"'})
+    nextinspace.api_get_request(endpoint, {"limit": 1})
+    expire(cache, endpoint, {"limit": 1})
+
+    mock = requests_mock.get(endpoint, status_code=304)
+    data = nextinspace.api_get_request(endpoint, {"limit": 1})
+
+    assert data == {"results": []}
+    assert mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert cache.is_fresh(endpoint, cache.get(endpoint, {"limit": 1}))
+
+
+def test_refresh_bypasses_cache(requests_mock, tmp_path):
+    endpoint = f"{BASE_URL}/event/upcoming"
+    ResponseCache(tmp_path).put(endpoint, {}, {"results": ["old"]})
+    requests_mock.get(endpoint, json={"results": ["new"]})
+
+    nextinspace.enable_cache(tmp_path, refresh=True)
+    try:
+        assert nextinspace.api_get_request(endpoint) == {"results": ["new"]}
+    finally:
+        nextinspace.disable_cache()
+    assert ResponseCache(tmp_path).get(endpoint, {}).data == {"results": ["new"]}
+
+
+def test_clear(tmp_path):
+    cache = ResponseCache(tmp_path / "cache")
+    cache.put(f"{BASE_URL}/launch", {"limit": 1}, {"results": []})
+    cache.clear()
+
+    assert cache.get(f"{BASE_URL}/launch", {"limit": 1}) is None
+
+
+def test_oldest_responses_are_removed_beyond_max_entries(tmp_path):
+    cache = ResponseCache(tmp_path, max_entries=2)
+    for limit in range(3):
+        cache.put(f"{BASE_URL}/event/upcoming", {"limit": limit}, {"results": []})
+        stored_at = time.time() - 60 + limit
+        os.utime(cache._path(f"{BASE_URL}/event/upcoming", {"limit": limit}), (stored_at, stored_at))
+    cache.put(f"{BASE_URL}/event/upcoming", {"limit": 3}, {"results": []})
+
+    kept = [limit for limit in range(4) if cache.get(f"{BASE_URL}/event/upcoming", {"limit": limit}) is not None]
+    assert kept == [2, 3]
+
+
+def test_responses_are_removed_after_max_age(tmp_path):
+    cache = ResponseCache(tmp_path, max_age=60)
+    cache.put(f"{BASE_URL}/event/upcoming", {"limit": 1}, {"results": []})
+    os.utime(cache._path(f"{BASE_URL}/event/upcoming", {"limit": 1}), (0, 0))
+    cache.put(f"{BASE_URL}/event/upcoming", {"limit": 2}, {"results": []})
+
+    assert cache.get(f"{BASE_URL}/event/upcoming", {"limit": 1}) is None
+    assert cache.get(f"{BASE_URL}/event/upcoming", {"limit": 2}) is not None
+
+
+def test_clear_leaves_other_files_alone(tmp_path):
+    cache = ResponseCache(tmp_path)
+    cache.put(f"{BASE_URL}/launch", {"limit": 1}, {"results": []})
+    (tmp_path / "tmpw1b2x9.tmp").write_text("{")
+    (tmp_path / "notes.json").write_text("{}")
+    (tmp_path / "photos").mkdir()
+
+    cache.clear()
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["notes.json", "photos"]
+
+
+@pytest.fixture
+def stale_cache(tmp_path):
+    endpoint = f"{BASE_URL}/event/upcoming"
+    cache = nextinspace.enable_cache(tmp_path, max_stale=60 * 60, deadline=0.05)
+    cache.put(endpoint, {"limit": 1}, {"results": [{"name": "old"}]})
+    expire(cache, endpoint, {"limit": 1}, seconds_ago=60)
+    yield cache
+    nextinspace.disable_cache()
+
+
+def test_stale_response_is_used_when_api_fails(requests_mock, stale_cache):
+    requests_mock.get(f"{BASE_URL}/event/upcoming", status_code=404)
+
+    data = nextinspace.api_get_request(f"{BASE_URL}/event/upcoming", {"limit": 1})
+
+    assert data == {"results": [{"name": "old", nextinspace.STALE_KEY: True}]}
+
+
+def test_stale_response_is_used_when_api_is_slow(requests_mock, stale_cache):
+    endpoint = f"{BASE_URL}/event/upcoming"
+    respond = threading.Event()
+
+    def slow_response(request, context):
+        respond.wait(5)
+        return {"results": [{"name": "new"}]}
+
+    requests_mock.get(endpoint, json=slow_response)
+
+    data = nextinspace.api_get_request(endpoint, {"limit": 1})
+    assert data["results"][0]["name"] == "old"
+
+    # The request keeps going in the background and refreshes the cache
+    assert not nextinspace.wait_for_refreshes(0.01)
+    respond.set()
+    assert nextinspace.wait_for_refreshes(5)
+    assert nextinspace.api_get_request(endpoint, {"limit": 1}) == {"results": [{"name": "new"}]}
+
+
+def test_timeouts_are_not_retried_when_falling_back(requests_mock, stale_cache):
+    # Without a response to fall back to, a hung API is still waited for, but only once
+    mock = requests_mock.get(f"{BASE_URL}/event/upcoming", exc=requests.exceptions.ReadTimeout)
+
+    with pytest.raises(requests.exceptions.Timeout):
+        nextinspace.api_get_request(f"{BASE_URL}/event/upcoming", {"limit": 2})
+    assert mock.call_count == 1
+
+
+def test_too_stale_response_is_not_used(requests_mock, stale_cache):
+    stale_cache.max_stale = 0
+    requests_mock.get(f"{BASE_URL}/event/upcoming", status_code=404)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        nextinspace.api_get_request(f"{BASE_URL}/event/upcoming", {"limit": 1})
+
+
+def test_items_from_stale_responses_are_marked(requests_mock, tmp_path, example_event_text, example_event):
+    endpoint, payload = nextinspace.event_query(1)
+    cache = nextinspace.enable_cache(tmp_path, max_stale=60 * 60)
+    try:
+        cache.put(endpoint, payload, json.loads(example_event_text))
+        expire(cache, endpoint, payload, seconds_ago=60)
+        requests_mock.get(endpoint, status_code=404)
+
+        (event,) = nextinspace.next_event(1)
+    finally:
+        nextinspace.disable_cache()
+
+    assert event.stale
+    assert event == example_event
+    assert repr(event).endswith(", stale=True)")
+
+
+def move_time_forward(monkeypatch, seconds):
+    """Make both the clock of the cache and the current time of queries move forward"""
+    now = time.time() + seconds
+
+    class datetime_later(datetime):
+        @classmethod
+        def utcnow(cls):
+            return datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None)
+
+    monkeypatch.setattr(time, "time", lambda: now)
+    monkeypatch.setattr(nextinspace, "datetime", datetime_later)
+
+
+@pytest.fixture
+def upcoming_launch_page(example_launch_text):
+    page = json.loads(example_launch_text)
+    page["next"] = None
+    page["results"][0]["net"] = "2999-01-01T00:00:00Z"
+    return page
+
+
+def test_launch_responses_are_reused_across_minutes(requests_mock, cache, monkeypatch, upcoming_launch_page):
+    mock = requests_mock.get(f"{BASE_URL}/launch", json=upcoming_launch_page)
+
+    first = nextinspace.next_launch(1)
+    move_time_forward(monkeypatch, 2 * 60)
+    second = nextinspace.next_launch(1)
+
+    assert first == second
+    assert mock.call_count == 1
+    assert len(list(cache.directory.iterdir())) == 1
+
+
+def test_past_launches_are_dropped_from_cached_responses(tmp_path):
+    endpoint = f"{BASE_URL}/launch"
+    cache = ResponseCache(tmp_path)
+    results = [{"net": "2020-01-01T00:00:00Z"}, {"net": "2020-01-02T00:00:00Z"}]
+    cache.put(endpoint, {"limit": 2, "net__gte": "2019-12-31T00:00:00Z"}, {"results": results})
+
+    entry = cache.get(endpoint, {"limit": 2, "net__gte": "2020-01-01T12:00:00Z"})
+
+    assert entry.data == {"results": [{"net": "2020-01-02T00:00:00Z"}]}
+
+
+def test_launches_that_went_by_are_replaced(requests_mock, cache, monkeypatch, upcoming_launch_page):
+    soon = datetime.now(timezone.utc) + timedelta(minutes=1)
+    upcoming_launch_page["results"][0].update(name="soon", net=soon.strftime(nextinspace.LL2_DATETIME_FORMAT))
+    upcoming_launch_page.update(count=2, next=f"{BASE_URL}/launch?limit=1&offset=1")
+    requests_mock.get(f"{BASE_URL}/launch", json=upcoming_launch_page, headers={"ETag": '"v1"'})
+    assert [launch.name for launch in nextinspace.next_launch(1)] == ["soon"]
+
+    later_page = json.loads(json.dumps(upcoming_launch_page))
+    later_page["results"][0]["name"] = "later"
+    later_page.update(count=1, next=None)
+    mock = requests_mock.get(f"{BASE_URL}/launch", json=later_page)
+    move_time_forward(monkeypatch, 3 * 60)
+
+    assert [launch.name for launch in nextinspace.next_launch(1)] == ["later"]
+    assert mock.call_count == 1
+    assert "If-None-Match" not in mock.last_request.headers
+
+
+def test_window_queries_keep_their_start_in_their_key(tmp_path):
+    endpoint = f"{BASE_URL}/launch"
+    cache = ResponseCache(tmp_path)
+    cache.put(endpoint, {"net__gte": "2020-01-01T00:00:00Z", "net__lte": "2020-02-01T00:00:00Z"}, {"results": []})
+
+    assert cache.get(endpoint, {"net__gte": "2020-01-15T00:00:00Z", "net__lte": "2020-02-01T00:00:00Z"}) is None
+
+
+def test_stale_launch_response_is_used_in_a_later_minute(requests_mock, tmp_path, monkeypatch, upcoming_launch_page):
+    nextinspace.enable_cache(tmp_path, max_stale=60 * 60, deadline=0.05)
+    try:
+        requests_mock.get(f"{BASE_URL}/launch", json=upcoming_launch_page)
+        (fresh,) = nextinspace.next_launch(1)
+        move_time_forward(monkeypatch, 10 * 60)
+        requests_mock.get(f"{BASE_URL}/launch", status_code=503)
+
+        (stale,) = nextinspace.next_launch(1)
+    finally:
+        nextinspace.disable_cache()
+
+    assert stale.stale
+    assert stale == fresh
+
+
+def test_window_responses_are_reused(requests_mock, cache, monkeypatch, example_event_text):
+    # Unlike queries for the next items, window queries do not depend on the current time
+    page = json.loads(example_event_text)
+    page["next"] = None
+    mock = requests_mock.get(f"{BASE_URL}/event", json=page)
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    first = nextinspace.events_between(start, start + timedelta(days=30))
+    monkeypatch.setattr(time, "time", lambda now=time.time(): now + 120)
+    second = nextinspace.events_between(start, start + timedelta(days=30))
+
+    assert first == second
+    assert mock.call_count == 1
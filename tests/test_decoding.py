@@ -0,0 +1,81 @@
+# type: ignore
+
+import pytest
+import requests
+
+import nextinspace
+from nextinspace import BASE_URL, decoding
+
+LAUNCHER_URL = "https://ll.thespacedevs.com/2.0.0/config/launcher/137/"
+
+
+@pytest.fixture(params=decoding.BACKENDS)
+def backend(request):
+    try:
+        decoding.set_backend(request.param)
+    except ImportError:
+        pytest.skip(f"{request.param} is not installed")
+    yield request.param
+    decoding.set_backend(None)
+
+
+def test_next_launch(
+    backend, requests_mock, example_launch_text, example_launcher_text, example_launch_verbose, example_launcher
+):
+    requests_mock.get(f"{BASE_URL}/launch", text=example_launch_text)
+    requests_mock.get(LAUNCHER_URL, text=example_launcher_text)
+
+    assert nextinspace.next_launch(1, include_launcher=True) == (example_launch_verbose,)
+
+
+def test_next_event(backend, requests_mock, example_event_text, example_event):
+    requests_mock.get(f"{BASE_URL}/event/upcoming", text=example_event_text)
+
+    assert nextinspace.next_event(1) == (example_event,)
+
+
+def test_invalid_json(backend):
+    with pytest.raises(ValueError):
+        decoding.decode(b'{"results": [', f"{BASE_URL}/launch")
+
+
+def test_invalid_json_response(backend, requests_mock):
+    requests_mock.get(f"{BASE_URL}/launch", text="<html>Bad gateway</html>")
+
+    with pytest.raises(requests.exceptions.RequestException):
+        nextinspace.api_get_request(f"{BASE_URL}/launch")
+
+
+def test_schema_skips_unused_fields(example_launch_text):
+    pytest.importorskip("msgspec")
+    backend = decoding.get_backend("msgspec")
+
+    result = backend.decode(example_launch_text.encode(), f"{BASE_URL}/launch?limit=1")["results"][0]
+
+    assert result.keys() == {"id", "name", "net", "pad", "mission", "rocket"}
+    assert result["rocket"] == {"configuration": {"url": LAUNCHER_URL}}
+
+
+def test_schema_mismatch_keeps_everything():
+    pytest.importorskip("msgspec")
+    backend = decoding.get_backend("msgspec")
+
+    assert backend.decode(b'{"results": 5, "other": 1}', f"{BASE_URL}/launch") == {"results": 5, "other": 1}
+
+
+def test_next_launch_brief(backend, requests_mock, example_launch_list_text, example_launch_brief):
+    requests_mock.get(f"{BASE_URL}/launch?mode=list", text=example_launch_list_text)
+
+    assert nextinspace.next_launch(1, brief=True) == (example_launch_brief,)
+
+
+def test_launcher_list_schema(example_launcher_text):
+    pytest.importorskip("msgspec")
+    backend = decoding.get_backend("msgspec")
+    body = f'{{"count": 1, "next": null, "results": [{example_launcher_text}]}}'.encode()
+
+    page = backend.decode(body, f"{BASE_URL}/config/launcher/?mode=detailed")
+    launcher = backend.decode(example_launcher_text.encode(), LAUNCHER_URL)
+
+    assert page["results"] == [launcher]
+    assert launcher["url"] == LAUNCHER_URL
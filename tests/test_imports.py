@@ -0,0 +1,29 @@
+# type: ignore
+
+import subprocess
+import sys
+
+import pytest
+
+# Modules that are slow to import and must only be loaded when they are needed
+HEAVY_MODULES = ("requests", "aiohttp", "asyncio", "concurrent.futures", "colorama", "sqlite3")
+
+
+def loaded_modules(code):
+    output = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return set(output.split())
+
+
+@pytest.mark.parametrize("module", ["nextinspace", "nextinspace.cli.console"])
+def test_import_does_not_load_heavy_modules(module):
+    assert loaded_modules(f"import {module}").isdisjoint(HEAVY_MODULES)
+
+
+def test_version_does_not_load_heavy_modules():
+    code = "import sys\nsys.argv = ['nextinspace', '--version']\ntry:\n    import nextinspace.__main__\nexcept SystemExit:\n    pass"
+    assert loaded_modules(code).isdisjoint(HEAVY_MODULES)
@@ -0,0 +1,71 @@
+# type: ignore
+
+import pytest
+
+import nextinspace
+from nextinspace import BASE_URL
+from nextinspace.instrument import COUNTS, PHASES, Recorder
+
+
+@pytest.fixture
+def recorder():
+    yield nextinspace.enable_instrumentation()
+    nextinspace.disable_instrumentation()
+
+
+def test_summary():
+    recorder = Recorder()
+    recorder.timing("http.request", 0.1)
+    recorder.timing("http.request", 0.3)
+    recorder.count("http.requests")
+    recorder.count("http.requests")
+
+    assert recorder.summary() == {
+        "phases": {"http.request": {"calls": 2, "total_ms": 400.0, "max_ms": 300.0}},
+        "counts": {"http.requests": 2},
+    }
+
+
+def test_next_launch_is_measured(requests_mock, recorder, example_launch_text, example_launcher_text):
+    requests_mock.get(f"{BASE_URL}/launch", text=example_launch_text)
+    requests_mock.get("https://ll.thespacedevs.com/2.0.0/config/launcher/137/", text=example_launcher_text)
+
+    nextinspace.next_launch(1, include_launcher=True)
+
+    summary = recorder.summary()
+    assert summary["counts"] == {"http.requests": 2}
+    assert summary["phases"].keys() == {
+        "http.request",
+        "http.ttfb",
+        "http.body",
+        "json.decode",
+        "launchers",
+        "parse.launcher",
+        "parse.launches",
+    }
+    assert summary["phases"]["http.request"]["calls"] == 2
+    assert summary["phases"].keys() <= PHASES.keys()
+
+
+def test_cache_hits_are_counted(requests_mock, recorder, tmp_path):
+    requests_mock.get(f"{BASE_URL}/event/upcoming", json={"results": []})
+    nextinspace.enable_cache(tmp_path)
+    try:
+        nextinspace.next_event(1)
+        nextinspace.next_event(1)
+    finally:
+        nextinspace.disable_cache()
+
+    assert recorder.summary()["counts"] == {"http.requests": 1, "cache.hits": 1}
+    assert recorder.summary()["counts"].keys() <= COUNTS.keys()
+
+
+def test_disable_instrumentation(requests_mock):
+    requests_mock.get(f"{BASE_URL}/event/upcoming", json={"results": []})
+    recorder = Recorder()
+    nextinspace.enable_instrumentation(recorder)
+    nextinspace.disable_instrumentation()
+
+    nextinspace.next_event(1)
+
+    assert recorder.summary() == {"phases": {}, "counts": {}}
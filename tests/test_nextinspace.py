@@ -1,9 +1,13 @@
 # type: ignore
 
+import asyncio
 import copy
+import json
+import time
 from datetime import MINYEAR, datetime, timedelta, timezone
 
 import pytest
+import requests
 from pytest_lazy_fixtures import lf
 
 import nextinspace
@@ -22,6 +26,23 @@ def test_eq(example):
     assert example == copy.copy(example)
 
 
+@pytest.mark.parametrize(
+    "example",
+    [
+        lf("example_event"),
+        lf("example_launcher"),
+        lf("example_launch_verbose"),
+    ],
+)
+def test_slots(example):
+    assert not hasattr(example, "__dict__")
+
+
+def test_repr(example_launch_normal):
+    assert repr(example_launch_normal).startswith("nextinspace.Launch('New Shepard | NS-13', ")
+    assert repr(example_launch_normal).endswith(", 'This will be the 13th New Shepard mission...', 'Suborbital', None)")
+
+
 @pytest.mark.parametrize(
     "target_length_merged_list, expected_result",
     [
@@ -67,6 +88,53 @@ def test_date_str_to_datetime(datetime_str, result):
     assert nextinspace.date_str_to_datetime(datetime_str, FORMAT_STRING) == result
 
 
+@pytest.fixture(params=["UTC", "America/New_York", "Australia/Lord_Howe", "Africa/Monrovia"])
+def local_tz(request, monkeypatch):
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    nextinspace.local_timezone.cache_clear()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+    nextinspace.local_timezone.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "datetime_str, fmat_str",
+    [
+        ("2020-09-24T15:00:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-03-14T06:59:59Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2021-03-14T07:00:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("1972-01-07T00:44:29Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("1972-01-07T00:44:30Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2015-04-29", "%Y-%m-%d"),
+        ("1957-10-04", "%Y-%m-%d"),
+        ("24/09/2020 15:00", "%d/%m/%Y %H:%M"),
+    ],
+)
+def test_date_str_to_datetime_matches_strptime(local_tz, datetime_str, fmat_str):
+    expected = datetime.strptime(datetime_str, fmat_str).replace(tzinfo=timezone.utc).astimezone()
+    result = nextinspace.date_str_to_datetime(datetime_str, fmat_str)
+
+    assert result == expected
+    assert result.utcoffset() == expected.utcoffset()
+    assert result.tzname() == expected.tzname()
+
+
+@pytest.mark.parametrize(
+    "datetime_str, fmat_str",
+    [
+        ("2020-09-24 15:00:00Z", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2020-09-24T15:00:00", "%Y-%m-%dT%H:%M:%SZ"),
+        ("2020-W39-4", "%Y-%m-%d"),
+        ("2020-13-01", "%Y-%m-%d"),
+    ],
+)
+def test_date_str_to_datetime_invalid(datetime_str, fmat_str):
+    with pytest.raises(ValueError):
+        nextinspace.date_str_to_datetime(datetime_str, fmat_str)
+
+
 @pytest.mark.parametrize(
     "launch, include_launcher",
     [
@@ -78,7 +146,7 @@ def test_next_launch(requests_mock, example_launch_text, launch, include_launche
     # Mock API
     now = datetime.utcnow()
     requests_mock.get(
-        f"{BASE_URL}/launch?limit=1&net__gte=" + now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        f"{BASE_URL}/launch?limit=1&net__gte=" + now.strftime("%Y-%m-%dT%H:%M:00Z"),
         text=example_launch_text,
     )
     # Make sure the request from the nested get_launcher call is intercepted
@@ -90,6 +158,34 @@ def test_next_launch(requests_mock, example_launch_text, launch, include_launche
     assert result_launch == launch
 
 
+def test_next_launch_brief(requests_mock, example_launch_list_text, example_launch_brief):
+    mock = requests_mock.get(f"{BASE_URL}/launch?limit=1&mode=list", text=example_launch_list_text)
+
+    assert nextinspace.next_launch(1, brief=True) == (example_launch_brief,)
+    assert mock.called_once
+
+
+def test_next_launch_brief_with_launcher(
+    requests_mock, example_launch_text, example_launcher_text, example_launch_verbose
+):
+    # Launches in list mode do not link to their launcher, so the full launches are requested
+    mock = requests_mock.get(f"{BASE_URL}/launch?limit=1", text=example_launch_text)
+    requests_mock.get("https://ll.thespacedevs.com/2.0.0/config/launcher/137/", text=example_launcher_text)
+
+    assert nextinspace.next_launch(1, include_launcher=True, brief=True) == (example_launch_verbose,)
+    assert "mode" not in mock.last_request.qs
+
+
+def test_iter_upcoming_brief(
+    requests_mock, example_launch_list_text, example_event_text, example_launch_brief, example_event
+):
+    requests_mock.get(f"{BASE_URL}/launch?limit=1&mode=list", text=example_launch_list_text)
+    requests_mock.get(f"{BASE_URL}/event/upcoming?limit=1", text=example_event_text)
+
+    assert list(nextinspace.iter_upcoming(1, brief=True)) == [example_event]
+    assert list(nextinspace.iter_launches(1, brief=True)) == [example_launch_brief]
+
+
 def test_get_launcher(requests_mock, example_launcher_text, example_launcher):
     # Mock API
     launcher_url = "https://ll.thespacedevs.com/2.0.0/config/launcher/137/"
@@ -117,7 +213,7 @@ def test_nextinspace(
     # Mock API (Launch)
     now = datetime.utcnow()
     requests_mock.get(
-        f"{BASE_URL}/launch?limit=2&net__gte=" + now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        f"{BASE_URL}/launch?limit=2&net__gte=" + now.strftime("%Y-%m-%dT%H:%M:00Z"),
         text=example_launch_text,
     )
     # Make sure the request from the nested get_launcher call is intercepted
@@ -129,3 +225,314 @@ def test_nextinspace(
     next = nextinspace.nextinspace(2)
 
     assert next == (example_event, example_launch_normal)
+
+
+def test_nextinspace_propagates_errors(requests_mock, example_launch_text):
+    # The launch query succeeds but the concurrent event query fails
+    requests_mock.get(f"{BASE_URL}/launch", text=example_launch_text)
+    requests_mock.get(f"{BASE_URL}/event/upcoming", status_code=404)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        nextinspace.nextinspace(2)
+
+
+def test_next_launch_shares_launchers(requests_mock, example_launch_text, example_launcher_text, example_launcher):
+    # Mock API with two launches that use the same launcher
+    data = json.loads(example_launch_text)
+    data["results"] *= 2
+    requests_mock.get(f"{BASE_URL}/launch", json=data)
+    launcher_mock = requests_mock.get(
+        "https://ll.thespacedevs.com/2.0.0/config/launcher/137/", text=example_launcher_text
+    )
+
+    launches = nextinspace.next_launch(2, include_launcher=True)
+
+    assert launcher_mock.call_count == 1
+    assert launches[0].launcher == example_launcher
+    assert launches[0].launcher is launches[1].launcher
+
+
+def test_new_session():
+    session = nextinspace.new_session(pool_size=3)
+
+    assert session.get_adapter(BASE_URL)._pool_maxsize == 3
+
+
+def test_next_launch_uses_session(requests_mock, example_launch_text, example_launcher_text):
+    launch_mock = requests_mock.get(f"{BASE_URL}/launch", text=example_launch_text)
+    launcher_mock = requests_mock.get(
+        "https://ll.thespacedevs.com/2.0.0/config/launcher/137/", text=example_launcher_text
+    )
+    session = nextinspace.new_session()
+    session.headers["X-Test"] = "custom"
+
+    nextinspace.next_launch(1, include_launcher=True, session=session)
+
+    assert launch_mock.last_request.headers["X-Test"] == "custom"
+    assert launcher_mock.last_request.headers["X-Test"] == "custom"
+
+
+@pytest.fixture
+def fake_async_responses(monkeypatch, example_launch_text, example_event_text, example_launcher_text):
+    responses = {
+        f"{BASE_URL}/launch": json.loads(example_launch_text),
+        f"{BASE_URL}/event/upcoming": json.loads(example_event_text),
+        "https://ll.thespacedevs.com/2.0.0/config/launcher/137/": json.loads(example_launcher_text),
+    }
+    requested = []
+
+    async def async_api_get_request(endpoint, payload={}, session=None):
+        requested.append(endpoint)
+        return responses[endpoint]
+
+    monkeypatch.setattr(nextinspace, "async_api_get_request", async_api_get_request)
+    return responses, requested
+
+
+def test_async_nextinspace(fake_async_responses, example_event, example_launch_verbose):
+    _, requested = fake_async_responses
+
+    result = asyncio.run(nextinspace.async_nextinspace(2, include_launcher=True, session=object()))
+
+    assert result == (example_event, example_launch_verbose)
+    assert len(requested) == 3
+
+
+def test_async_next_launch_shares_launchers(fake_async_responses, example_launcher):
+    responses, requested = fake_async_responses
+    responses[f"{BASE_URL}/launch"]["results"] *= 2
+
+    launches = asyncio.run(nextinspace.async_next_launch(2, include_launcher=True, session=object()))
+
+    assert requested.count("https://ll.thespacedevs.com/2.0.0/config/launcher/137/") == 1
+    assert launches[0].launcher == example_launcher
+    assert launches[0].launcher is launches[1].launcher
+
+
+def test_iter_launches_follows_pages(requests_mock, example_launch_text, example_launch_normal):
+    first_page = json.loads(example_launch_text)
+    first_page["next"] = f"{BASE_URL}/launch?limit=1&offset=1"
+    second_page = json.loads(example_launch_text)
+    second_page["next"] = None
+    requests_mock.get(f"{BASE_URL}/launch?limit=1&offset=1", json=second_page, complete_qs=True)
+    requests_mock.get(f"{BASE_URL}/launch?limit=100", json=first_page)
+
+    launches = list(nextinspace.iter_launches())
+
+    assert launches == [example_launch_normal, example_launch_normal]
+
+
+@pytest.fixture
+def two_launch_pages(example_launch_text):
+    """A full page of launches, linking to a second page of fifty launches"""
+    first_page = json.loads(example_launch_text)
+    first_page["results"] *= 100
+    first_page["next"] = f"{BASE_URL}/launch?limit=100&offset=100"
+    second_page = json.loads(example_launch_text)
+    second_page["results"] *= 50
+    second_page["next"] = None
+    return first_page, second_page
+
+
+def test_next_launch_beyond_a_page(requests_mock, two_launch_pages, example_launch_normal):
+    first_page, second_page = two_launch_pages
+    requests_mock.get(f"{BASE_URL}/launch?limit=100", json=first_page)
+    requests_mock.get(f"{BASE_URL}/launch?limit=100&offset=100", json=second_page, complete_qs=True)
+
+    assert nextinspace.next_launch(150) == (example_launch_normal,) * 150
+
+
+def test_async_next_launch_beyond_a_page(fake_async_responses, two_launch_pages, example_launch_normal):
+    responses, requested = fake_async_responses
+    responses[f"{BASE_URL}/launch"], responses[f"{BASE_URL}/launch?limit=100&offset=100"] = two_launch_pages
+
+    assert asyncio.run(nextinspace.async_next_launch(150, session=object())) == (example_launch_normal,) * 150
+    assert len(requested) == 2
+
+
+def test_iter_events_stops_at_num_events(requests_mock, example_event_text, example_event):
+    # The fixture links to a next page that is not mocked, so it must not be requested
+    mock = requests_mock.get(f"{BASE_URL}/event/upcoming?limit=1", text=example_event_text)
+
+    events = list(nextinspace.iter_events(1))
+
+    assert events == [example_event]
+    assert mock.call_count == 1
+
+
+def test_iter_upcoming(requests_mock, example_launch_text, example_event_text, example_event, example_launch_normal):
+    launch_page = json.loads(example_launch_text)
+    launch_page["next"] = None
+    event_page = json.loads(example_event_text)
+    event_page["next"] = None
+    requests_mock.get(f"{BASE_URL}/launch", json=launch_page)
+    requests_mock.get(f"{BASE_URL}/event/upcoming", json=event_page)
+
+    assert list(nextinspace.iter_upcoming(5)) == [example_event, example_launch_normal]
+
+
+def test_merge_sorted_iterables(list_1, list_2, list_3):
+    result = nextinspace.merge_sorted_iterables(list_1, list_2, list_3)
+
+    assert [holder.date.year for holder in result] == [1, 2, 2, 3, 3, 4, 4, 5, 6, 6, 6, 7, 8, 9, 10, 12, 14]
+
+
+def test_merge_sorted_iterables_tie_breaking(list_1, list_2):
+    # Items from later iterables come first when dates are equal
+    result = list(nextinspace.merge_sorted_iterables(list_1, list_2))
+
+    assert result[1] is list_2[0]
+    assert result[2] is list_1[1]
+
+
+def test_merge_sorted_iterables_is_lazy(list_1, list_2):
+    consumed = []
+
+    def stream(holders):
+        for holder in holders:
+            consumed.append(holder)
+            yield holder
+
+    result = list(nextinspace.merge_sorted_iterables(stream(list_1), stream(list_2), num_items=3))
+
+    assert [holder.date.year for holder in result] == [1, 2, 2]
+    assert len(consumed) == 4
+
+
+def test_next_launch_server_side_filters(requests_mock, example_launch_text, example_launch_normal):
+    mock = requests_mock.get(f"{BASE_URL}/launch", text=example_launch_text)
+    filters = nextinspace.Filters(provider="Blue Origin", location_ids=(29, 30), rocket="New Shepard")
+
+    assert nextinspace.next_launch(1, filters=filters) == (example_launch_normal,)
+    assert mock.call_count == 1
+    assert mock.last_request.qs["lsp__name"] == ["blue origin"]
+    assert mock.last_request.qs["location__ids"] == ["29,30"]
+    assert mock.last_request.qs["rocket__configuration__name"] == ["new shepard"]
+
+
+def test_next_launch_type_filter_follows_pages(requests_mock, example_launch_text, example_launch_normal):
+    # Only the second page has a matching launch
+    first_page = json.loads(example_launch_text)
+    first_page["results"][0]["mission"]["type"] = "Communications"
+    first_page["next"] = f"{BASE_URL}/launch?limit=100&offset=100"
+    second_page = json.loads(example_launch_text)
+    second_page["next"] = None
+    first_mock = requests_mock.get(f"{BASE_URL}/launch?limit=100", json=first_page)
+    requests_mock.get(f"{BASE_URL}/launch?limit=100&offset=100", json=second_page, complete_qs=True)
+
+    launches = nextinspace.next_launch(1, filters=nextinspace.Filters(type_="suborbital"))
+
+    assert launches == (example_launch_normal,)
+    assert first_mock.called_once
+
+
+def test_next_event_filters(requests_mock, example_event_text, example_event):
+    page = json.loads(example_event_text)
+    page["next"] = None
+    mock = requests_mock.get(f"{BASE_URL}/event/upcoming", json=page)
+
+    assert nextinspace.next_event(1, filters=nextinspace.Filters(type_="press event")) == (example_event,)
+    assert nextinspace.next_event(1, filters=nextinspace.Filters(type_="Spacewalk")) == ()
+    # Events have no provider, so they are left out without requesting them
+    assert nextinspace.next_event(1, filters=nextinspace.Filters(provider="Blue Origin")) == ()
+    assert mock.call_count == 2
+
+
+def test_filter_pages_stops_once_enough_results():
+    pages = iter([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+    assert list(nextinspace.filter_pages(pages, lambda n: n % 2 == 0, 2)) == [[2], [4]]
+    assert next(pages) == [7, 8, 9]
+
+
+def test_items_between(requests_mock, example_launch_text, example_event_text, example_launch_normal, example_event):
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 12, 31, 12, tzinfo=timezone(timedelta(hours=-5)))
+    launch_page = json.loads(example_launch_text)
+    launch_page["next"] = None
+    launch_mock = requests_mock.get(f"{BASE_URL}/launch", json=launch_page)
+    event_page = json.loads(example_event_text)
+    event_page["next"] = None
+    event_mock = requests_mock.get(f"{BASE_URL}/event", json=event_page)
+
+    assert nextinspace.items_between(start, end) == (example_event, example_launch_normal)
+    assert launch_mock.last_request.qs == {
+        "limit": ["100"],
+        "net__gte": ["2020-01-01t00:00:00z"],
+        "net__lte": ["2020-12-31t17:00:00z"],
+    }
+    assert event_mock.last_request.qs == {
+        "limit": ["100"],
+        "date__gte": ["2020-01-01t00:00:00z"],
+        "date__lte": ["2020-12-31t17:00:00z"],
+        "ordering": ["date"],
+    }
+
+
+def test_launches_between_follows_pages(requests_mock, example_launch_text, example_launch_normal):
+    first_page = json.loads(example_launch_text)
+    first_page["next"] = f"{BASE_URL}/launch?limit=100&offset=100"
+    second_page = json.loads(example_launch_text)
+    second_page["next"] = None
+    requests_mock.get(f"{BASE_URL}/launch?limit=100", json=first_page)
+    requests_mock.get(f"{BASE_URL}/launch?limit=100&offset=100", json=second_page, complete_qs=True)
+
+    launches = nextinspace.launches_between(datetime(2020, 9, 1), datetime(2020, 10, 1))
+
+    assert launches == (example_launch_normal, example_launch_normal)
+
+
+def test_window_ends_before_start():
+    with pytest.raises(ValueError):
+        nextinspace.events_between(datetime(2020, 10, 1), datetime(2020, 9, 1))
+
+
+LAUNCHER_LIST_URL = "https://ll.thespacedevs.com/2.0.0/config/launcher/"
+
+
+@pytest.fixture
+def two_launchers(example_launcher_text, example_launcher):
+    """Results and URLs of two launchers, the second one like the first with another id"""
+    first = json.loads(example_launcher_text)
+    second = {**first, "id": 138, "url": f"{LAUNCHER_LIST_URL}138/"}
+    return [first, second], [first["url"], second["url"]]
+
+
+def test_get_launchers_in_bulk(requests_mock, two_launchers, example_launcher):
+    results, urls = two_launchers
+    mock = requests_mock.get(f"{LAUNCHER_LIST_URL}?id__in=137,138&mode=detailed&limit=2", json={"results": results})
+
+    launchers = nextinspace.get_launchers(urls)
+
+    assert launchers == {urls[0]: example_launcher, urls[1]: example_launcher}
+    assert mock.call_count == 1
+    assert nextinspace.get_launcher_registry().get(urls[1]) == example_launcher
+
+
+def test_get_launchers_requests_what_bulk_missed(requests_mock, two_launchers, example_launcher):
+    results, urls = two_launchers
+    requests_mock.get(LAUNCHER_LIST_URL, json={"results": results[:1]})
+    mock = requests_mock.get(urls[1], json=results[1])
+
+    assert nextinspace.get_launchers(urls) == {urls[0]: example_launcher, urls[1]: example_launcher}
+    assert mock.call_count == 1
+
+
+def test_get_launchers_when_bulk_is_rejected(requests_mock, two_launchers, example_launcher):
+    results, urls = two_launchers
+    requests_mock.get(LAUNCHER_LIST_URL, status_code=400)
+    mocks = [requests_mock.get(url, json=result) for url, result in zip(urls, results)]
+
+    assert nextinspace.get_launchers(urls) == {urls[0]: example_launcher, urls[1]: example_launcher}
+    assert [mock.call_count for mock in mocks] == [1, 1]
+
+
+def test_async_get_launchers_in_bulk(fake_async_responses, two_launchers, example_launcher):
+    responses, requested = fake_async_responses
+    results, urls = two_launchers
+    responses[LAUNCHER_LIST_URL] = {"results": results}
+
+    launchers = asyncio.run(nextinspace.async_get_launchers(urls, session=object()))
+
+    assert launchers == {urls[0]: example_launcher, urls[1]: example_launcher}
+    assert requested == [LAUNCHER_LIST_URL]
@@ -0,0 +1,67 @@
+# type: ignore
+
+import json
+import time
+
+import nextinspace
+from nextinspace import BASE_URL
+from nextinspace.registry import LauncherRegistry
+
+LAUNCHER_URL = "https://ll.thespacedevs.com/2.0.0/config/launcher/137/"
+
+
+def test_least_recently_used_is_dropped(example_launcher):
+    registry = LauncherRegistry(max_size=2)
+    registry.put("a", example_launcher)
+    registry.put("b", example_launcher)
+    registry.get("a")
+    registry.put("c", example_launcher)
+
+    assert registry.get_many(["a", "b", "c"]).keys() == {"a", "c"}
+    assert len(registry) == 2
+
+
+def test_old_launchers_are_dropped(monkeypatch, example_launcher):
+    registry = LauncherRegistry(ttl=60)
+    registry.put("a", example_launcher)
+
+    assert registry.get("a") is example_launcher
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now + 60)
+    assert registry.get("a") is None
+    assert len(registry) == 0
+
+
+def test_launchers_are_requested_once(requests_mock, example_launcher_text, example_launcher):
+    mock = requests_mock.get(LAUNCHER_URL, text=example_launcher_text)
+
+    assert nextinspace.get_launcher(LAUNCHER_URL) == example_launcher
+    assert nextinspace.get_launcher(LAUNCHER_URL) == example_launcher
+    assert nextinspace.get_launchers([LAUNCHER_URL]) == {LAUNCHER_URL: example_launcher}
+    assert mock.call_count == 1
+
+
+def test_disabled_registry(requests_mock, example_launcher_text):
+    mock = requests_mock.get(LAUNCHER_URL, text=example_launcher_text)
+    nextinspace.disable_launcher_registry()
+
+    nextinspace.get_launcher(LAUNCHER_URL)
+    nextinspace.get_launcher(LAUNCHER_URL)
+
+    assert mock.call_count == 2
+    assert nextinspace.warm_launcher_registry() == 0
+
+
+def test_warm_launcher_registry(
+    requests_mock, example_launch_text, example_launcher_text, example_launch_verbose, launcher_registry
+):
+    page = {"count": 1, "next": None, "previous": None, "results": [json.loads(example_launcher_text)]}
+    list_mock = requests_mock.get(f"{BASE_URL}/config/launcher/?mode=detailed&active=true", json=page)
+    launcher_mock = requests_mock.get(LAUNCHER_URL, text=example_launcher_text)
+    requests_mock.get(f"{BASE_URL}/launch", text=example_launch_text)
+
+    assert nextinspace.warm_launcher_registry() == 1
+    assert nextinspace.next_launch(1, include_launcher=True) == (example_launch_verbose,)
+    assert len(launcher_registry) == 1
+    assert list_mock.called_once
+    assert not launcher_mock.called
@@ -0,0 +1,87 @@
+# type: ignore
+
+import json
+
+import pytest
+
+from nextinspace import BASE_URL
+from nextinspace.store import ScheduleStore
+
+LAUNCHER_LIST_URL = "https://ll.thespacedevs.com/2.0.0/config/launcher/"
+
+
+@pytest.fixture
+def store(tmp_path):
+    with ScheduleStore(tmp_path / "schedule.sqlite3") as store:
+        yield store
+
+
+def test_sync_and_query(store, upcoming_api, example_launcher):
+    store.sync(include_launcher=True)
+
+    items = store.nextinspace(5, include_launcher=True)
+
+    assert [item.name for item in items] == [
+        "2017 NASA Astronaut class graduation ceremony",
+        "New Shepard | NS-13",
+    ]
+    assert items[1].launcher == example_launcher
+    assert store.next_launch(5)[0].launcher is None
+    assert len(store.next_event(5)) == 1
+
+
+def test_sync_is_incremental(store, upcoming_api):
+    store.sync(include_launcher=True)
+    assert "last_updated__gte" not in upcoming_api["launch"].last_request.qs
+
+    store.sync(include_launcher=True)
+
+    assert "last_updated__gte" in upcoming_api["launch"].last_request.qs
+    assert "last_updated__gte" in upcoming_api["event"].last_request.qs
+    # Launchers that are already stored are not downloaded again
+    assert upcoming_api["launcher"].call_count == 1
+
+
+def test_launchers_are_synced_in_bulk(
+    store, requests_mock, upcoming_api, example_launch_text, example_launcher_text, example_launcher
+):
+    launch_page = json.loads(example_launch_text)
+    launch_page["next"] = None
+    first_launch = launch_page["results"][0]
+    first_launch["net"] = "2999-09-24T15:00:00Z"
+    second_launch = json.loads(json.dumps(first_launch))
+    second_launch.update(id="second", name="Second launch")
+    second_launch["rocket"]["configuration"]["url"] = f"{LAUNCHER_LIST_URL}138/"
+    launch_page["results"].append(second_launch)
+    requests_mock.get(f"{BASE_URL}/launch", json=launch_page)
+    launchers = [json.loads(example_launcher_text), {**json.loads(example_launcher_text), "id": 138}]
+    bulk = requests_mock.get(f"{LAUNCHER_LIST_URL}?id__in=137,138", json={"results": launchers})
+
+    store.sync(include_launcher=True)
+
+    assert [launch.launcher for launch in store.next_launch(5, include_launcher=True)] == [example_launcher] * 2
+    assert bulk.call_count == 1
+    assert upcoming_api["launcher"].call_count == 0
+
+
+def test_query_is_offline(tmp_path, upcoming_api, requests_mock):
+    with ScheduleStore(tmp_path / "schedule.sqlite3") as store:
+        store.sync()
+    num_requests = requests_mock.call_count
+
+    with ScheduleStore(tmp_path / "schedule.sqlite3") as store:
+        assert len(store.nextinspace(1)) == 1
+    assert requests_mock.call_count == num_requests
+
+
+def test_past_items_are_not_returned(store, requests_mock, example_launch_text, example_event_text):
+    launch_page = json.loads(example_launch_text)
+    launch_page["next"] = None
+    event_page = json.loads(example_event_text)
+    event_page["next"] = None
+    requests_mock.get(f"{BASE_URL}/launch", json=launch_page)
+    requests_mock.get(f"{BASE_URL}/event/upcoming", json=event_page)
+
+    store.sync()
+
+    assert store.nextinspace(5) == ()
@@ -0,0 +1,166 @@
+# type: ignore
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+import nextinspace
+from nextinspace import BASE_URL
+from nextinspace import throttle as throttle_module
+from nextinspace.throttle import Throttle, TokenBucket, parse_retry_after
+
+ENDPOINT = f"{BASE_URL}/event/upcoming"
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(throttle_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+@pytest.fixture
+def throttle(monkeypatch):
+    throttle = Throttle()
+    monkeypatch.setattr(nextinspace, "_throttle", throttle)
+    return throttle
+
+
+def test_token_bucket(monkeypatch):
+    monkeypatch.setattr(throttle_module.time, "monotonic", lambda: 100.0)
+    bucket = TokenBucket(rate=1, capacity=2)
+
+    assert [bucket.reserve() for _ in range(4)] == [0, 0, 1, 2]
+
+
+def test_token_bucket_refills(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(throttle_module.time, "monotonic", lambda: now[0])
+    bucket = TokenBucket(rate=1, capacity=2)
+    bucket.reserve(2)
+
+    now[0] += 10
+    # The bucket does not fill beyond its capacity
+    assert [bucket.reserve() for _ in range(3)] == [0, 0, 1]
+
+
+@pytest.mark.parametrize(
+    "value, seconds",
+    [
+        ("120", 120),
+        ("0", 0),
+        (format_datetime(datetime.now(timezone.utc) - timedelta(minutes=1), usegmt=True), 0),
+        ("soon", None),
+    ],
+)
+def test_parse_retry_after(value, seconds):
+    assert parse_retry_after(value) == seconds
+
+
+def test_parse_retry_after_date():
+    seconds = parse_retry_after(format_datetime(datetime.now(timezone.utc) + timedelta(minutes=1), usegmt=True))
+
+    assert 55 < seconds <= 60
+
+
+def test_transient_errors_are_retried(requests_mock, sleeps, throttle):
+    mock = requests_mock.get(ENDPOINT, [{"status_code": 503}, {"status_code": 502}, {"json": {"results": []}}])
+
+    assert nextinspace.api_get_request(ENDPOINT) == {"results": []}
+    assert mock.call_count == 3
+    # Backoff is exponential, with jitter
+    assert 0.25 <= sleeps[0] <= 0.5
+    assert 0.5 <= sleeps[1] <= 1
+    assert throttle.stats.retries == 2
+    assert throttle.stats.retry_seconds == pytest.approx(sum(sleeps))
+
+
+def test_connection_errors_are_retried(requests_mock, sleeps, throttle):
+    requests_mock.get(ENDPOINT, [{"exc": requests.exceptions.ConnectionError}, {"json": {"results": []}}])
+
+    assert nextinspace.api_get_request(ENDPOINT) == {"results": []}
+    assert len(sleeps) == 1
+
+
+def test_retry_after_is_honored(requests_mock, sleeps, throttle):
+    requests_mock.get(ENDPOINT, [{"status_code": 429, "headers": {"Retry-After": "7"}}, {"json": {"results": []}}])
+
+    nextinspace.api_get_request(ENDPOINT)
+
+    assert sleeps[0] == 7
+    # Other requests are held back until the API is ready too
+    assert 6 < throttle._reserve() <= 7
+
+
+def test_long_retry_after_is_an_error(requests_mock, sleeps, throttle):
+    mock = requests_mock.get(ENDPOINT, status_code=429, headers={"Retry-After": "3600"})
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        nextinspace.api_get_request(ENDPOINT)
+    assert mock.call_count == 1
+    assert sleeps == []
+
+
+def test_retries_give_up(requests_mock, sleeps, throttle):
+    mock = requests_mock.get(ENDPOINT, status_code=503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        nextinspace.api_get_request(ENDPOINT)
+    assert mock.call_count == throttle.max_retries + 1
+
+
+def test_client_errors_are_not_retried(requests_mock, sleeps, throttle):
+    mock = requests_mock.get(ENDPOINT, status_code=404)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        nextinspace.api_get_request(ENDPOINT)
+    assert mock.call_count == 1
+
+
+def test_rate_limit(requests_mock, sleeps):
+    requests_mock.get(ENDPOINT, json={"results": []})
+    throttle = nextinspace.enable_rate_limit(60 * 60, burst=1)
+    try:
+        nextinspace.api_get_request(ENDPOINT)
+        nextinspace.api_get_request(ENDPOINT)
+    finally:
+        nextinspace.disable_rate_limit()
+
+    assert len(sleeps) == 1
+    assert 0.9 < sleeps[0] <= 1
+    assert throttle.stats.requests == 2
+    assert throttle.stats.throttled == 1
+    assert throttle.stats.throttled_seconds == sleeps[0]
+
+
+def test_async_transient_errors_are_retried(monkeypatch, throttle):
+    web = pytest.importorskip("aiohttp.web")
+    statuses = [503, 200]
+
+    async def handler(request):
+        return web.json_response({"results": []}, status=statuses.pop(0))
+
+    async def no_sleep(delay):
+        pass
+
+    async def request_through_server():
+        app = web.Application()
+        app.router.add_get("/event/upcoming", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            with monkeypatch.context() as patch:
+                patch.setattr(asyncio, "sleep", no_sleep)
+                return await nextinspace.async_api_get_request(f"http://127.0.0.1:{port}/event/upcoming")
+        finally:
+            await runner.cleanup()
+
+    assert asyncio.run(request_through_server()) == {"results": []}
+    assert statuses == []
+    assert throttle.stats.retries == 1